@@ -4,10 +4,13 @@ Provides tools for computing value preferences, model comparisons,
 and tradeoff matrices with bootstrap confidence intervals.
 """
 
-from src.analysis.bootstrap import bootstrap_indices
+from src.analysis.bootstrap import BootstrapIndices, adaptive_bootstrap, bootstrap_indices, bootstrap_weights
+from src.analysis.bootstrap_store import BootstrapStore
+from src.analysis.poisson_bootstrap import PoissonBootstrap, poisson_weights
 from src.analysis.display_names import MODEL_DISPLAY_NAMES, get_display_name
 from src.analysis.loader import (
     load_all_decisions,
+    load_decision_tensor,
     load_human_decisions,
     load_llm_decisions,
     load_participant_registry,
@@ -27,10 +30,13 @@ from src.analysis.metrics import (
     refusal_rate,
     value_preference,
 )
+from src.analysis.tensor import DecisionTensor
+from src.analysis.matrices import agreement_matrix, preference_matrix, refusal_matrix
+from src.analysis.parallel import parallel_bootstrap
 from src.analysis.pluralism import build_kappa_input_table, value_tension_pairs
 from statsmodels.stats.inter_rater import fleiss_kappa
 from src.analysis.tradeoffs import value_weights
-from src.analysis.result_types import BootstrapResult, ValueWeightsResult
+from src.analysis.result_types import AnalyticResult, BootstrapResult, MetricMatrix, ValueWeightsResult
 from src.analysis.value_profiles import (
     bootstrap_mean_jsd,
     consensus_profile_from_subset,
@@ -45,9 +51,19 @@ __all__ = [
     "load_llm_decisions",
     "load_human_decisions",
     "load_all_decisions",
+    "load_decision_tensor",
     "load_participant_registry",
+    # Columnar decision data
+    "DecisionTensor",
     # Bootstrap utilities
     "bootstrap_indices",
+    "bootstrap_weights",
+    "BootstrapIndices",
+    "adaptive_bootstrap",
+    "BootstrapStore",
+    "PoissonBootstrap",
+    "poisson_weights",
+    "parallel_bootstrap",
     # Metrics
     "value_preference",
     "refusal_rate",
@@ -59,6 +75,10 @@ __all__ = [
     "case_entropy_correlation",
     "human_consensus",
     "value_weights",
+    # Metric matrices
+    "preference_matrix",
+    "refusal_matrix",
+    "agreement_matrix",
     # Constants
     "HUMAN_CONSENSUS",
     "MODEL_DISPLAY_NAMES",
@@ -68,10 +88,12 @@ __all__ = [
     "fleiss_kappa",
     "build_kappa_input_table",
     # Result types
+    "AnalyticResult",
     "BootstrapResult",
     "CaseEntropyCorrelation",
     "EntropyStatistics",
     "HumanCaseConsensus",
+    "MetricMatrix",
     "ValueWeightsResult",
     # Value profiles
     "softmax_profile",
@@ -4,11 +4,32 @@ Provides functionality to generate shared bootstrap indices that ensure
 all metrics computed across different models are directly comparable.
 When the same indices are used, bootstrap sample i from model A and
 bootstrap sample i from model B use the exact same resampled cases.
+
+``bootstrap_indices`` returns the dense (n_samples, n_cases) index matrix.
+``BootstrapIndices`` describes the same kind of matrix without storing it:
+rows are generated on demand, one fixed-size chunk at a time, from
+independent seeded streams, so 10,000 × 10,000 resamples never occupy
+more than one chunk of memory. Every metric accepts either form.
+
+``adaptive_bootstrap`` draws BootstrapIndices chunks until the CI of a
+metric stops moving, instead of using a fixed sample count.
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterator, Union
+
 import numpy as np
 from numpy.typing import NDArray
 
+from src.analysis.result_types import BootstrapResult
+from src.analysis.tensor import DecisionData, as_tensor
+
+# Rows per generated chunk of BootstrapIndices (chunk k always holds rows
+# [k * chunk_size, (k + 1) * chunk_size) of the stream)
+DEFAULT_CHUNK_SIZE = 1000
+
 
 def bootstrap_indices(
     n_cases: int,
@@ -61,3 +82,262 @@ def bootstrap_indices(
     indices = rng.integers(low=0, high=n_cases, size=(n_samples, n_cases))
     
     return indices
+
+
+def bootstrap_weights(
+    indices: IndicesLike,
+    n_cases: int,
+) -> NDArray[np.intp]:
+    """Count how often each case is drawn in each bootstrap sample.
+    
+    Resampling with replacement is equivalent to weighting each case by its
+    number of draws, which lets weighted estimators (e.g. GLM frequency
+    weights) fit all bootstrap samples on one design matrix.
+    
+    Args:
+        indices: Bootstrap indices of shape (n_samples, n_draws), e.g. from
+            bootstrap_indices(), or a BootstrapIndices (see its
+            iter_weights() to stay within one chunk of memory).
+        n_cases: Number of cases in the original dataset.
+    
+    Returns:
+        Array of shape (n_samples, n_cases) where weights[i, c] is the number
+        of times case c appears in indices[i].
+    
+    Example:
+        >>> indices = bootstrap_indices(n_cases=100, n_samples=1000, seed=42)
+        >>> weights = bootstrap_weights(indices, n_cases=100)
+        >>> np.all(weights.sum(axis=1) == 100)
+        True
+    """
+    if isinstance(indices, BootstrapIndices):
+        return np.concatenate([bootstrap_weights(rows, n_cases) for rows in indices.iter_chunks()])
+    
+    n_samples = indices.shape[0]
+    offsets = np.arange(n_samples)[:, None] * n_cases
+    counts = np.bincount((indices + offsets).ravel(), minlength=n_samples * n_cases)
+    return counts.reshape(n_samples, n_cases)
+
+
+@dataclass(frozen=True)
+class BootstrapIndices:
+    """Lazily generated bootstrap indices.
+    
+    Behaves like the (n_samples, n_cases) matrix from bootstrap_indices()
+    without materializing it. Rows are produced in chunks of ``chunk_size``;
+    chunk k is drawn from its own generator seeded with
+    ``SeedSequence(seed, spawn_key=(k,))`` (the k-th child of
+    ``SeedSequence(seed)``), so any row can be regenerated on its own and
+    row i is the same wherever and however often it is read.
+    
+    Indices are stored in the smallest unsigned dtype that holds n_cases - 1
+    (uint8 up to 256 cases, uint16 up to 65,536).
+    
+    Note that the rows differ from bootstrap_indices() with the same seed,
+    which draws all rows from a single stream.
+    
+    Attributes:
+        n_cases: Number of cases in the original dataset
+        n_samples: Number of bootstrap samples (rows)
+        seed: Root seed. If None, fresh entropy is drawn once and stored, so
+            the object stays reproducible.
+        chunk_size: Rows per generated chunk (part of the stream definition)
+        start: First row of the stream covered by this object (set by slicing)
+    
+    Example:
+        >>> indices = BootstrapIndices(n_cases=10_000, n_samples=10_000, seed=42)
+        >>> indices.shape
+        (10000, 10000)
+        >>> result = value_preference(decisions, "openai/gpt-5.2", "autonomy", indices=indices)
+        >>> indices.row(17)  # the resample behind result.samples[17]
+    """
+    n_cases: int
+    n_samples: int = 1000
+    seed: int | None = None
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    start: int = 0
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if self.n_cases <= 0:
+            raise ValueError(f"n_cases must be positive, got {self.n_cases}")
+        if self.n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {self.n_samples}")
+        if self.chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {self.chunk_size}")
+        if self.seed is None:
+            object.__setattr__(self, "seed", np.random.SeedSequence().entropy)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickle only the parameters; workers regenerate the rows they need
+        state = dict(self.__dict__)
+        state["_cache"] = {}
+        return state
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+    
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.n_samples, self.n_cases)
+    
+    @property
+    def dtype(self) -> np.dtype:
+        """Smallest unsigned integer dtype holding every case index."""
+        return np.min_scalar_type(self.n_cases - 1)
+    
+    def __len__(self) -> int:
+        return self.n_samples
+    
+    def __getitem__(self, rows: slice) -> BootstrapIndices:
+        """Contiguous sub-range of rows, e.g. ``indices[1000:2000]``."""
+        if not isinstance(rows, slice) or rows.step not in (None, 1):
+            raise TypeError("BootstrapIndices only supports contiguous row slices; use row(i) for single rows")
+        start, stop, _ = rows.indices(self.n_samples)
+        if stop <= start:
+            raise ValueError(f"Empty row slice {rows} of {self.n_samples} samples")
+        return replace(self, start=self.start + start, n_samples=stop - start)
+    
+    def _chunk(self, k: int) -> NDArray[np.unsignedinteger]:
+        """Rows of stream chunk k, up to the last row this object covers.
+        
+        A generator fills its rows in order, so a shorter draw is a prefix
+        of the full chunk and every slice sees the same rows.
+        """
+        n_rows = min(self.chunk_size, self.start + self.n_samples - k * self.chunk_size)
+        cached = self._cache.get(k)
+        if cached is None or len(cached) < n_rows:
+            rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(k,)))
+            cached = rng.integers(0, self.n_cases, size=(n_rows, self.n_cases), dtype=self.dtype)
+            # Keep only the most recent chunk
+            self._cache.clear()
+            self._cache[k] = cached
+        return cached
+    
+    def row(self, i: int) -> NDArray[np.unsignedinteger]:
+        """Indices of bootstrap sample i."""
+        if not 0 <= i < self.n_samples:
+            raise IndexError(f"row {i} out of range for {self.n_samples} samples")
+        k, offset = divmod(self.start + i, self.chunk_size)
+        return self._chunk(k)[offset].copy()
+    
+    def iter_chunks(self, max_rows: int | None = None) -> Iterator[NDArray[np.unsignedinteger]]:
+        """Consecutive blocks of rows, in order, each at most max_rows long.
+        
+        Blocks never span two generated chunks, so max_rows defaults to (and
+        is capped by) chunk_size.
+        """
+        max_rows = min(max_rows or self.chunk_size, self.chunk_size)
+        row, stop = self.start, self.start + self.n_samples
+        while row < stop:
+            k, offset = divmod(row, self.chunk_size)
+            n_rows = min(max_rows, self.chunk_size - offset, stop - row)
+            # Copy so that no block keeps the whole chunk alive
+            yield self._chunk(k)[offset:offset + n_rows].copy()
+            row += n_rows
+    
+    def iter_weights(self, max_rows: int | None = None) -> Iterator[NDArray[np.unsignedinteger]]:
+        """Blocks of multinomial draw counts matching iter_chunks().
+        
+        Each block has shape (n_rows, n_cases) and the smallest unsigned
+        dtype holding n_cases; see bootstrap_weights().
+        """
+        dtype = np.min_scalar_type(self.n_cases)
+        for rows in self.iter_chunks(max_rows):
+            yield bootstrap_weights(rows, self.n_cases).astype(dtype)
+    
+    def to_array(self) -> NDArray[np.unsignedinteger]:
+        """Materialize all rows as one (n_samples, n_cases) array."""
+        return np.concatenate(list(self.iter_chunks()))
+
+
+# Bootstrap indices accepted by the metrics: a dense matrix or BootstrapIndices
+IndicesLike = Union[NDArray[np.integer], BootstrapIndices]
+
+
+def iter_index_chunks(indices: IndicesLike, max_rows: int) -> Iterator[NDArray[np.integer]]:
+    """Consecutive blocks of at most max_rows bootstrap rows, in order.
+    
+    Lets a metric process a dense index matrix and a BootstrapIndices the
+    same way, holding one block of rows at a time.
+    """
+    if isinstance(indices, BootstrapIndices):
+        yield from indices.iter_chunks(max_rows)
+    else:
+        for start in range(0, indices.shape[0], max_rows):
+            yield indices[start:start + max_rows]
+
+
+def adaptive_bootstrap(
+    metric: Callable[..., BootstrapResult],
+    decisions: DecisionData,
+    seed: int,
+    confidence: float = 95,
+    tol: float = 1e-3,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_samples: int = 2 * DEFAULT_CHUNK_SIZE,
+    max_samples: int = 50 * DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> BootstrapResult:
+    """Bootstrap a metric until its confidence interval converges.
+    
+    Samples are drawn one chunk of BootstrapIndices rows at a time. After
+    each chunk (once min_samples are drawn) the percentile CI is compared
+    with the CI before that chunk; sampling stops when neither endpoint
+    moved by more than tol, or at max_samples. The samples are the first
+    rows of ``BootstrapIndices(n_cases, max_samples, seed, chunk_size)``,
+    so a result with n samples equals the fixed-size bootstrap of n samples
+    with the same seed.
+    
+    Args:
+        metric: A metric returning a BootstrapResult when given ``indices``
+            (value_preference, agreement_rate, refusal_rate)
+        decisions: List of DecisionRecord objects or a DecisionTensor
+        seed: Root seed of the BootstrapIndices
+        confidence: Confidence level (0-100) of the CI that must converge
+        tol: Largest change of either CI endpoint over the last chunk that
+            counts as converged, in the metric's units
+        chunk_size: Samples drawn between convergence checks
+        min_samples: Samples drawn before the first check
+        max_samples: Upper limit on the number of samples
+        **kwargs: Metric arguments, e.g. ``model="openai/gpt-5.2"``
+    
+    Returns:
+        BootstrapResult whose ``converged`` records whether the CI converged
+        and whose ``n_samples`` is the number of samples used.
+    
+    Raises:
+        ValueError: If tol is not positive or the sample limits are
+            inconsistent
+    
+    Example:
+        >>> result = adaptive_bootstrap(value_preference, decisions, seed=42,
+        ...                             model="openai/gpt-5.2", value="autonomy")
+        >>> result.n_samples, result.converged
+        (3000, True)
+    """
+    if tol <= 0:
+        raise ValueError(f"tol must be positive, got {tol}")
+    if not 0 < min_samples <= max_samples:
+        raise ValueError(
+            f"Need 0 < min_samples <= max_samples, got min_samples={min_samples}, max_samples={max_samples}"
+        )
+    
+    tensor = as_tensor(decisions)
+    indices = BootstrapIndices(tensor.n_cases, max_samples, seed=seed, chunk_size=chunk_size)
+    
+    parts: list[NDArray[np.floating]] = []
+    n_drawn = 0
+    previous_ci = None
+    while n_drawn < max_samples:
+        stop = min(max(n_drawn + chunk_size, min_samples), max_samples)
+        parts.append(metric(tensor, indices=indices[n_drawn:stop], **kwargs).samples)
+        n_drawn = stop
+        
+        ci = BootstrapResult(samples=np.concatenate(parts)).ci(confidence)
+        # NaN endpoints never compare as converged
+        if previous_ci is not None and all(abs(a - b) <= tol for a, b in zip(ci, previous_ci)):
+            return BootstrapResult(samples=np.concatenate(parts), converged=True)
+        previous_ci = ci
+    
+    return BootstrapResult(samples=np.concatenate(parts), converged=False)
@@ -0,0 +1,155 @@
+"""On-disk store of bootstrap samples that can be extended.
+
+A bootstrap over ``BootstrapIndices`` is defined by its seed: chunk k of
+resamples comes from its own seeded stream, so samples 0..n-1 do not
+depend on how many samples are drawn in total. ``BootstrapStore`` keeps the
+samples of each (dataset fingerprint, metric, arguments, seed) on disk.
+Asking for more samples later only evaluates the new rows and appends them;
+the samples already stored are returned unchanged.
+
+Entries live at ``{store_dir}/{fingerprint[:16]}/{metric}/{key}.npz``,
+where key hashes the metric's module and qualified name, its arguments, the
+seed, the chunk size and ``STORE_VERSION``.
+
+Example:
+    >>> store = BootstrapStore()
+    >>> result = store.bootstrap(value_preference, decisions, 1_000, seed=42,
+    ...                          model="openai/gpt-5.2", value="autonomy")
+    >>> # CI too wide: only samples 1,000..9,999 are computed
+    >>> result = store.bootstrap(value_preference, decisions, 10_000, seed=42,
+    ...                          model="openai/gpt-5.2", value="autonomy")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.analysis.bootstrap import DEFAULT_CHUNK_SIZE, BootstrapIndices
+from src.analysis.result_types import BootstrapResult
+from src.analysis.tensor import DecisionData, DecisionTensor, as_tensor
+
+# Default location of stored bootstrap samples
+DEFAULT_STORE_DIR = Path(__file__).parent.parent.parent / "data" / "bootstrap_store"
+
+# Part of every entry key; bump when a metric's samples change (e.g. after a
+# fix to a metric) so samples stored by the old code are not returned
+STORE_VERSION = 1
+
+
+def _entry_key(metric: Callable[..., Any], seed: int, chunk_size: int, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Everything besides the dataset that determines the stored samples."""
+    return {
+        "version": STORE_VERSION,
+        "metric": f"{metric.__module__}.{metric.__qualname__}",
+        "kwargs": kwargs,
+        "seed": seed,
+        "chunk_size": chunk_size,
+    }
+
+
+class BootstrapStore:
+    """Persisted, extendable bootstrap samples of BootstrapResult metrics.
+
+    Args:
+        store_dir: Directory holding the stored samples
+    """
+
+    def __init__(self, store_dir: str | Path = DEFAULT_STORE_DIR):
+        self.store_dir = Path(store_dir)
+
+    def _path(self, tensor: DecisionTensor, metric_name: str, key: dict[str, Any]) -> Path:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return self.store_dir / tensor.fingerprint[:16] / metric_name / f"{digest}.npz"
+
+    def _load(self, path: Path, key: dict[str, Any]) -> NDArray[np.floating]:
+        """Stored samples for key (empty if missing, unreadable or another key)."""
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                if json.loads(str(npz["key"])) != key:
+                    return np.empty(0)
+                return npz["samples"]
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return np.empty(0)
+
+    def _save(self, path: Path, key: dict[str, Any], samples: NDArray[np.floating]) -> None:
+        """Atomically write the samples of one entry."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            np.savez(f, key=np.array(json.dumps(key, sort_keys=True)), samples=samples)
+            tmp_path = Path(f.name)
+        os.replace(tmp_path, path)
+
+    def bootstrap(
+        self,
+        metric: Callable[..., BootstrapResult],
+        decisions: DecisionData,
+        n_samples: int,
+        seed: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> BootstrapResult:
+        """Bootstrap a metric, reusing and extending the stored samples.
+
+        Equivalent to ``metric(decisions, indices=BootstrapIndices(n_cases,
+        n_samples, seed, chunk_size), **kwargs)``, but only the samples beyond
+        those already stored for the same dataset, metric, arguments, seed
+        and chunk size are computed.
+
+        Args:
+            metric: A module-level metric returning a BootstrapResult
+                (value_preference, agreement_rate, refusal_rate)
+            decisions: List of DecisionRecord objects or a DecisionTensor
+            n_samples: Number of bootstrap samples wanted
+            seed: Root seed of the BootstrapIndices
+            chunk_size: Rows per generated index chunk (part of the key)
+            **kwargs: Metric arguments, e.g. ``model="openai/gpt-5.2"``;
+                must be JSON-serializable
+
+        Returns:
+            BootstrapResult with the first n_samples stored samples.
+
+        Raises:
+            ValueError: If n_samples is not positive or seed is None
+            TypeError: If the metric does not return a BootstrapResult
+        """
+        if n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {n_samples}")
+        if seed is None:
+            raise ValueError("seed is required to extend stored bootstrap samples")
+
+        tensor = as_tensor(decisions)
+        key = _entry_key(metric, seed, chunk_size, kwargs)
+        path = self._path(tensor, metric.__name__, key)
+        samples = self._load(path, key)
+
+        if len(samples) < n_samples:
+            indices = BootstrapIndices(tensor.n_cases, n_samples, seed=seed, chunk_size=chunk_size)
+            result = metric(tensor, indices=indices[len(samples):], **kwargs)
+            if not isinstance(result, BootstrapResult):
+                raise TypeError(f"{metric.__name__} returned {type(result).__name__}, not BootstrapResult")
+            samples = np.concatenate([samples, result.samples])
+            self._save(path, key, samples)
+
+        return BootstrapResult(samples=samples[:n_samples])
+
+    def n_stored(
+        self,
+        metric: Callable[..., BootstrapResult],
+        decisions: DecisionData,
+        seed: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> int:
+        """Number of samples stored for a bootstrap (0 if none)."""
+        tensor = as_tensor(decisions)
+        key = _entry_key(metric, seed, chunk_size, kwargs)
+        return len(self._load(self._path(tensor, metric.__name__, key), key))
@@ -1,10 +1,44 @@
-"""Data loading utilities for LLM decision analysis."""
+"""Data loading utilities for LLM decision analysis.
+
+``load_llm_decisions`` / ``load_human_decisions`` / ``load_all_decisions``
+return fully validated ``DecisionRecord`` objects, including every run's
+``full_response`` payload. Metrics only need each run's ``parsed_choice`` and
+the case's value tags; ``load_decision_tensor`` reads just those, one file at
+a time, and compiles them straight into a ``DecisionTensor``. Its per-file
+summaries are cached (``src.analysis.summaries``), so repeated loads only
+decode files that changed. Both paths include runs that are still pending in
+a case's run journal (``src.llm_decisions.journal``).
+
+The record loaders take ``n_workers`` to decode and validate files on a
+process pool, and use ``orjson`` for decoding when it is installed.
+
+Compare the loaders (wall time and peak traced memory):
+
+    python -m src.analysis.loader_benchmark --workers 4
+"""
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
 
+from src.analysis.summaries import read_summaries
+from src.analysis.tensor import DecisionTensor
 from src.human_decisions.models import ParticipantRegistry
+from src.llm_decisions.journal import RunJournal
 from src.llm_decisions.models import DecisionRecord
+from src.response_models.case import VALUE_NAMES
+
+try:
+    import orjson
+except ImportError:  # optional, faster decoder
+    orjson = None
+
+# orjson decodes standard JSON to the same objects as json.loads
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
 
 # Default path to LLM decisions data
 DEFAULT_LLM_DECISIONS_DIR = Path(__file__).parent.parent.parent / "data" / "llm_decisions" / "physician_recommendation"
@@ -13,8 +47,37 @@ DEFAULT_LLM_DECISIONS_DIR = Path(__file__).parent.parent.parent / "data" / "llm_
 DEFAULT_HUMAN_DECISIONS_DIR = Path(__file__).parent.parent.parent / "data" / "human_decisions"
 
 
+def _decode_record(json_path: Path) -> DecisionRecord:
+    """Decode and validate one decision file (runs in pool workers too).
+    
+    Runs still pending in the case's journal (an evaluation that stopped
+    before compacting) are replayed onto the record, as the runner does.
+    """
+    data = _json_loads(json_path.read_bytes())
+    
+    try:
+        record = DecisionRecord.model_validate(data)
+    except Exception as e:
+        raise ValueError(
+            f"Failed to parse {json_path.name} as DecisionRecord: {e}"
+        ) from e
+    RunJournal(record.case_id, json_path.parent).replay(record)
+    return record
+
+
+def _load_records(json_files: list[Path], n_workers: int | None) -> list[DecisionRecord]:
+    """Decode files in order, serially or across a process pool."""
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(json_files) < 2:
+        return [_decode_record(json_path) for json_path in json_files]
+    
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(json_files))) as pool:
+        return list(pool.map(_decode_record, json_files))
+
+
 def load_llm_decisions(
     data_dir: str | Path = DEFAULT_LLM_DECISIONS_DIR,
+    n_workers: int | None = 1,
 ) -> list[DecisionRecord]:
     """Load all LLM decision records from JSON files.
     
@@ -24,6 +87,8 @@ def load_llm_decisions(
     Args:
         data_dir: Directory containing LLM decision JSON files. Defaults to
             data/llm_decisions/ relative to the project root.
+        n_workers: Number of processes decoding and validating files.
+            Defaults to 1 (serial); None uses the CPU count.
     
     Returns:
         List of DecisionRecord objects, one per case.
@@ -47,26 +112,12 @@ def load_llm_decisions(
     if not data_dir.is_dir():
         raise FileNotFoundError(f"Path is not a directory: {data_dir}")
     
-    decisions: list[DecisionRecord] = []
-    json_files = sorted(data_dir.glob("*.json"))
-    
-    for json_path in json_files:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        try:
-            record = DecisionRecord.model_validate(data)
-            decisions.append(record)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to parse {json_path.name} as DecisionRecord: {e}"
-            ) from e
-    
-    return decisions
+    return _load_records(sorted(data_dir.glob("*.json")), n_workers)
 
 
 def load_human_decisions(
     data_dir: str | Path = DEFAULT_HUMAN_DECISIONS_DIR,
+    n_workers: int | None = 1,
 ) -> list[DecisionRecord]:
     """Load all human decision records from JSON files.
     
@@ -78,6 +129,8 @@ def load_human_decisions(
     Args:
         data_dir: Directory containing human decision JSON files. Defaults to
             data/human_decisions/ relative to the project root.
+        n_workers: Number of processes decoding and validating files.
+            Defaults to 1 (serial); None uses the CPU count.
     
     Returns:
         List of DecisionRecord objects, one per case.
@@ -100,26 +153,9 @@ def load_human_decisions(
     if not data_dir.is_dir():
         raise FileNotFoundError(f"Path is not a directory: {data_dir}")
     
-    decisions: list[DecisionRecord] = []
-    json_files = sorted(data_dir.glob("*.json"))
-    
-    for json_path in json_files:
-        # Skip the participant registry file
-        if json_path.name == "participant_registry.json":
-            continue
-            
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        try:
-            record = DecisionRecord.model_validate(data)
-            decisions.append(record)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to parse {json_path.name} as DecisionRecord: {e}"
-            ) from e
-    
-    return decisions
+    # Skip the participant registry file
+    json_files = [p for p in sorted(data_dir.glob("*.json")) if p.name != "participant_registry.json"]
+    return _load_records(json_files, n_workers)
 
 
 def load_participant_registry(
@@ -152,6 +188,7 @@ def load_participant_registry(
 def load_all_decisions(
     llm_dir: str | Path = DEFAULT_LLM_DECISIONS_DIR,
     human_dir: str | Path = DEFAULT_HUMAN_DECISIONS_DIR,
+    n_workers: int | None = 1,
 ) -> list[DecisionRecord]:
     """Load and merge all LLM and human decision records.
     
@@ -167,6 +204,8 @@ def load_all_decisions(
             data/llm_decisions/ relative to the project root.
         human_dir: Directory containing human decision JSON files. Defaults to
             data/human_decisions/ relative to the project root.
+        n_workers: Number of processes decoding and validating files.
+            Defaults to 1 (serial); None uses the CPU count.
     
     Returns:
         List of DecisionRecord objects with merged models from both sources.
@@ -193,13 +232,13 @@ def load_all_decisions(
     human_records: list[DecisionRecord] = []
     
     if llm_dir.exists() and llm_dir.is_dir():
-        llm_records = load_llm_decisions(llm_dir)
+        llm_records = load_llm_decisions(llm_dir, n_workers)
     
     if human_dir.exists() and human_dir.is_dir():
         # Check if there are any case files (not just the registry)
         case_files = [f for f in human_dir.glob("*.json") if f.name != "participant_registry.json"]
         if case_files:
-            human_records = load_human_decisions(human_dir)
+            human_records = load_human_decisions(human_dir, n_workers)
     
     # Index by case_id for merging
     llm_by_case: dict[str, DecisionRecord] = {r.case_id: r for r in llm_records}
@@ -241,3 +280,91 @@ def load_all_decisions(
             merged_records.append(human_record)  # type: ignore
     
     return merged_records
+
+
+def _summaries_by_case(
+    data_dir: Path,
+    use_cache: bool,
+    rebuild_cache: bool,
+) -> dict[str, tuple[np.ndarray, dict[str, np.ndarray]]]:
+    summaries = read_summaries(data_dir, use_cache=use_cache, rebuild_cache=rebuild_cache)
+    return {s.case_id: (s.alignment, s.counts) for s in summaries}
+
+
+def load_decision_tensor(
+    llm_dir: str | Path = DEFAULT_LLM_DECISIONS_DIR,
+    human_dir: str | Path = DEFAULT_HUMAN_DECISIONS_DIR,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+) -> DecisionTensor:
+    """Load LLM and human decisions as a summary-only DecisionTensor.
+    
+    Equivalent to ``DecisionTensor.from_records(load_all_decisions(llm_dir, human_dir))``
+    but never builds DecisionRecord objects: each file keeps only its value
+    tags and per-model choice counts, and response payloads are dropped
+    while the file is decoded. Use load_all_decisions when the raw responses
+    are needed.
+    
+    Per-file summaries are cached in each directory (``.summary_cache.npz``,
+    see ``src.analysis.summaries``), keyed by the file's size, mtime and
+    content hash, so only new or changed case files are decoded again.
+    
+    Args:
+        llm_dir: Directory containing LLM decision JSON files
+        human_dir: Directory containing human decision JSON files
+        use_cache: Read and update the per-directory summary caches
+        rebuild_cache: Re-read every file and rewrite the caches
+    
+    Returns:
+        DecisionTensor over all cases in either source, sorted by case_id.
+    
+    Raises:
+        ValueError: If a file lacks the case tags or has an unknown parsed
+            choice, or if the same model key appears in both LLM and human
+            data for a case.
+    
+    Example:
+        >>> tensor = load_decision_tensor()
+        >>> value_preference(tensor, "openai/gpt-5.2", "autonomy")
+    """
+    llm_dir = Path(llm_dir)
+    human_dir = Path(human_dir)
+    
+    llm = _summaries_by_case(llm_dir, use_cache, rebuild_cache) if llm_dir.is_dir() else {}
+    human = _summaries_by_case(human_dir, use_cache, rebuild_cache) if human_dir.is_dir() else {}
+    
+    # Merge per case as load_all_decisions does (LLM case definition first)
+    merged: dict[str, tuple[np.ndarray, dict[str, np.ndarray]]] = {}
+    for case_id in sorted(set(llm) | set(human)):
+        alignment, counts = llm.get(case_id) or human[case_id]
+        if case_id in llm and case_id in human:
+            overlap = set(llm[case_id][1]) & set(human[case_id][1])
+            if overlap:
+                raise ValueError(
+                    f"Case {case_id} has overlapping model keys in LLM and human data: {overlap}"
+                )
+            counts = {**llm[case_id][1], **human[case_id][1]}
+        merged[case_id] = (alignment, counts)
+    
+    case_ids = list(merged)
+    decision_makers = sorted({dm for _, counts in merged.values() for dm in counts})
+    dm_index = {dm: j for j, dm in enumerate(decision_makers)}
+    
+    counts_array = np.zeros((len(case_ids), len(decision_makers), 3), dtype=np.int64)
+    present = np.zeros((len(case_ids), len(decision_makers)), dtype=bool)
+    alignment_array = np.zeros((len(case_ids), len(VALUE_NAMES), 2), dtype=np.int8)
+    
+    for i, (alignment, counts) in enumerate(merged.values()):
+        alignment_array[i] = alignment
+        for dm, dm_counts in counts.items():
+            present[i, dm_index[dm]] = True
+            counts_array[i, dm_index[dm]] = dm_counts
+    
+    return DecisionTensor(
+        counts=counts_array,
+        present=present,
+        alignment=alignment_array,
+        case_ids=case_ids,
+        decision_makers=decision_makers,
+    )
+
@@ -0,0 +1,68 @@
+"""Benchmark of the decision loaders.
+
+Compares wall time and peak traced memory of the record loaders
+(``load_all_decisions``, serial and on a process pool) with the summary-only
+``load_decision_tensor``, with and without its summary cache.
+
+Usage:
+    python -m src.analysis.loader_benchmark --workers 4
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from src.analysis.loader import (
+    DEFAULT_HUMAN_DECISIONS_DIR,
+    DEFAULT_LLM_DECISIONS_DIR,
+    load_all_decisions,
+    load_decision_tensor,
+    orjson,
+)
+from src.analysis.tensor import DecisionTensor
+
+
+def _measure(load: Callable[[], Any]) -> tuple[float, float]:
+    """Wall time (s) of one load, and its peak traced memory (MB) in a second run."""
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the record loaders with the summary-only tensor loader")
+    parser.add_argument("--llm-dir", default=str(DEFAULT_LLM_DECISIONS_DIR))
+    parser.add_argument("--human-dir", default=str(DEFAULT_HUMAN_DECISIONS_DIR))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes for the parallel row")
+    args = parser.parse_args()
+    
+    loaders = {
+        "load_all_decisions": lambda: load_all_decisions(args.llm_dir, args.human_dir),
+        f"load_all_decisions ({args.workers} workers)": lambda: load_all_decisions(
+            args.llm_dir, args.human_dir, n_workers=args.workers
+        ),
+        "load_all_decisions + compile": lambda: DecisionTensor.from_records(
+            load_all_decisions(args.llm_dir, args.human_dir)
+        ),
+        "load_decision_tensor (no cache)": lambda: load_decision_tensor(
+            args.llm_dir, args.human_dir, use_cache=False
+        ),
+        "load_decision_tensor (cached)": lambda: load_decision_tensor(args.llm_dir, args.human_dir),
+    }
+    print(f"JSON decoder: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'loader':<36} {'time (s)':>10} {'peak (MB)':>10}")
+    for name, load in loaders.items():
+        elapsed, peak = _measure(load)
+        print(f"{name:<36} {elapsed:>10.2f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
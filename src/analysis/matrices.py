@@ -0,0 +1,280 @@
+"""Metric matrices over all models (and values) in one call.
+
+Leaderboard tables need ``value_preference`` for every model × value,
+``refusal_rate`` for every model and ``agreement_rate`` for every pair of
+models. Calling the per-model functions in a loop recompiles the data and
+re-aggregates human consensus on each call. The functions here compile once
+and evaluate the whole grid with array operations. Bootstrap resamples
+become blocks of (n_rows, n_cases) draw counts (see ``bootstrap_weights``),
+so every cell's samples are one matrix product per block.
+
+Per-case definitions are those of the single-model metrics in
+``src.analysis.metrics``. A cell without data is NaN where the single-model
+function would raise ValueError.
+
+Example:
+    >>> indices = bootstrap_indices(n_cases=len(decisions), n_samples=10_000, seed=42)
+    >>> prefs = preference_matrix(decisions, indices=indices)
+    >>> prefs.table.pivot(index="model", columns="value", values="estimate")
+    >>> prefs.samples.shape  # models × values × samples
+    (13, 4, 10000)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from src.analysis.bootstrap import IndicesLike, bootstrap_weights, iter_index_chunks
+from src.analysis.metrics import _majority_choices
+from src.analysis.result_types import MetricMatrix
+from src.analysis.tensor import (
+    CHOICE_1,
+    CHOICE_2,
+    HUMAN_CONSENSUS,
+    REFUSAL,
+    DecisionData,
+    DecisionTensor,
+    as_tensor,
+)
+from src.response_models.case import VALUE_NAMES
+
+# Bootstrap rows per chunk of draw counts in preference/refusal matrices
+_WEIGHTS_CHUNK = 1024
+# Bootstrap rows per chunk in agreement_matrix (bounds the chunk × M × M × cases product)
+_AGREEMENT_CHUNK = 256
+
+
+def _default_models(tensor: DecisionTensor, include_consensus: bool) -> list[str]:
+    """All non-human decision-makers, plus HUMAN_CONSENSUS if requested and humans exist."""
+    models = [dm for dm, human in zip(tensor.decision_makers, tensor.is_human) if not human]
+    if include_consensus and tensor.is_human.any():
+        models.append(HUMAN_CONSENSUS)
+    return models
+
+
+def _weighted_means(
+    values: NDArray[np.floating],
+    has_data: NDArray[np.bool_],
+    weights: NDArray[np.integer] | None,
+) -> NDArray[np.floating]:
+    """Mean over cases (axis 0) of values where has_data, under case weights.
+
+    Args:
+        values: Per-case values, shape (n_cases, ...)
+        has_data: Boolean mask of the same shape
+        weights: Draw counts of shape (n_samples, n_cases), or None for the
+            unweighted mean over all cases
+
+    Returns:
+        Means of shape values.shape[1:] (unweighted) or
+        values.shape[1:] + (n_samples,) (weighted); NaN where no case has data.
+    """
+    masked = np.where(has_data, values, 0.0).reshape(values.shape[0], -1)
+    present = has_data.astype(np.float64).reshape(values.shape[0], -1)
+    if weights is None:
+        sums, counts = masked.sum(axis=0), present.sum(axis=0)
+        out_shape = values.shape[1:]
+    else:
+        weights = weights.astype(np.float64)
+        sums, counts = (weights @ masked).T, (weights @ present).T
+        out_shape = values.shape[1:] + (weights.shape[0],)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    return means.reshape(out_shape)
+
+
+def _bootstrap_means(
+    values: NDArray[np.floating],
+    has_data: NDArray[np.bool_],
+    indices: IndicesLike,
+    n_cases: int,
+) -> NDArray[np.floating]:
+    """_weighted_means for every bootstrap row, one block of draw counts at a time."""
+    chunks = [
+        _weighted_means(values, has_data, bootstrap_weights(rows, n_cases))
+        for rows in iter_index_chunks(indices, _WEIGHTS_CHUNK)
+    ]
+    return np.concatenate(chunks, axis=-1)
+
+
+def _tidy_table(
+    labels: dict[str, list[str]],
+    estimates: NDArray[np.floating],
+    samples: NDArray[np.floating] | None,
+    confidence: float,
+) -> pd.DataFrame:
+    """One row per cell with labels, estimate and (if bootstrapped) mean and CI."""
+    grid = pd.MultiIndex.from_product(list(labels.values()), names=list(labels.keys()))
+    table = pd.DataFrame(index=grid)
+    table["estimate"] = estimates.ravel()
+    if samples is not None:
+        # Same statistics as BootstrapResult.mean and BootstrapResult.ci
+        alpha = (100 - confidence) / 2
+        flat = samples.reshape(-1, samples.shape[-1])
+        table["mean"] = np.mean(flat, axis=1)
+        table["ci_lower"] = np.percentile(flat, alpha, axis=1)
+        table["ci_upper"] = np.percentile(flat, 100 - alpha, axis=1)
+    return table.reset_index()
+
+
+def preference_matrix(
+    decisions: DecisionData,
+    models: list[str] | None = None,
+    values: list[str] | None = None,
+    indices: IndicesLike | None = None,
+    confidence: float = 95,
+) -> MetricMatrix:
+    """value_preference for every model × value.
+
+    Args:
+        decisions: List of DecisionRecord objects or a DecisionTensor
+        models: Models to include (may contain HUMAN_CONSENSUS). Defaults to
+            all non-human decision-makers plus HUMAN_CONSENSUS when humans exist.
+        values: Values to include. Defaults to VALUE_NAMES.
+        indices: Optional shared bootstrap indices from bootstrap_indices()
+            or a BootstrapIndices
+        confidence: Confidence level (0-100) of the CI columns in the table
+
+    Returns:
+        MetricMatrix with labels {"model", "value"}, estimates of shape
+        (n_models, n_values) and samples of shape (n_models, n_values, n_samples).
+
+    Raises:
+        ValueError: If a value is not in VALUE_NAMES
+    """
+    tensor = as_tensor(decisions)
+    models = _default_models(tensor, include_consensus=True) if models is None else list(models)
+    values = list(VALUE_NAMES) if values is None else list(values)
+    invalid = [v for v in values if v not in VALUE_NAMES]
+    if invalid:
+        raise ValueError(f"Invalid values {invalid}. Must be in: {VALUE_NAMES}")
+
+    # counts: cases × models × 3; alignment: cases × values × 2
+    counts = np.stack([tensor.counts_for(model) for model in models], axis=1)
+    align = tensor.alignment[:, [VALUE_NAMES.index(v) for v in values], :]
+
+    total_valid = counts[:, :, CHOICE_1] + counts[:, :, CHOICE_2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p_c1 = counts[:, :, CHOICE_1] / total_valid
+        p_c2 = counts[:, :, CHOICE_2] / total_valid
+
+    # E[value] per case: cases × models × values
+    case_values = p_c1[:, :, None] * align[:, None, :, 0] + p_c2[:, :, None] * align[:, None, :, 1]
+    has_data = (total_valid > 0)[:, :, None] & np.any(align != 0, axis=2)[:, None, :]
+
+    labels = {"model": models, "value": values}
+    estimates = _weighted_means(case_values, has_data, None)
+    samples = None
+    if indices is not None:
+        samples = _bootstrap_means(case_values, has_data, indices, tensor.n_cases)
+    return MetricMatrix(
+        table=_tidy_table(labels, estimates, samples, confidence),
+        estimates=estimates,
+        samples=samples,
+        labels=labels,
+    )
+
+
+def refusal_matrix(
+    decisions: DecisionData,
+    models: list[str] | None = None,
+    indices: IndicesLike | None = None,
+    confidence: float = 95,
+) -> MetricMatrix:
+    """refusal_rate for every model.
+
+    Args:
+        decisions: List of DecisionRecord objects or a DecisionTensor
+        models: Models to include. Defaults to all non-human decision-makers.
+        indices: Optional shared bootstrap indices from bootstrap_indices()
+            or a BootstrapIndices
+        confidence: Confidence level (0-100) of the CI columns in the table
+
+    Returns:
+        MetricMatrix with labels {"model"}, estimates of shape (n_models,)
+        and samples of shape (n_models, n_samples).
+    """
+    tensor = as_tensor(decisions)
+    models = _default_models(tensor, include_consensus=False) if models is None else list(models)
+
+    # Like refusal_rate, HUMAN_CONSENSUS is not pooled (and has no runs)
+    counts = np.stack([tensor.counts_for(model, pool_humans=False) for model in models], axis=1)
+    total_runs = counts.sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        case_rates = counts[:, :, REFUSAL] / total_runs
+    has_data = total_runs > 0
+
+    labels = {"model": models}
+    estimates = _weighted_means(case_rates, has_data, None)
+    samples = None
+    if indices is not None:
+        samples = _bootstrap_means(case_rates, has_data, indices, tensor.n_cases)
+    return MetricMatrix(
+        table=_tidy_table(labels, estimates, samples, confidence),
+        estimates=estimates,
+        samples=samples,
+        labels=labels,
+    )
+
+
+def agreement_matrix(
+    decisions: DecisionData,
+    models: list[str] | None = None,
+    indices: IndicesLike | None = None,
+    confidence: float = 95,
+) -> MetricMatrix:
+    """agreement_rate for every pair of models.
+
+    Agreement on a case is computed from one-hot majority choices, so for
+    every pair the agreeing and comparable case counts are matrix products
+    over cases.
+
+    Args:
+        decisions: List of DecisionRecord objects or a DecisionTensor
+        models: Models to include (may contain HUMAN_CONSENSUS). Defaults to
+            all non-human decision-makers plus HUMAN_CONSENSUS when humans exist.
+        indices: Optional shared bootstrap indices from bootstrap_indices()
+            or a BootstrapIndices
+        confidence: Confidence level (0-100) of the CI columns in the table
+
+    Returns:
+        MetricMatrix with labels {"model_a", "model_b"}, a symmetric estimates
+        matrix of shape (n_models, n_models) and samples of shape
+        (n_models, n_models, n_samples).
+    """
+    tensor = as_tensor(decisions)
+    models = _default_models(tensor, include_consensus=True) if models is None else list(models)
+
+    # One-hot majority choices: models × cases
+    majority = np.stack([_majority_choices(tensor, model) for model in models])
+    choice_1 = (majority == 1).astype(np.float64)
+    choice_2 = (majority == 2).astype(np.float64)
+    valid = choice_1 + choice_2
+
+    def pair_rates(weights: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Agreement per pair for case weights of shape (..., n_cases)."""
+        agree = (
+            np.einsum("mc,...c,nc->...mn", choice_1, weights, choice_1)
+            + np.einsum("mc,...c,nc->...mn", choice_2, weights, choice_2)
+        )
+        comparable = np.einsum("mc,...c,nc->...mn", valid, weights, valid)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(comparable > 0, agree / comparable, np.nan)
+
+    labels = {"model_a": models, "model_b": models}
+    estimates = pair_rates(np.ones(tensor.n_cases))
+    samples = None
+    if indices is not None:
+        chunks = [
+            pair_rates(bootstrap_weights(rows, tensor.n_cases).astype(np.float64))
+            for rows in iter_index_chunks(indices, _AGREEMENT_CHUNK)
+        ]
+        samples = np.moveaxis(np.concatenate(chunks), 0, -1)
+    return MetricMatrix(
+        table=_tidy_table(labels, estimates, samples, confidence),
+        estimates=estimates,
+        samples=samples,
+        labels=labels,
+    )
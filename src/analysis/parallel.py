@@ -0,0 +1,219 @@
+"""Process-pool executor for bootstrapped analysis metrics.
+
+A report computes every metric for every model (and value) against the same
+bootstrap indices. ``parallel_bootstrap`` spreads that work over worker
+processes. The decision tensor and the index matrix are placed in shared
+memory once, so workers attach to them instead of receiving pickled records
+with every task.
+
+A ``BootstrapIndices`` is not copied at all: it is a few integers, and each
+worker regenerates the rows it needs.
+
+Work is split either by task (one metric call per model/value, the default)
+or by bootstrap rows (every task's index matrix is cut into one slice per
+worker and the partial results are concatenated). Bootstrap samples are
+computed independently per row, so both modes return results identical to
+the serial call for the same indices.
+
+Example:
+    >>> indices = bootstrap_indices(n_cases=len(decisions), n_samples=10_000, seed=42)
+    >>> tasks = [{"model": m, "value": v} for m in models for v in VALUE_NAMES]
+    >>> results = parallel_bootstrap(value_preference, decisions, indices, tasks)
+    >>> results[0].ci(95)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Literal, Sequence, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.analysis.bootstrap import BootstrapIndices, IndicesLike
+from src.analysis.result_types import BootstrapResult, ValueWeightsResult
+from src.analysis.tensor import DecisionData, DecisionTensor, as_tensor
+from src.response_models.case import VALUE_NAMES
+
+MetricResult = Union[BootstrapResult, ValueWeightsResult]
+
+
+@dataclass(frozen=True)
+class _SharedArraySpec:
+    """Where a worker finds one shared array."""
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class _SharedDataSpec:
+    """Everything a worker needs to rebuild the tensor and indices."""
+    counts: _SharedArraySpec
+    present: _SharedArraySpec
+    alignment: _SharedArraySpec
+    # Lazily generated indices are passed as they are
+    indices: _SharedArraySpec | BootstrapIndices
+    case_ids: list[str]
+    decision_makers: list[str]
+    # Forked workers share the parent's resource tracker; spawned ones have
+    # their own and must not let it unlink the parent's blocks on exit
+    untrack: bool
+
+
+class _SharedDecisionData:
+    """Copies a tensor and an index matrix into shared memory for the pool's lifetime."""
+
+    def __init__(self, tensor: DecisionTensor, indices: IndicesLike, untrack: bool):
+        self._blocks: list[shared_memory.SharedMemory] = []
+        self.spec = _SharedDataSpec(
+            counts=self._share(tensor.counts),
+            present=self._share(tensor.present),
+            alignment=self._share(tensor.alignment),
+            indices=indices if isinstance(indices, BootstrapIndices) else self._share(indices),
+            case_ids=list(tensor.case_ids),
+            decision_makers=list(tensor.decision_makers),
+            untrack=untrack,
+        )
+
+    def _share(self, array: NDArray) -> _SharedArraySpec:
+        # SharedMemory rejects size 0, so empty arrays still get one byte
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return _SharedArraySpec(name=block.name, shape=array.shape, dtype=array.dtype.str)
+
+    def __enter__(self) -> _SharedDecisionData:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+
+# Per-worker state set by _attach_worker: (tensor, indices, open blocks)
+_worker_data: tuple[DecisionTensor, IndicesLike, list[shared_memory.SharedMemory]] | None = None
+
+
+def _attach(spec: _SharedArraySpec, blocks: list[shared_memory.SharedMemory], untrack: bool) -> NDArray:
+    block = shared_memory.SharedMemory(name=spec.name)
+    if untrack:
+        # The parent owns (and unlinks) the block
+        resource_tracker.unregister(block._name, "shared_memory")
+    blocks.append(block)
+    array = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _attach_worker(spec: _SharedDataSpec) -> None:
+    """Pool initializer: map the shared arrays into this worker."""
+    global _worker_data
+    blocks: list[shared_memory.SharedMemory] = []
+    tensor = DecisionTensor(
+        counts=_attach(spec.counts, blocks, spec.untrack),
+        present=_attach(spec.present, blocks, spec.untrack),
+        alignment=_attach(spec.alignment, blocks, spec.untrack),
+        case_ids=spec.case_ids,
+        decision_makers=spec.decision_makers,
+    )
+    if isinstance(spec.indices, BootstrapIndices):
+        indices = spec.indices
+    else:
+        indices = _attach(spec.indices, blocks, spec.untrack)
+    _worker_data = (tensor, indices, blocks)
+
+
+def _run_task(metric: Callable[..., MetricResult], kwargs: dict[str, Any], rows: slice) -> MetricResult:
+    tensor, indices, _ = _worker_data
+    return metric(tensor, indices=indices[rows], **kwargs)
+
+
+def _merge_results(parts: list[MetricResult]) -> MetricResult:
+    """Concatenate results computed on consecutive slices of bootstrap rows."""
+    if len(parts) == 1:
+        return parts[0]
+    if all(isinstance(part, BootstrapResult) for part in parts):
+        return BootstrapResult(samples=np.concatenate([part.samples for part in parts]))
+    if all(isinstance(part, ValueWeightsResult) for part in parts):
+        samples = {v: np.concatenate([part.bootstrap_samples[v] for part in parts]) for v in VALUE_NAMES}
+        # Same point estimate as value_weights: mean of the bootstrap samples
+        return ValueWeightsResult(
+            coefficients={v: float(np.mean(samples[v])) for v in VALUE_NAMES},
+            std_errors=None,
+            p_values=None,
+            bootstrap_samples=samples,
+        )
+    raise TypeError(
+        f"Cannot merge bootstrap shards of type {sorted({type(part).__name__ for part in parts})}"
+    )
+
+
+def parallel_bootstrap(
+    metric: Callable[..., MetricResult],
+    decisions: DecisionData,
+    indices: IndicesLike,
+    tasks: Sequence[dict[str, Any]],
+    shard: Literal["tasks", "rows"] = "tasks",
+    n_workers: int | None = None,
+) -> list[MetricResult]:
+    """Run a bootstrapped metric for many tasks on a process pool.
+
+    Each task is the keyword arguments of one call, evaluated as
+    ``metric(decisions, indices=indices, **task)``.
+
+    Args:
+        metric: A module-level metric accepting a DecisionTensor and
+            ``indices`` (e.g. value_preference, agreement_rate, refusal_rate,
+            value_weights) and returning a BootstrapResult or ValueWeightsResult
+        decisions: List of DecisionRecord objects or a DecisionTensor
+        indices: Shared bootstrap indices from bootstrap_indices() or a
+            BootstrapIndices
+        tasks: Keyword arguments per call, e.g. ``[{"model": m} for m in models]``
+        shard: 'tasks' runs each call in one worker; 'rows' splits the
+            bootstrap rows of every call across all workers (useful when
+            there are fewer tasks than workers)
+        n_workers: Number of worker processes. Defaults to the CPU count;
+            1 runs serially in this process.
+
+    Returns:
+        One result per task, in task order, identical to the serial call.
+
+    Raises:
+        ValueError: If shard is not 'tasks' or 'rows'
+    """
+    if shard not in ("tasks", "rows"):
+        raise ValueError(f"Invalid shard: '{shard}'. Must be 'tasks' or 'rows'")
+
+    tensor = as_tensor(decisions)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if n_workers == 1:
+        return [metric(tensor, indices=indices, **task) for task in tasks]
+
+    # Contiguous row slices; concatenating the shards restores the row order
+    if shard == "rows":
+        bounds = np.linspace(0, indices.shape[0], min(n_workers, indices.shape[0]) + 1).astype(int)
+        row_slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    else:
+        row_slices = [slice(None)]
+
+    context = multiprocessing.get_context()
+    untrack = context.get_start_method() != "fork"
+    with _SharedDecisionData(tensor, indices, untrack) as shared, ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=context,
+        initializer=_attach_worker,
+        initargs=(shared.spec,),
+    ) as pool:
+        futures = [
+            [pool.submit(_run_task, metric, dict(task), rows) for rows in row_slices]
+            for task in tasks
+        ]
+        return [_merge_results([future.result() for future in parts]) for parts in futures]
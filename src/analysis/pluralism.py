@@ -8,8 +8,8 @@ from __future__ import annotations
 
 import numpy as np
 from numpy.typing import NDArray
-from src.analysis.metrics import _get_alignment
-from src.llm_decisions.models import DecisionRecord
+from src.analysis.metrics import _majority_choices
+from src.analysis.tensor import DecisionData, _get_alignment, as_tensor
 from src.response_models.case import BenchmarkCandidate, VALUE_NAMES
 
 
@@ -44,7 +44,7 @@ def value_tension_pairs(case: BenchmarkCandidate) -> list[tuple[str, str]]:
 
 
 def build_kappa_input_table(
-    decisions: list[DecisionRecord],
+    decisions: DecisionData,
     raters: list[str],
 ) -> tuple[NDArray, list[str]]:
     """Build a rater-count table consumable by agreement metrics.
@@ -57,7 +57,8 @@ def build_kappa_input_table(
     response are included in the output.
 
     Args:
-        decisions: Decision records (from ``load_all_decisions`` etc.).
+        decisions: Decision records (from ``load_all_decisions`` etc.) or a
+            ``DecisionTensor`` compiled from them.
         raters: Rater identifiers (e.g. physician IDs or model IDs).
 
     Returns:
@@ -65,25 +66,17 @@ def build_kappa_input_table(
         with columns ``[choice_1_count, choice_2_count]`` and *case_ids*
         lists the corresponding case identifiers.
     """
-    rows: list[list[int]] = []
-    case_ids: list[str] = []
-
-    for record in decisions:
-        c1 = 0
-        c2 = 0
-        for rater in raters:
-            if rater not in record.models:
-                continue
-            majority = record.models[rater].summary.majority_choice
-            if majority == "choice_1":
-                c1 += 1
-            elif majority == "choice_2":
-                c2 += 1
-
-        if c1 + c2 == 0:
-            continue
+    tensor = as_tensor(decisions)
+    table = np.zeros((tensor.n_cases, 2), dtype=int)
 
-        rows.append([c1, c2])
-        case_ids.append(record.case_id)
+    for rater in raters:
+        # Raters are individual decision-makers; absent ones add nothing
+        if rater not in tensor.decision_maker_index:
+            continue
+        majority = _majority_choices(tensor, rater)
+        table[:, 0] += majority == 1
+        table[:, 1] += majority == 2
 
-    return np.array(rows, dtype=int), case_ids
+    keep = table.sum(axis=1) > 0
+    case_ids = [tensor.case_ids[i] for i in np.flatnonzero(keep)]
+    return table[keep], case_ids
@@ -0,0 +1,157 @@
+"""One-pass Poisson bootstrap for streaming and sharded results.
+
+``bootstrap_indices`` resamples exactly n_cases cases per replicate, so it
+needs the final case count and random access to every case. The Poisson
+bootstrap instead gives each case an independent Poisson(1) weight per
+replicate. The weights of a case depend only on its case ID and the seed
+(through a hash), never on the other cases or their order. A replicate's
+estimate of a mean-type metric is the weighted mean of the per-case values:
+
+    sample[b] = sum_c w[c, b] * value[c] / sum_c w[c, b]
+
+``PoissonBootstrap`` keeps the two sums per replicate, so cases can be
+added as evaluation results arrive and then dropped. Accumulators built
+over disjoint sets of cases (e.g. one per worker) merge into the
+accumulator of their union.
+
+Example:
+    >>> stream = PoissonBootstrap(n_samples=1000, seed=42)
+    >>> for records in incoming_batches:
+    ...     stream.add_decisions(refusal_rate, records, model="openai/gpt-5.2")
+    >>> stream.result().ci(95)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Callable, Mapping
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.analysis.result_types import BootstrapResult
+from src.analysis.tensor import DecisionData, as_tensor
+
+
+def poisson_weights(case_id: str, n_samples: int, seed: int) -> NDArray[np.int64]:
+    """Poisson(1) bootstrap weights of one case.
+
+    Args:
+        case_id: Case identifier
+        n_samples: Number of bootstrap replicates
+        seed: Seed shared by every case of the bootstrap
+
+    Returns:
+        Array of shape (n_samples,); entry b is how often the case is drawn
+        in replicate b. The first k entries do not depend on n_samples.
+    """
+    digest = hashlib.sha256(f"{seed}\x00{case_id}".encode()).digest()
+    rng = np.random.default_rng(int.from_bytes(digest[:16], "little"))
+    return rng.poisson(1.0, size=n_samples)
+
+
+class PoissonBootstrap:
+    """Streaming bootstrap of the mean of per-case values.
+
+    Args:
+        n_samples: Number of bootstrap replicates
+        seed: Seed of the case weights; accumulators merge only if their
+            seeds and n_samples match
+
+    Raises:
+        ValueError: If n_samples is not positive or seed is None
+    """
+
+    def __init__(self, n_samples: int = 1000, seed: int = 0):
+        if n_samples <= 0:
+            raise ValueError(f"n_samples must be positive, got {n_samples}")
+        if seed is None:
+            raise ValueError("seed is required to derive case weights")
+        self.n_samples = n_samples
+        self.seed = seed
+        self.n_cases = 0
+        self.total = 0.0
+        # Per replicate: sum of weight × value and sum of weights
+        self.weighted_sums = np.zeros(n_samples)
+        self.weight_sums = np.zeros(n_samples)
+
+    def add(self, case_id: str, value: float) -> None:
+        """Add the value of one case."""
+        self.add_cases({case_id: value})
+
+    def add_cases(self, case_values: Mapping[str, float]) -> None:
+        """Add the values of several cases (each case must be added once).
+
+        Args:
+            case_values: Case ID to per-case metric value
+        """
+        if not case_values:
+            return
+        weights = np.stack(
+            [poisson_weights(case_id, self.n_samples, self.seed) for case_id in case_values]
+        ).astype(np.float64)
+        values = np.fromiter(case_values.values(), dtype=np.float64, count=len(case_values))
+        self.weighted_sums += values @ weights
+        self.weight_sums += weights.sum(axis=0)
+        self.n_cases += len(values)
+        self.total += float(values.sum())
+
+    def add_decisions(
+        self,
+        metric: Callable[..., dict[int, float]],
+        decisions: DecisionData,
+        **kwargs: Any,
+    ) -> None:
+        """Add the per-case values of a metric on a batch of decisions.
+
+        Args:
+            metric: A mean-type metric supporting ``return_all_cases``
+                (value_preference, agreement_rate, refusal_rate)
+            decisions: New DecisionRecord objects or a DecisionTensor; cases
+                without data for the metric are skipped
+            **kwargs: Metric arguments, e.g. ``model="openai/gpt-5.2"``
+        """
+        tensor = as_tensor(decisions)
+        case_values = metric(tensor, return_all_cases=True, **kwargs)
+        self.add_cases({tensor.case_ids[idx]: value for idx, value in case_values.items()})
+
+    def merge(self, other: PoissonBootstrap) -> PoissonBootstrap:
+        """Add the cases of another accumulator over disjoint cases.
+
+        Returns:
+            This accumulator, now covering both sets of cases.
+
+        Raises:
+            ValueError: If the seeds or sample counts differ
+        """
+        if (other.n_samples, other.seed) != (self.n_samples, self.seed):
+            raise ValueError(
+                f"Cannot merge Poisson bootstraps with (n_samples, seed) "
+                f"{(self.n_samples, self.seed)} and {(other.n_samples, other.seed)}"
+            )
+        self.weighted_sums += other.weighted_sums
+        self.weight_sums += other.weight_sums
+        self.n_cases += other.n_cases
+        self.total += other.total
+        return self
+
+    @property
+    def estimate(self) -> float:
+        """Mean of the per-case values added so far (the point estimate)."""
+        if self.n_cases == 0:
+            raise ValueError("No cases have been added")
+        return self.total / self.n_cases
+
+    def result(self) -> BootstrapResult:
+        """Bootstrap samples of the mean over the cases added so far.
+
+        A replicate in which every case has weight 0 is NaN.
+
+        Raises:
+            ValueError: If no cases have been added
+        """
+        if self.n_cases == 0:
+            raise ValueError("No cases have been added")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            samples = np.where(self.weight_sums > 0, self.weighted_sums / self.weight_sums, np.nan)
+        return BootstrapResult(samples=samples)
@@ -2,18 +2,22 @@
 
 Provides result containers for bootstrap-based inference:
 - BootstrapResult: Generic container for any bootstrapped metric
+- AnalyticResult: Closed-form CI for a mean-type metric (same interface)
 - ValueWeightsResult: Specialized container for logistic regression coefficients
+- MetricMatrix: A metric over a grid of models (and values), with shared samples
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.stats import norm
 
 if TYPE_CHECKING:
+    import pandas as pd
     import statsmodels.api as sm
 
 
@@ -28,6 +32,8 @@ class BootstrapResult:
     
     Attributes:
         samples: 1D array of bootstrap sample values, shape (n_samples,)
+        converged: Set by adaptive_bootstrap(): whether the CI endpoints were
+            stable before its sample limit. None for a fixed sample count.
     
     Example:
         >>> result = BootstrapResult(samples=np.array([0.5, 0.52, 0.48, 0.51]))
@@ -38,6 +44,12 @@ class BootstrapResult:
     """
     
     samples: NDArray[np.floating]
+    converged: Optional[bool] = None
+    
+    @property
+    def n_samples(self) -> int:
+        """Number of bootstrap samples."""
+        return len(self.samples)
     
     @property
     def mean(self) -> float:
@@ -82,6 +94,65 @@ class BootstrapResult:
         return f"BootstrapResult(mean={self.mean:.4f}, 95% CI=[{ci_low:.4f}, {ci_high:.4f}], n={len(self.samples)})"
 
 
+@dataclass
+class AnalyticResult:
+    """Closed-form confidence interval for a mean of per-case values.
+    
+    Returned by mean-type metrics with ``inference="analytic"``. Offers the
+    ``mean``, ``std`` and ``ci()`` interface of BootstrapResult without
+    resampling, so intervals are available instantly for exploration; use
+    the bootstrap for final reporting.
+    
+    Attributes:
+        mean: Mean of the per-case values (the metric's point estimate)
+        std_error: Standard error of the mean
+        n_cases: Number of cases with data
+        method: 'normal' for mean ± z × std_error (sample standard deviation
+            of the per-case values), or 'wilson' for the Wilson score
+            interval of a proportion of 0/1 per-case outcomes
+    
+    Example:
+        >>> result = agreement_rate(decisions, "openai/gpt-5.2", "human_consensus", inference="analytic")
+        >>> result.ci(95)
+        (0.61, 0.84)
+    """
+    
+    mean: float
+    std_error: float
+    n_cases: int
+    method: Literal["normal", "wilson"] = "normal"
+    
+    @property
+    def std(self) -> float:
+        """Standard error (the counterpart of BootstrapResult.std)."""
+        return self.std_error
+    
+    def ci(self, confidence: float = 95) -> tuple[float, float]:
+        """Compute the closed-form confidence interval.
+        
+        Args:
+            confidence: Confidence level as a percentage (0-100). Default is 95.
+        
+        Returns:
+            Tuple of (lower_bound, upper_bound) for the confidence interval.
+        """
+        z = float(norm.ppf(1 - (100 - confidence) / 200))
+        if self.method == "wilson":
+            n, p = self.n_cases, self.mean
+            denominator = 1 + z ** 2 / n
+            center = (p + z ** 2 / (2 * n)) / denominator
+            half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+            return (float(center - half_width), float(center + half_width))
+        return (self.mean - z * self.std_error, self.mean + z * self.std_error)
+    
+    def __repr__(self) -> str:
+        ci_low, ci_high = self.ci(95)
+        return (
+            f"AnalyticResult(mean={self.mean:.4f}, 95% CI=[{ci_low:.4f}, {ci_high:.4f}], "
+            f"n_cases={self.n_cases}, method={self.method!r})"
+        )
+
+
 @dataclass
 class ValueWeightsResult:
     """Container for logistic regression coefficients estimating value weights.
@@ -173,3 +244,52 @@ class ValueWeightsResult:
         coef_strs = [f"{v}={c:.3f}" for v, c in self.coefficients.items()]
         bootstrapped = "bootstrapped" if self.bootstrap_samples else "point estimate"
         return f"ValueWeightsResult({', '.join(coef_strs)}) [{bootstrapped}]"
+
+
+@dataclass
+class MetricMatrix:
+    """Container for a metric computed over a grid of models (and values).
+    
+    Every cell is computed against the same bootstrap indices, so
+    ``samples[..., i]`` of any two cells come from the same resampled cases
+    and paired differences are simply ``samples[a] - samples[b]``.
+    
+    Attributes:
+        table: Tidy DataFrame with one row per cell: the cell labels (e.g.
+            ``model``, ``value``), ``estimate`` (point estimate on all cases,
+            NaN without data) and, when bootstrapped, ``mean``, ``ci_lower``
+            and ``ci_upper`` of the bootstrap samples
+        estimates: Point estimates with one axis per label (e.g. models × values)
+        samples: Bootstrap samples with a trailing axis of length n_samples,
+            or None for point estimates only
+        labels: Axis name to labels, in axis order (e.g. ``{"model": [...], "value": [...]}``)
+    
+    Example:
+        >>> prefs = preference_matrix(decisions, indices=indices)
+        >>> prefs.get_bootstrap_result("openai/gpt-5.2", "autonomy").ci(95)
+        (0.12, 0.31)
+        >>> gpt, claude = prefs.labels["model"].index("openai/gpt-5.2"), 0
+        >>> diff = prefs.samples[gpt] - prefs.samples[claude]  # values × samples
+    """
+    
+    table: pd.DataFrame
+    estimates: NDArray[np.floating]
+    samples: Optional[NDArray[np.floating]]
+    labels: dict[str, list[str]]
+    
+    def cell(self, *key: str) -> tuple[int, ...]:
+        """Array index of the cell with the given labels (one per axis)."""
+        if len(key) != len(self.labels):
+            raise KeyError(f"Expected {len(self.labels)} labels ({', '.join(self.labels)}), got {len(key)}")
+        return tuple(labels.index(k) for labels, k in zip(self.labels.values(), key))
+    
+    def get_bootstrap_result(self, *key: str) -> Optional[BootstrapResult]:
+        """BootstrapResult of one cell, or None without bootstrap samples."""
+        if self.samples is None:
+            return None
+        return BootstrapResult(samples=self.samples[self.cell(*key)])
+    
+    def __repr__(self) -> str:
+        shape = " × ".join(f"{len(v)} {k}s" for k, v in self.labels.items())
+        n = "point estimate" if self.samples is None else f"n={self.samples.shape[-1]}"
+        return f"MetricMatrix({shape}) [{n}]"
@@ -0,0 +1,271 @@
+"""Per-file decision summaries and their on-disk cache.
+
+A decision file's summary is what the metrics need from it: the case's
+value tags and each decision-maker's parsed-choice counts. Summaries are
+read without materializing run payloads (see ``_keep_parsed_choice``).
+
+``SummaryCache`` stores the summaries of a directory in one ``.npz`` file
+next to the decision files (``.summary_cache.npz``). Each entry carries the
+file's (size, mtime, content hash) fingerprint, plus the size and mtime of
+the case's run journal. On the next load, files whose size and mtime are
+unchanged (and whose journal is unchanged) are taken from the cache without
+being opened; files whose stat changed are hashed and only re-parsed if
+their content changed too. After a new evaluation run, only the case files
+it touched are decoded again.
+
+Runs still pending in a case's journal (``{case_id}.journal.jsonl``, see
+``src.llm_decisions.journal``) are counted as if they had been compacted
+into the record.
+
+Example:
+    >>> summaries = read_summaries("data/llm_decisions/physician_recommendation")
+    >>> summaries[0].counts["openai/gpt-5.2"]
+    array([7, 3, 0])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.analysis.tensor import _CHOICE_POSITION
+from src.llm_decisions.journal import JOURNAL_SUFFIX, RunJournal
+from src.response_models.case import VALUE_NAMES
+
+CACHE_FILENAME = ".summary_cache.npz"
+CACHE_VERSION = 2
+
+# Numeric alignment of each value tag (as in tensor._get_alignment)
+_TAG_ALIGNMENT = {"promotes": 1, "violates": -1, "neutral": 0}
+
+
+@dataclass
+class FileSummary:
+    """Summary of one decision file.
+
+    Attributes:
+        filename: Name of the JSON file inside its directory
+        case_id: Case ID stored in the file
+        alignment: Array of shape (n_values, 2), alignment of choice_1 and
+            choice_2 on each value in VALUE_NAMES
+        counts: Decision-maker to (choice_1, choice_2, refusal) run counts
+        size: File size in bytes when read
+        mtime_ns: File modification time in nanoseconds when read
+        content_hash: SHA-256 of the file contents
+        journal_size: Size of the case's run journal when read (0 if none)
+        journal_mtime_ns: Modification time of the journal (0 if none)
+    """
+    filename: str
+    case_id: str
+    alignment: NDArray[np.int8]
+    counts: dict[str, NDArray[np.int64]]
+    size: int
+    mtime_ns: int
+    content_hash: str
+    journal_size: int = 0
+    journal_mtime_ns: int = 0
+
+
+def _keep_parsed_choice(pairs: list[tuple[str, Any]]) -> Any:
+    """JSON object hook that collapses each run to its parsed choice.
+
+    Objects are decoded innermost first, so a run's ``full_response`` is
+    released as soon as the run object closes instead of being kept (and
+    validated) for the whole file.
+    """
+    obj = dict(pairs)
+    if "full_response" in obj and "parsed_choice" in obj:
+        return obj["parsed_choice"]
+    return obj
+
+
+def _journal_stat(data_dir: Path, case_id: str) -> tuple[int, int]:
+    """(size, mtime_ns) of a case's run journal, (0, 0) if there is none."""
+    try:
+        stat = (data_dir / f"{case_id}{JOURNAL_SUFFIX}").stat()
+    except OSError:
+        return 0, 0
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _parse_summary(json_path: Path, raw: bytes, stat: os.stat_result, content_hash: str) -> FileSummary:
+    """Build the summary of a decision file from its raw bytes and the case's journal."""
+    try:
+        data = json.loads(raw, object_pairs_hook=_keep_parsed_choice)
+        case = data["case"]
+        alignment = np.array(
+            [[_TAG_ALIGNMENT[case[choice][value]] for choice in ("choice_1", "choice_2")] for value in VALUE_NAMES],
+            dtype=np.int8,
+        )
+        counts = {}
+        for dm, model_data in data.get("models", {}).items():
+            dm_counts = np.zeros(3, dtype=np.int64)
+            for choice in model_data.get("runs", []):
+                if choice not in _CHOICE_POSITION:
+                    raise ValueError(f"unknown parsed choice {choice!r} for {dm}")
+                dm_counts[_CHOICE_POSITION[choice]] += 1
+            counts[dm] = dm_counts
+        case_id = data["case_id"]
+
+        # Pending journal entries, applied like RunJournal.replay: runs whose
+        # index is already in the record were compacted and are skipped
+        journal_size, journal_mtime_ns = _journal_stat(json_path.parent, case_id)
+        if journal_size:
+            for entry in RunJournal(case_id, json_path.parent).entries():
+                dm_counts = counts.setdefault(entry["model"], np.zeros(3, dtype=np.int64))
+                if entry["run_index"] < dm_counts.sum():
+                    continue
+                choice = entry["run"]["parsed_choice"]
+                if choice not in _CHOICE_POSITION:
+                    raise ValueError(f"unknown parsed choice {choice!r} for {entry['model']} in the journal")
+                dm_counts[_CHOICE_POSITION[choice]] += 1
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Failed to read {json_path.name} as a decision summary: {e}") from e
+
+    return FileSummary(
+        filename=json_path.name,
+        case_id=case_id,
+        alignment=alignment,
+        counts=counts,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=content_hash,
+        journal_size=journal_size,
+        journal_mtime_ns=journal_mtime_ns,
+    )
+
+
+def read_summary(json_path: str | Path) -> FileSummary:
+    """Read the summary of one decision file (no caching)."""
+    json_path = Path(json_path)
+    raw = json_path.read_bytes()
+    return _parse_summary(json_path, raw, json_path.stat(), hashlib.sha256(raw).hexdigest())
+
+
+class SummaryCache:
+    """Fingerprinted summaries of a directory, stored as one ``.npz`` file.
+
+    Args:
+        data_dir: Directory containing decision JSON files
+        cache_path: Where to store the cache (defaults to
+            ``{data_dir}/.summary_cache.npz``)
+    """
+
+    def __init__(self, data_dir: str | Path, cache_path: str | Path | None = None):
+        self.data_dir = Path(data_dir)
+        self.cache_path = Path(cache_path) if cache_path else self.data_dir / CACHE_FILENAME
+
+    def load(self) -> dict[str, FileSummary]:
+        """Cached summaries by filename (empty if missing, unreadable or outdated)."""
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as npz:
+                if int(npz["version"]) != CACHE_VERSION:
+                    return {}
+                arrays = {key: npz[key] for key in npz.files}
+
+            summaries = {}
+            for f, filename in enumerate(arrays["filename"]):
+                rows = np.flatnonzero(arrays["entry_file"] == f)
+                summaries[str(filename)] = FileSummary(
+                    filename=str(filename),
+                    case_id=str(arrays["case_id"][f]),
+                    alignment=arrays["alignment"][f],
+                    counts={str(arrays["entry_dm"][r]): arrays["entry_counts"][r] for r in rows},
+                    size=int(arrays["size"][f]),
+                    mtime_ns=int(arrays["mtime_ns"][f]),
+                    content_hash=str(arrays["content_hash"][f]),
+                    journal_size=int(arrays["journal_size"][f]),
+                    journal_mtime_ns=int(arrays["journal_mtime_ns"][f]),
+                )
+        except (OSError, KeyError, IndexError, ValueError, zipfile.BadZipFile):
+            return {}
+        return summaries
+
+    def save(self, summaries: list[FileSummary]) -> None:
+        """Atomically write the cache next to the decision files."""
+        entries = [(f, dm, counts) for f, s in enumerate(summaries) for dm, counts in s.counts.items()]
+        arrays = dict(
+            version=np.array(CACHE_VERSION),
+            filename=np.array([s.filename for s in summaries], dtype=str),
+            case_id=np.array([s.case_id for s in summaries], dtype=str),
+            alignment=np.array([s.alignment for s in summaries], dtype=np.int8).reshape(-1, len(VALUE_NAMES), 2),
+            size=np.array([s.size for s in summaries], dtype=np.int64),
+            mtime_ns=np.array([s.mtime_ns for s in summaries], dtype=np.int64),
+            content_hash=np.array([s.content_hash for s in summaries], dtype=str),
+            journal_size=np.array([s.journal_size for s in summaries], dtype=np.int64),
+            journal_mtime_ns=np.array([s.journal_mtime_ns for s in summaries], dtype=np.int64),
+            entry_file=np.array([f for f, _, _ in entries], dtype=np.int64),
+            entry_dm=np.array([dm for _, dm, _ in entries], dtype=str),
+            entry_counts=np.array([counts for _, _, counts in entries], dtype=np.int64).reshape(-1, 3),
+        )
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.cache_path.parent, suffix=".tmp", delete=False) as f:
+                np.savez(f, **arrays)
+                tmp_path = Path(f.name)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write summary cache {self.cache_path}: {e}")
+
+
+def read_summaries(
+    data_dir: str | Path,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+) -> list[FileSummary]:
+    """Summaries of every decision file in a directory, sorted by filename.
+
+    Args:
+        data_dir: Directory containing decision JSON files
+            (``participant_registry.json`` is skipped)
+        use_cache: Reuse and update the directory's summary cache
+        rebuild_cache: Ignore the existing cache and re-read every file
+            (the cache is rewritten if use_cache is set)
+
+    Returns:
+        One FileSummary per JSON file.
+
+    Raises:
+        ValueError: If a changed file cannot be read as a decision summary
+    """
+    data_dir = Path(data_dir)
+    cache = SummaryCache(data_dir)
+    cached = cache.load() if use_cache and not rebuild_cache else {}
+
+    summaries: list[FileSummary] = []
+    changed = set(cached) != {p.name for p in data_dir.glob("*.json")} - {"participant_registry.json"}
+
+    for json_path in sorted(data_dir.glob("*.json")):
+        if json_path.name == "participant_registry.json":
+            continue
+        stat = json_path.stat()
+        entry = cached.get(json_path.name)
+        journal_unchanged = (
+            entry is not None
+            and _journal_stat(data_dir, entry.case_id) == (entry.journal_size, entry.journal_mtime_ns)
+        )
+        if journal_unchanged and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            summaries.append(entry)
+            continue
+
+        raw = json_path.read_bytes()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        changed = True
+        if journal_unchanged and entry.content_hash == content_hash:
+            # Touched but unchanged: keep the summary, refresh the fingerprint
+            entry.size, entry.mtime_ns = stat.st_size, stat.st_mtime_ns
+            summaries.append(entry)
+        else:
+            summaries.append(_parse_summary(json_path, raw, stat, content_hash))
+
+    if use_cache and changed:
+        cache.save(summaries)
+    return summaries
@@ -0,0 +1,233 @@
+"""Columnar decision tensor for analysis.
+
+Every metric in ``src.analysis`` works on per-case choice counts and value
+alignments. Reading them off pydantic ``DecisionRecord`` objects means
+re-scanning each model's ``runs`` list every time a ``RunSummary`` count is
+accessed, in every metric call. A ``DecisionTensor`` compiles the records
+once into dense NumPy arrays:
+
+- ``counts``: cases × decision-makers × {choice_1, choice_2, refusal}
+- ``present``: cases × decision-makers, whether the decision-maker has an
+  entry for the case at all
+- ``alignment``: cases × values × {choice_1, choice_2}, from ``_get_alignment``
+
+plus index maps for case IDs and decision-makers. All metrics accept either
+a list of records or a tensor; a list is compiled on every call, so compile
+once (``DecisionTensor.from_records`` or ``load_decision_tensor``) and pass
+the tensor to repeated metric calls. Human consensus votes are pooled once
+per tensor and reused as a pseudo decision-maker column.
+
+Example:
+    >>> decisions = load_all_decisions()
+    >>> tensor = DecisionTensor.from_records(decisions)
+    >>> tensor.counts.shape
+    (51, 412, 3)
+    >>> value_preference(tensor, "openai/gpt-5.2", "autonomy")
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Sequence, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.llm_decisions.models import DecisionRecord
+from src.response_models.case import VALUE_NAMES, ChoiceWithValues
+
+# Special identifier for collective human consensus in agreement_rate
+HUMAN_CONSENSUS = "human_consensus"
+
+# Prefix of human participants in DecisionRecord.models
+HUMAN_PREFIX = "human/"
+
+# Position of each parsed choice along the last axis of DecisionTensor.counts
+CHOICE_1, CHOICE_2, REFUSAL = 0, 1, 2
+_CHOICE_POSITION = {"choice_1": CHOICE_1, "choice_2": CHOICE_2, "REFUSAL": REFUSAL}
+
+
+def _get_alignment(choice: ChoiceWithValues, value: str) -> int:
+    """Get numeric alignment value for a choice on a given value.
+
+    Args:
+        choice: The choice object with value alignment tags
+        value: One of "autonomy", "beneficence", "nonmaleficence", "justice"
+
+    Returns:
+        +1 if promotes, -1 if violates, 0 if neutral
+    """
+    tag = getattr(choice, value)
+    if tag == "promotes":
+        return 1
+    elif tag == "violates":
+        return -1
+    elif tag == "neutral":  # neutral
+        return 0
+    else:
+        raise ValueError(f"Invalid tag '{tag}'. Must be one of: promotes, violates, neutral")
+
+
+@dataclass
+class DecisionTensor:
+    """Dense count and alignment arrays compiled from decision records.
+
+    Cases keep the order of the records they were compiled from, so the
+    bootstrap indices used with a list of records apply unchanged.
+
+    Attributes:
+        counts: Array of shape (n_cases, n_decision_makers, 3) with the number
+            of choice_1, choice_2 and refusal runs (see CHOICE_1, CHOICE_2, REFUSAL)
+        present: Boolean array of shape (n_cases, n_decision_makers), True where
+            the decision-maker has an entry in the case's record
+        alignment: Array of shape (n_cases, n_values, 2) with the alignment of
+            choice_1 and choice_2 on each value in VALUE_NAMES (+1, 0, -1)
+        case_ids: Case identifiers in record order
+        decision_makers: Decision-maker identifiers (models and humans), sorted
+    """
+
+    counts: NDArray[np.int64]
+    present: NDArray[np.bool_]
+    alignment: NDArray[np.int8]
+    case_ids: list[str]
+    decision_makers: list[str]
+    case_index: dict[str, int] = field(init=False, repr=False)
+    decision_maker_index: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        n_cases, n_dms = len(self.case_ids), len(self.decision_makers)
+        if self.counts.shape != (n_cases, n_dms, 3):
+            raise ValueError(f"counts has shape {self.counts.shape}, expected {(n_cases, n_dms, 3)}")
+        if self.present.shape != (n_cases, n_dms):
+            raise ValueError(f"present has shape {self.present.shape}, expected {(n_cases, n_dms)}")
+        if self.alignment.shape != (n_cases, len(VALUE_NAMES), 2):
+            raise ValueError(f"alignment has shape {self.alignment.shape}, expected {(n_cases, len(VALUE_NAMES), 2)}")
+        self.case_index = {case_id: i for i, case_id in enumerate(self.case_ids)}
+        self.decision_maker_index = {dm: j for j, dm in enumerate(self.decision_makers)}
+
+    @classmethod
+    def from_records(cls, decisions: list[DecisionRecord]) -> DecisionTensor:
+        """Compile decision records into a tensor (one pass over all runs)."""
+        decision_makers = sorted({dm for record in decisions for dm in record.models})
+        dm_index = {dm: j for j, dm in enumerate(decision_makers)}
+
+        counts = np.zeros((len(decisions), len(decision_makers), 3), dtype=np.int64)
+        present = np.zeros((len(decisions), len(decision_makers)), dtype=bool)
+        alignment = np.zeros((len(decisions), len(VALUE_NAMES), 2), dtype=np.int8)
+
+        for i, record in enumerate(decisions):
+            for v, value in enumerate(VALUE_NAMES):
+                alignment[i, v, 0] = _get_alignment(record.case.choice_1, value)
+                alignment[i, v, 1] = _get_alignment(record.case.choice_2, value)
+            for dm, model_data in record.models.items():
+                j = dm_index[dm]
+                present[i, j] = True
+                for run in model_data.runs:
+                    counts[i, j, _CHOICE_POSITION[run.parsed_choice]] += 1
+
+        return cls(
+            counts=counts,
+            present=present,
+            alignment=alignment,
+            case_ids=[record.case_id for record in decisions],
+            decision_makers=decision_makers,
+        )
+
+    @property
+    def n_cases(self) -> int:
+        return len(self.case_ids)
+
+    def __len__(self) -> int:
+        return self.n_cases
+
+    @cached_property
+    def is_human(self) -> NDArray[np.bool_]:
+        """Boolean mask over decision-makers that are human participants."""
+        return np.array([dm.startswith(HUMAN_PREFIX) for dm in self.decision_makers], dtype=bool)
+
+    @cached_property
+    def consensus_counts(self) -> NDArray[np.int64]:
+        """Votes pooled across all human participants, shape (n_cases, 3).
+
+        Computed once per tensor; this is the ``HUMAN_CONSENSUS`` column.
+        """
+        return self.counts[:, self.is_human, :].sum(axis=1)
+
+    @cached_property
+    def consensus_present(self) -> NDArray[np.bool_]:
+        """Cases with at least one human participant."""
+        return self.present[:, self.is_human].any(axis=1)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 of the case IDs, decision-makers and arrays.
+
+        Identifies the dataset independently of how it was loaded, e.g. to
+        key stored bootstrap results.
+        """
+        digest = hashlib.sha256()
+        digest.update("\x1f".join(self.case_ids).encode())
+        digest.update(b"\x1e")
+        digest.update("\x1f".join(self.decision_makers).encode())
+        for array, dtype in [(self.counts, np.int64), (self.present, np.bool_), (self.alignment, np.int8)]:
+            digest.update(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        return digest.hexdigest()
+
+    @property
+    def deltas(self) -> NDArray[np.float64]:
+        """Δ_value = align(choice_1, value) - align(choice_2, value), shape (n_cases, n_values)."""
+        return (self.alignment[:, :, 0].astype(np.float64) - self.alignment[:, :, 1])
+
+    def value_alignment(self, value: str) -> NDArray[np.int8]:
+        """Alignment of (choice_1, choice_2) on one value, shape (n_cases, 2)."""
+        return self.alignment[:, VALUE_NAMES.index(value), :]
+
+    def columns(self, decision_makers: list[str]) -> NDArray[np.intp]:
+        """Tensor columns of the given decision-makers (unknown ones are skipped)."""
+        return np.array(
+            [self.decision_maker_index[dm] for dm in decision_makers if dm in self.decision_maker_index],
+            dtype=np.intp,
+        )
+
+    def pooled_counts(self, decision_makers: Sequence[str]) -> NDArray[np.int64]:
+        """Votes summed over a set of decision-makers, shape (n_cases, 3).
+
+        Used for consensus over a subset of physicians. Unknown identifiers
+        contribute nothing and duplicates are counted once.
+        """
+        columns = self.columns(list(dict.fromkeys(decision_makers)))
+        return self.counts[:, columns, :].sum(axis=1)
+
+    def counts_for(self, model: str, pool_humans: bool = True) -> NDArray[np.int64]:
+        """Per-case (choice_1, choice_2, refusal) counts of one decision-maker.
+
+        ``HUMAN_CONSENSUS`` pools the votes of every human participant (unless
+        ``pool_humans`` is False, for metrics that do not support it). A
+        decision-maker that never appears gets all-zero counts.
+        """
+        if model == HUMAN_CONSENSUS and pool_humans:
+            return self.consensus_counts
+        j = self.decision_maker_index.get(model)
+        if j is None:
+            return np.zeros((self.n_cases, 3), dtype=np.int64)
+        return self.counts[:, j, :]
+
+    def present_for(self, model: str) -> NDArray[np.bool_]:
+        """Per-case presence of a decision-maker (any human for ``HUMAN_CONSENSUS``)."""
+        if model == HUMAN_CONSENSUS:
+            return self.consensus_present
+        j = self.decision_maker_index.get(model)
+        if j is None:
+            return np.zeros(self.n_cases, dtype=bool)
+        return self.present[:, j]
+
+
+DecisionData = Union[list[DecisionRecord], DecisionTensor]
+
+def as_tensor(decisions: DecisionData) -> DecisionTensor:
+    """Return ``decisions`` as a DecisionTensor, compiling records if needed."""
+    if isinstance(decisions, DecisionTensor):
+        return decisions
+    return DecisionTensor.from_records(decisions)
@@ -11,23 +11,52 @@ import warnings
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.special import expit, xlogy
 import statsmodels.api as sm
 
-from src.analysis.metrics import _get_alignment, HUMAN_CONSENSUS
+from src.analysis.bootstrap import IndicesLike, bootstrap_weights, iter_index_chunks
 from src.analysis.result_types import ValueWeightsResult
-from src.llm_decisions.models import DecisionRecord
+from src.analysis.tensor import CHOICE_1, CHOICE_2, DecisionData, DecisionTensor, as_tensor
 from src.response_models.case import VALUE_NAMES
 
+# Batched IRLS for bootstrapped value weights; the tolerance and iteration
+# limit mirror statsmodels' GLM.fit defaults
+_IRLS_MAX_ITER = 100
+_IRLS_TOL = 1e-8
+# Fitted |logit| beyond which a replicate is treated as (quasi-)separated and
+# refit with statsmodels, so its fallback behaviour applies
+_IRLS_MAX_ETA = 15.0
+# Bootstrap replicates fitted together (bounds the (chunk, n_cases) work arrays)
+_IRLS_CHUNK = 2048
+
+
+def _case_proportions(
+    tensor: DecisionTensor,
+    model: str,
+) -> tuple[NDArray[np.bool_], NDArray[np.floating], NDArray[np.int64]]:
+    """Per-case P(choice_1) and valid-run counts for a model.
+    
+    Returns:
+        Tuple of (has_data, p_c1, total_valid), each of shape (n_cases,).
+        p_c1 is NaN where has_data is False.
+    """
+    # HUMAN_CONSENSUS pools the votes of all human participants
+    counts = tensor.counts_for(model)
+    total_valid = counts[:, CHOICE_1] + counts[:, CHOICE_2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p_c1 = counts[:, CHOICE_1] / total_valid
+    return total_valid > 0, p_c1, total_valid
+
 
 def _build_regression_data(
-    decisions: list[DecisionRecord],
+    decisions: DecisionData,
     model: str,
     case_indices: NDArray[np.intp] | None = None,
 ) -> tuple[NDArray[np.floating], NDArray[np.floating], NDArray[np.intp]]:
     """Build feature matrix and target vector for logistic regression.
     
     Args:
-        decisions: List of DecisionRecord objects
+        decisions: List of DecisionRecord objects or a DecisionTensor
         model: Model identifier
         case_indices: Optional array of case indices to include (for bootstrap).
             If None, uses all cases with valid data.
@@ -41,73 +70,23 @@ def _build_regression_data(
     Raises:
         ValueError: If no valid cases found for the model
     """
-    # Collect data for all cases (or specified subset)
-    X_rows: list[list[float]] = []
-    y_values: list[float] = []
-    n_trials_values: list[int] = []
+    tensor = as_tensor(decisions)
+    include, p_c1, total_valid = _case_proportions(tensor, model)
+    weights = total_valid
     
-    # Determine which indices to process and their bootstrap weights
     if case_indices is not None:
-        # For bootstrap: count how many times each case is selected
-        unique_indices, counts = np.unique(case_indices, return_counts=True)
-        index_weights = dict(zip(unique_indices, counts))
-    else:
-        index_weights = None
-    
-    for idx, record in enumerate(decisions):
-        # Skip if not in requested indices (for bootstrap)
-        if index_weights is not None and idx not in index_weights:
-            continue
-        
-        # Resolve p_c1 and n_trials depending on model type
-        if model == HUMAN_CONSENSUS:
-            human_models = [m for m in record.models if m.startswith("human/")]
-            if not human_models:
-                continue
-            choice_1_votes = 0
-            choice_2_votes = 0
-            for hm in human_models:
-                s = record.models[hm].summary
-                choice_1_votes += s.choice_1_count
-                choice_2_votes += s.choice_2_count
-            total_votes = choice_1_votes + choice_2_votes
-            if total_votes == 0:
-                continue
-            p_c1 = choice_1_votes / total_votes
-            n_trials = total_votes
-        else:
-            if model not in record.models:
-                continue
-            summary = record.models[model].summary
-            if summary.total_valid_runs == 0:
-                continue
-            p_c1 = summary.choice_1_count / summary.total_valid_runs
-            n_trials = summary.total_valid_runs
-        
-        # Compute Δ_value = align(C1, value) - align(C2, value) for each value
-        delta_row = []
-        for value in VALUE_NAMES:
-            align_c1 = _get_alignment(record.case.choice_1, value)
-            align_c2 = _get_alignment(record.case.choice_2, value)
-            delta_row.append(float(align_c1 - align_c2))
-        
         # For bootstrap: multiply weight by bootstrap count instead of duplicating rows
-        if index_weights is not None:
-            bootstrap_count = index_weights[idx]
-            X_rows.append(delta_row)
-            y_values.append(p_c1)
-            n_trials_values.append(n_trials * bootstrap_count)
-        else:
-            X_rows.append(delta_row)
-            y_values.append(p_c1)
-            n_trials_values.append(n_trials)
-    
-    if len(X_rows) == 0:
+        bootstrap_counts = np.bincount(case_indices, minlength=tensor.n_cases)
+        include &= bootstrap_counts > 0
+        weights = total_valid * bootstrap_counts
+    
+    if not include.any():
         raise ValueError(f"Model '{model}' has no valid runs on any case")
     
-    X = np.array(X_rows, dtype=np.float64)
-    y = np.array(y_values, dtype=np.float64)
-    n_trials = np.array(n_trials_values, dtype=np.intp)
+    # Δ_value = align(C1, value) - align(C2, value) for each value
+    X = tensor.deltas[include]
+    y = p_c1[include]
+    n_trials = weights[include].astype(np.intp)
     
     return X, y, n_trials
 
@@ -172,10 +151,132 @@ def _fit_logistic_regression(
         return {v: 0.0 for v in VALUE_NAMES}, None, None, None
 
 
+def _binomial_deviance(
+    y: NDArray[np.floating],
+    mu: NDArray[np.floating],
+    freq_weights: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """Binomial deviance of each replicate (rows of mu and freq_weights)."""
+    unit = xlogy(y, y) - xlogy(y, mu) + xlogy(1 - y, 1 - y) - xlogy(1 - y, 1 - mu)
+    return 2 * np.sum(freq_weights * unit, axis=1)
+
+
+def _irls_binomial_logit(
+    X: NDArray[np.floating],
+    y: NDArray[np.floating],
+    freq_weights: NDArray[np.floating],
+) -> tuple[NDArray[np.floating], NDArray[np.bool_]]:
+    """Batched IRLS for the no-intercept binomial logit GLM.
+    
+    Runs the iteration of statsmodels' GLM.fit (same starting mean, deviance
+    convergence check and pseudo-inverse solve) for every row of
+    ``freq_weights`` at once. Converged replicates are frozen while the
+    others keep iterating.
+    
+    Args:
+        X: Feature matrix of shape (n_cases, n_values)
+        y: Target vector of shape (n_cases,) with proportions
+        freq_weights: Array of shape (n_replicates, n_cases)
+    
+    Returns:
+        Tuple of (beta, ok) where beta has shape (n_replicates, n_values) and
+        ok is False for replicates that did not converge, went non-finite,
+        or look separated (|logit| above _IRLS_MAX_ETA on a weighted case).
+    """
+    n_reps = freq_weights.shape[0]
+    eps = np.finfo(np.float64).eps
+    
+    # statsmodels' starting mean for the binomial family
+    mu = np.broadcast_to((y + 0.5) / 2, freq_weights.shape).copy()
+    eta = np.log(mu / (1 - mu))
+    deviance = _binomial_deviance(y, mu, freq_weights)
+    beta = np.zeros((n_reps, X.shape[1]))
+    converged = np.zeros(n_reps, dtype=bool)
+    failed = np.zeros(n_reps, dtype=bool)
+    
+    with np.errstate(all="ignore"):
+        for _ in range(_IRLS_MAX_ITER):
+            active = ~(converged | failed)
+            if not active.any():
+                break
+            
+            # Weighted least squares on the working response
+            variance = mu[active] * (1 - mu[active])
+            w = freq_weights[active] * variance
+            z = eta[active] + (y - mu[active]) / variance
+            xtwx = np.einsum("bc,cv,cu->bvu", w, X, X)
+            xtwz = np.einsum("bc,cv,bc->bv", w, X, z)
+            
+            finite = np.isfinite(xtwx).all(axis=(1, 2)) & np.isfinite(xtwz).all(axis=1)
+            xtwx[~finite] = np.eye(X.shape[1])
+            step = np.einsum("bvu,bu->bv", np.linalg.pinv(xtwx), xtwz)
+            
+            rows = np.flatnonzero(active)
+            beta[rows] = step
+            eta[rows] = np.einsum("bv,cv->bc", step, X)
+            mu[rows] = np.clip(expit(eta[rows]), eps, 1 - eps)
+            
+            new_deviance = _binomial_deviance(y, mu[rows], freq_weights[rows])
+            failed[rows[~finite | ~np.isfinite(new_deviance)]] = True
+            converged[rows] = finite & (np.abs(new_deviance - deviance[rows]) <= _IRLS_TOL)
+            deviance[rows] = new_deviance
+    
+    separated = np.any((freq_weights > 0) & (np.abs(eta) > _IRLS_MAX_ETA), axis=1)
+    ok = converged & ~failed & ~separated & np.isfinite(beta).all(axis=1)
+    return beta, ok
+
+
+def _fit_logistic_regression_batch(
+    X: NDArray[np.floating],
+    y: NDArray[np.floating],
+    freq_weights: NDArray[np.integer],
+) -> tuple[NDArray[np.floating], NDArray[np.bool_]]:
+    """Fit value weights for many frequency-weight vectors on one design matrix.
+    
+    Replicate b is the fit _fit_logistic_regression would produce on the
+    cases with freq_weights[b] > 0, using those counts as frequency weights
+    (as bootstrap resamples do). The edge cases of _fit_logistic_regression
+    (constant y or all-zero X) give zero coefficients; replicates the batched
+    IRLS cannot settle are refit with _fit_logistic_regression itself.
+    
+    Args:
+        X: Feature matrix of shape (n_cases, n_values)
+        y: Target vector of shape (n_cases,) with proportions
+        freq_weights: Array of shape (n_replicates, n_cases)
+    
+    Returns:
+        Tuple of (coefficients, fitted) where coefficients has shape
+        (n_replicates, n_values) in VALUE_NAMES order and fitted is False for
+        replicates without any weighted case (no data to fit).
+    """
+    n_reps = freq_weights.shape[0]
+    coefficients = np.zeros((n_reps, X.shape[1]))
+    used = freq_weights > 0
+    fitted = used.any(axis=1)
+    
+    # Same short-circuits as _fit_logistic_regression, per replicate
+    y_all_0 = ~np.any(used & (y != 0), axis=1)
+    y_all_1 = ~np.any(used & (y != 1), axis=1)
+    x_all_0 = ~np.any(used & np.any(X != 0, axis=1), axis=1)
+    todo = np.flatnonzero(fitted & ~y_all_0 & ~y_all_1 & ~x_all_0)
+    
+    for start in range(0, len(todo), _IRLS_CHUNK):
+        reps = todo[start:start + _IRLS_CHUNK]
+        beta, ok = _irls_binomial_logit(X, y, freq_weights[reps].astype(np.float64))
+        coefficients[reps[ok]] = beta[ok]
+        
+        for b in reps[~ok]:
+            rows = used[b]
+            coefs, _, _, _ = _fit_logistic_regression(X[rows], y[rows], freq_weights[b, rows])
+            coefficients[b] = [coefs[v] for v in VALUE_NAMES]
+    
+    return coefficients, fitted
+
+
 def value_weights(
-    decisions: list[DecisionRecord],
+    decisions: DecisionData,
     model: str,
-    indices: NDArray[np.intp] | None = None,
+    indices: IndicesLike | None = None,
 ) -> ValueWeightsResult:
     """Estimate value weights for a model via logistic regression.
     
@@ -189,9 +290,11 @@ def value_weights(
     of runs per case to account for varying precision in P(choice_1) estimates.
     
     Args:
-        decisions: List of DecisionRecord objects from load_llm_decisions()
+        decisions: List of DecisionRecord objects from load_llm_decisions(),
+            or a DecisionTensor compiled from them
         model: Model identifier (e.g., "openai/gpt-5.2")
-        indices: Optional bootstrap indices from bootstrap_indices(). If None,
+        indices: Optional bootstrap indices from bootstrap_indices() or a
+            BootstrapIndices. If None,
             returns point estimate with standard errors from statsmodels.
             If provided, fits model for each bootstrap sample.
     
@@ -219,6 +322,9 @@ def value_weights(
         >>> result.ci("autonomy", 95)
         (0.65, 0.95)
     """
+    # Compile once; every bootstrap sample reads the same count arrays
+    decisions = as_tensor(decisions)
+    
     if indices is None:
         # Point estimate: fit on all data
         X, y, n_trials = _build_regression_data(decisions, model)
@@ -232,23 +338,23 @@ def value_weights(
             glm_result=glm_result,
         )
     
-    # Bootstrapped: fit on each resampled dataset
-    n_samples = indices.shape[0]
-    bootstrap_samples: dict[str, list[float]] = {v: [] for v in VALUE_NAMES}
+    # Bootstrapped: the design is built once and each resample becomes a
+    # vector of frequency weights (valid runs × times the case was drawn),
+    # built and fitted one block of resamples at a time
+    include, p_c1, total_valid = _case_proportions(decisions, model)
+    fits = [
+        _fit_logistic_regression_batch(
+            decisions.deltas[include],
+            p_c1[include],
+            bootstrap_weights(rows, decisions.n_cases)[:, include] * total_valid[include],
+        )
+        for rows in iter_index_chunks(indices, _IRLS_CHUNK)
+    ]
+    coefficients_matrix = np.concatenate([coefficients for coefficients, _ in fits])
+    fitted = np.concatenate([ok for _, ok in fits])
     
-    for i in range(n_samples):
-        try:
-            X, y, n_trials = _build_regression_data(decisions, model, indices[i])
-            coefficients, _, _, _ = _fit_logistic_regression(X, y, n_trials)
-            
-            for v in VALUE_NAMES:
-                bootstrap_samples[v].append(coefficients[v])
-        except ValueError:
-            # Skip bootstrap samples with no valid data
-            continue
-    
-    # Convert to numpy arrays
-    bootstrap_arrays = {v: np.array(samples) for v, samples in bootstrap_samples.items()}
+    # Skip bootstrap samples with no valid data
+    bootstrap_arrays = {v: coefficients_matrix[fitted, j] for j, v in enumerate(VALUE_NAMES)}
     
     # Point estimate is mean of bootstrap samples
     coefficients = {v: float(np.mean(bootstrap_arrays[v])) for v in VALUE_NAMES}
@@ -11,16 +11,16 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from scipy.special import softmax as _scipy_softmax
-from scipy.spatial.distance import jensenshannon
+from scipy.special import rel_entr, softmax as _scipy_softmax
 from scipy.stats import chi2
 import statsmodels.api as sm
 
 from src.analysis.result_types import BootstrapResult
-from src.analysis.metrics import _get_alignment
+from src.analysis.tensor import CHOICE_1, CHOICE_2, DecisionData, as_tensor
 from src.analysis.tradeoffs import _build_regression_data, _fit_logistic_regression
-from src.llm_decisions.models import DecisionRecord
-from src.response_models.case import VALUE_NAMES
+
+# Gathered JSD values per resampling chunk (bounds the chunk × pairs block)
+_RESAMPLE_CHUNK_ELEMENTS = 1 << 22
 
 
 def softmax_profile(
@@ -59,7 +59,7 @@ def softmax_profile(
 
 
 def consensus_profile_from_subset(
-    decisions: list[DecisionRecord],
+    decisions: DecisionData,
     physician_ids: list[str],
     temperature: float = 1.0,
 ) -> dict[str, float]:
@@ -72,7 +72,8 @@ def consensus_profile_from_subset(
     returns the softmax-normalised value profile.
 
     Args:
-        decisions: Decision records from :func:`load_llm_decisions`.
+        decisions: Decision records from :func:`load_llm_decisions`, or a
+            ``DecisionTensor`` compiled from them.
         physician_ids: Physician model identifiers to include
             (e.g. ``["human/P001", "human/P002", ...]``).
         temperature: Positive scaling constant *T* passed to
@@ -85,51 +86,78 @@ def consensus_profile_from_subset(
         ValueError: If no cases have votes from any of the specified
             physicians, or if *temperature* is not strictly positive.
     """
-    physician_set = set(physician_ids)
-
-    X_rows: list[list[float]] = []
-    y_values: list[float] = []
-    n_trials_values: list[int] = []
-
-    for record in decisions:
-        choice_1_votes = 0
-        choice_2_votes = 0
-        for pid in physician_set:
-            if pid not in record.models:
-                continue
-            s = record.models[pid].summary
-            choice_1_votes += s.choice_1_count
-            choice_2_votes += s.choice_2_count
-
-        total_votes = choice_1_votes + choice_2_votes
-        if total_votes == 0:
-            continue
-
-        p_c1 = choice_1_votes / total_votes
-
-        delta_row = [
-            float(
-                _get_alignment(record.case.choice_1, value)
-                - _get_alignment(record.case.choice_2, value)
-            )
-            for value in VALUE_NAMES
-        ]
-
-        X_rows.append(delta_row)
-        y_values.append(p_c1)
-        n_trials_values.append(total_votes)
-
-    if not X_rows:
+    tensor = as_tensor(decisions)
+
+    # Pool the votes of the requested physicians (unknown IDs contribute nothing)
+    votes = tensor.pooled_counts(physician_ids)
+    total_votes = votes[:, CHOICE_1] + votes[:, CHOICE_2]
+    include = total_votes > 0
+
+    if not include.any():
         raise ValueError("No valid cases found for the given physician subset")
 
-    X = np.array(X_rows, dtype=np.float64)
-    y = np.array(y_values, dtype=np.float64)
-    n_trials = np.array(n_trials_values, dtype=np.intp)
+    X = tensor.deltas[include]
+    y = votes[include, CHOICE_1] / total_votes[include]
+    n_trials = total_votes[include].astype(np.intp)
 
     coefficients, _, _, _ = _fit_logistic_regression(X, y, n_trials)
     return softmax_profile(coefficients, temperature)
 
 
+def _profile_vectors(
+    profiles: dict[str, dict[str, float]],
+    ids: list[str],
+) -> np.ndarray:
+    """Stack the profiles of *ids* into a (len(ids), n_values) array."""
+    value_names = list(profiles[ids[0]].keys())
+    return np.array(
+        [[profiles[mid][v] for v in value_names] for mid in ids],
+        dtype=np.float64,
+    )
+
+
+def _jsd_matrix(vectors: np.ndarray) -> np.ndarray:
+    """Squared base-2 Jensen-Shannon distance between every pair of rows.
+
+    Broadcasts the steps of ``scipy.spatial.distance.jensenshannon`` over
+    all pairs at once, so every entry equals
+    ``jensenshannon(vectors[i], vectors[j], base=2.0) ** 2`` exactly.
+    """
+    p = vectors / vectors.sum(axis=1, keepdims=True)
+    left, right = p[:, None, :], p[None, :, :]
+    m = (left + right) / 2.0
+    js = (rel_entr(left, m).sum(axis=2) + rel_entr(right, m).sum(axis=2)) / np.log(2.0)
+    # float_power squares through C pow like the scalar ``** 2`` does
+    # (np.square can differ in the last bit)
+    mat = np.float_power(np.sqrt(js / 2.0), 2)
+    np.fill_diagonal(mat, 0.0)
+    return mat
+
+
+def _mean_within_jsd_rows(
+    jsd_mat: np.ndarray,
+    groups: np.ndarray,
+    triu: tuple[np.ndarray, np.ndarray],
+) -> np.ndarray:
+    """Mean upper-triangle JSD within each row of *groups* (shape (k, n)).
+
+    Matches :func:`_mean_within_jsd` row by row: the flat gather keeps the
+    (k, n_pairs) block C-contiguous, so each row is summed in the same
+    order as the 1-D mean.
+    """
+    n = jsd_mat.shape[0]
+    # Flat offsets fit in int32 for any realistic number of profiles
+    groups = groups.astype(np.int32 if n * n <= np.iinfo(np.int32).max else np.intp)
+    flat = (groups * n)[:, triu[0]] + groups[:, triu[1]]
+    return jsd_mat.take(flat).mean(axis=1)
+
+
+def _chunk_rows(n_rows: int, group_size: int) -> int:
+    """Rows per resampling chunk for groups of *group_size* members."""
+    n_pairs = group_size * (group_size - 1) // 2
+    return max(1, min(n_rows, _RESAMPLE_CHUNK_ELEMENTS // max(n_pairs, 1)))
+
+
 def pairwise_jsd_matrix(
     profiles: dict[str, dict[str, float]],
 ) -> pd.DataFrame:
@@ -150,26 +178,12 @@ def pairwise_jsd_matrix(
         entries are 0.
     """
     ids = list(profiles.keys())
-    n = len(ids)
-
-    value_names = list(profiles[ids[0]].keys())
-    vectors = np.array(
-        [[profiles[mid][v] for v in value_names] for mid in ids],
-        dtype=np.float64,
-    )
-
-    mat = np.zeros((n, n), dtype=np.float64)
-    for i in range(n):
-        for j in range(i + 1, n):
-            jsd = jensenshannon(vectors[i], vectors[j], base=2.0) ** 2
-            mat[i, j] = jsd
-            mat[j, i] = jsd
-
+    mat = _jsd_matrix(_profile_vectors(profiles, ids))
     return pd.DataFrame(mat, index=ids, columns=ids)
 
 
 def lrt_uniform_null(
-    decisions: list[DecisionRecord],
+    decisions: DecisionData,
     model: str,
 ) -> dict:
     """Likelihood-ratio test against a uniform-prioritization null.
@@ -186,7 +200,8 @@ def lrt_uniform_null(
     χ²(3) under H0.
 
     Args:
-        decisions: Decision records from :func:`load_llm_decisions`.
+        decisions: Decision records from :func:`load_llm_decisions`, or a
+            ``DecisionTensor`` compiled from them.
         model: Model identifier (e.g. ``"openai/gpt-5.2"`` or
             ``"human_consensus"``).
 
@@ -247,9 +262,9 @@ def bootstrap_mean_jsd(
     replacement from each group independently, and the mean pairwise
     Jensen-Shannon divergence within each resampled group is recorded.
 
-    Pairwise JSD values are precomputed once; the bootstrap loop only
-    indexes into the cached matrix, so runtime scales with *n_bootstrap*
-    rather than the cost of recomputing divergences.
+    Pairwise JSD values are precomputed once. Resamples are drawn in
+    blocks and each block's within-group means are one gather and
+    reduction over the cached matrix.
 
     Args:
         profiles: Mapping of decision-maker ID to its softmax value
@@ -284,19 +299,7 @@ def bootstrap_mean_jsd(
     all_ids = list(dict.fromkeys(group_a_ids + group_b_ids))
     id_to_idx = {mid: i for i, mid in enumerate(all_ids)}
 
-    value_names = list(profiles[all_ids[0]].keys())
-    vectors = np.array(
-        [[profiles[mid][v] for v in value_names] for mid in all_ids],
-        dtype=np.float64,
-    )
-
-    n_all = len(all_ids)
-    jsd_mat = np.zeros((n_all, n_all), dtype=np.float64)
-    for i in range(n_all):
-        for j in range(i + 1, n_all):
-            d = jensenshannon(vectors[i], vectors[j], base=2.0) ** 2
-            jsd_mat[i, j] = d
-            jsd_mat[j, i] = d
+    jsd_mat = _jsd_matrix(_profile_vectors(profiles, all_ids))
 
     idx_a = np.array([id_to_idx[mid] for mid in group_a_ids])
     idx_b = np.array([id_to_idx[mid] for mid in group_b_ids])
@@ -310,15 +313,15 @@ def bootstrap_mean_jsd(
     samples_a = np.empty(n_bootstrap)
     samples_b = np.empty(n_bootstrap)
 
-    for b in range(n_bootstrap):
-        boot_a = idx_a[rng.integers(0, n_a, size=n_a)]
-        boot_b = idx_b[rng.integers(0, n_b, size=n_b)]
-
-        sub_a = jsd_mat[np.ix_(boot_a, boot_a)]
-        samples_a[b] = float(sub_a[triu_a].mean())
-
-        sub_b = jsd_mat[np.ix_(boot_b, boot_b)]
-        samples_b[b] = float(sub_b[triu_b].mean())
+    # One iteration draws n_a indices below n_a, then n_b below n_b. A
+    # per-column bound draws a whole block of iterations in the same order.
+    bounds = np.repeat([n_a, n_b], [n_a, n_b])
+    chunk = _chunk_rows(n_bootstrap, max(n_a, n_b))
+    for start in range(0, n_bootstrap, chunk):
+        stop = min(start + chunk, n_bootstrap)
+        draws = rng.integers(0, bounds, size=(stop - start, n_a + n_b))
+        samples_a[start:stop] = _mean_within_jsd_rows(jsd_mat, idx_a[draws[:, :n_a]], triu_a)
+        samples_b[start:stop] = _mean_within_jsd_rows(jsd_mat, idx_b[draws[:, n_a:]], triu_b)
 
     return {
         "group_a_mean": BootstrapResult(samples=samples_a),
@@ -353,8 +356,8 @@ def permutation_test_jsd(
     randomly reassigning decision makers to two groups of the original
     sizes and recomputing the statistic.
 
-    The JSD matrix is precomputed once; each permutation only indexes
-    into it, keeping runtime proportional to *n_permutations*.
+    The JSD matrix is precomputed once; permutations are evaluated in
+    blocks, each a single gather and reduction over the matrix.
 
     Args:
         profiles: Mapping of decision-maker ID to its softmax value
@@ -387,19 +390,7 @@ def permutation_test_jsd(
     all_ids = list(dict.fromkeys(group_a_ids + group_b_ids))
     id_to_idx = {mid: i for i, mid in enumerate(all_ids)}
 
-    value_names = list(profiles[all_ids[0]].keys())
-    vectors = np.array(
-        [[profiles[mid][v] for v in value_names] for mid in all_ids],
-        dtype=np.float64,
-    )
-
-    n_all = len(all_ids)
-    jsd_mat = np.zeros((n_all, n_all), dtype=np.float64)
-    for i in range(n_all):
-        for j in range(i + 1, n_all):
-            d = jensenshannon(vectors[i], vectors[j], base=2.0) ** 2
-            jsd_mat[i, j] = d
-            jsd_mat[j, i] = d
+    jsd_mat = _jsd_matrix(_profile_vectors(profiles, all_ids))
 
     idx_a = np.array([id_to_idx[mid] for mid in group_a_ids])
     idx_b = np.array([id_to_idx[mid] for mid in group_b_ids])
@@ -413,16 +404,24 @@ def permutation_test_jsd(
     )
 
     pooled = np.concatenate([idx_a, idx_b])
+    n_pooled = len(pooled)
     rng = np.random.default_rng(seed)
     null_dist = np.empty(n_permutations)
 
-    for p in range(n_permutations):
-        rng.shuffle(pooled)
-        perm_a = pooled[:n_a]
-        perm_b = pooled[n_a:]
-        null_dist[p] = abs(
-            _mean_within_jsd(jsd_mat, perm_a, triu_a)
-            - _mean_within_jsd(jsd_mat, perm_b, triu_b)
+    # Each permutation shuffles the previous one in place. The shuffles
+    # themselves are drawn a block at a time (rng.permuted consumes the
+    # stream exactly as repeated rng.shuffle calls) and then composed.
+    chunk = _chunk_rows(n_permutations, max(n_a, n_b))
+    for start in range(0, n_permutations, chunk):
+        stop = min(start + chunk, n_permutations)
+        shuffles = rng.permuted(np.tile(np.arange(n_pooled), (stop - start, 1)), axis=1)
+        block = np.empty((stop - start, n_pooled), dtype=pooled.dtype)
+        for k, shuffle in enumerate(shuffles):
+            pooled = pooled[shuffle]
+            block[k] = pooled
+        null_dist[start:stop] = np.abs(
+            _mean_within_jsd_rows(jsd_mat, block[:, :n_a], triu_a)
+            - _mean_within_jsd_rows(jsd_mat, block[:, n_a:], triu_b)
         )
 
     p_value = float(np.mean(null_dist >= observed_diff))
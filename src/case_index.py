@@ -0,0 +1,314 @@
+"""Persistent index of case files in ``data/cases``.
+
+Case files are named ``case_{uuid}_{hash}.json`` and every consumer used to
+glob the directory and parse the JSON to find one case or to read its
+status. ``CaseIndex`` keeps a compact JSON manifest next to the case files
+(``.case_index.json``) that maps each file to its case_id, status, content
+hash, mtime, size and whether it has a final case. The manifest is refreshed
+incrementally: only files whose mtime or size changed are re-parsed.
+
+Lookups by case_id only re-stat the matching files (plus the directory
+itself, to notice added or removed files), so they stay O(1) in the number
+of cases. Listing queries stat every file but never re-parse unchanged ones.
+
+Example:
+    >>> from src.case_index import get_case_index
+    >>> index = get_case_index("data/cases")
+    >>> index.path_for("8c1c8374-ab03-4bf7-a4ef-b5b225422685")
+    PosixPath('data/cases/case_8c1c8374-..._a86abbf6ec41.json')
+    >>> approved = index.case_ids(status="approved", require_final_case=True)
+"""
+
+import json
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.response_models.record import CaseRecord
+
+INDEX_FILENAME = ".case_index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class CaseIndexEntry:
+    """Metadata for one case file.
+
+    Attributes:
+        case_id: Case ID stored in the file (falls back to the ID in the filename)
+        filename: Name of the case file inside the cases directory
+        status: Raw status string from the file (None if missing)
+        content_hash: Hash of the final case content (None without a final case)
+        has_final_case: Whether the last refinement step is a BenchmarkCandidate
+        valid: Whether the file parses as a ``CaseRecord``
+        mtime_ns: File modification time in nanoseconds when indexed
+        size: File size in bytes when indexed
+    """
+    case_id: str
+    filename: str
+    status: str | None
+    content_hash: str | None
+    has_final_case: bool
+    valid: bool
+    mtime_ns: int
+    size: int
+
+
+def _case_id_from_filename(filename: str) -> str:
+    """Extract the case ID from ``case_{uuid}_{hash}.json``."""
+    stem = filename[len("case_"):-len(".json")]
+    case_id, sep, _ = stem.rpartition("_")
+    return case_id if sep else stem
+
+
+def _index_file(path: Path, stat: os.stat_result) -> CaseIndexEntry:
+    """Parse a case file and build its index entry."""
+    entry = CaseIndexEntry(
+        case_id=_case_id_from_filename(path.name),
+        filename=path.name,
+        status=None,
+        content_hash=None,
+        has_final_case=False,
+        valid=False,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"Warning: Failed to load case from {path}: {e}")
+        return entry
+
+    entry.case_id = data.get("case_id") or entry.case_id
+    entry.status = data.get("status")
+    try:
+        record = CaseRecord(**data)
+    except Exception as e:
+        print(f"Warning: Failed to load case from {path}: {e}")
+        return entry
+
+    entry.valid = True
+    entry.status = record.status.value
+    if record.final_case:
+        entry.has_final_case = True
+        entry.content_hash = record.compute_content_hash()
+    return entry
+
+
+class CaseIndex:
+    """Incrementally refreshed index of a cases directory.
+
+    Use ``get_case_index`` rather than constructing this directly so that all
+    callers in a process share one instance per directory.
+
+    Args:
+        cases_dir: Directory containing ``case_*.json`` files
+        index_path: Where to store the manifest (defaults to
+            ``{cases_dir}/.case_index.json``)
+    """
+
+    def __init__(self, cases_dir: str | Path = "data/cases", index_path: str | Path | None = None):
+        self.cases_dir = Path(cases_dir)
+        self.index_path = Path(index_path) if index_path else self.cases_dir / INDEX_FILENAME
+        self._entries: dict[str, CaseIndexEntry] = {}
+        self._by_id: dict[str, list[str]] = {}
+        self._dir_mtime_ns: int | None = None
+        self._lock = threading.RLock()
+        self._load_manifest()
+
+    def _load_manifest(self) -> None:
+        """Read a previously saved manifest, ignoring it if unreadable."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != INDEX_VERSION:
+                return
+            entries = {name: CaseIndexEntry(**e) for name, e in manifest["entries"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self._entries = entries
+        self._rebuild_id_map()
+
+    def _save_manifest(self) -> None:
+        """Atomically write the manifest next to the case files."""
+        manifest = {
+            "version": INDEX_VERSION,
+            "entries": {name: asdict(e) for name, e in sorted(self._entries.items())},
+        }
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.index_path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as f:
+                json.dump(manifest, f, separators=(",", ":"))
+                tmp_path = Path(f.name)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # A read-only checkout still gets a working in-memory index
+            print(f"Warning: Could not write case index {self.index_path}: {e}")
+
+    def _rebuild_id_map(self) -> None:
+        by_id: dict[str, list[str]] = {}
+        for name in sorted(self._entries):
+            by_id.setdefault(_case_id_from_filename(name), []).append(name)
+        self._by_id = by_id
+
+    def _dir_mtime(self) -> int:
+        return self.cases_dir.stat().st_mtime_ns
+
+    def refresh(self) -> int:
+        """Re-scan the directory, re-parsing only new or modified files.
+
+        A missing directory is treated as empty.
+
+        Returns:
+            Number of entries added, updated or removed
+        """
+        with self._lock:
+            if not self.cases_dir.exists():
+                changed = len(self._entries)
+                self._entries.clear()
+                self._by_id.clear()
+                self._dir_mtime_ns = None
+                return changed
+            dir_mtime = self._dir_mtime()
+            seen = set()
+            changed = 0
+            with os.scandir(self.cases_dir) as it:
+                for dirent in it:
+                    name = dirent.name
+                    if not (name.startswith("case_") and name.endswith(".json")) or not dirent.is_file():
+                        continue
+                    seen.add(name)
+                    stat = dirent.stat()
+                    entry = self._entries.get(name)
+                    if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                        continue
+                    self._entries[name] = _index_file(Path(dirent.path), stat)
+                    changed += 1
+
+            for name in set(self._entries) - seen:
+                del self._entries[name]
+                changed += 1
+
+            self._dir_mtime_ns = dir_mtime
+            if changed:
+                self._rebuild_id_map()
+                self._save_manifest()
+            elif not self.index_path.exists():
+                self._save_manifest()
+            return changed
+
+    def _refresh_files(self, case_id: str) -> list[CaseIndexEntry]:
+        """Bring the entries for one case up to date and return them."""
+        with self._lock:
+            if not self.cases_dir.exists():
+                return []
+            if self._dir_mtime_ns != self._dir_mtime():
+                # Files were added, removed or renamed since the last scan
+                self.refresh()
+                return [self._entries[n] for n in self._by_id.get(case_id, [])]
+
+            changed = False
+            entries = []
+            for name in self._by_id.get(case_id, []):
+                path = self.cases_dir / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    del self._entries[name]
+                    changed = True
+                    continue
+                entry = self._entries[name]
+                if entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+                    entry = self._entries[name] = _index_file(path, stat)
+                    changed = True
+                entries.append(entry)
+
+            if changed:
+                self._rebuild_id_map()
+                self._save_manifest()
+            return entries
+
+    def lookup(self, case_id: str) -> list[CaseIndexEntry]:
+        """All files whose name matches ``case_{case_id}_*.json``, oldest first.
+
+        Args:
+            case_id: The case UUID (without prefix or suffix)
+
+        Returns:
+            Matching entries sorted by modification time (empty if none)
+        """
+        return sorted(self._refresh_files(case_id), key=lambda e: e.mtime_ns)
+
+    def get(self, case_id: str) -> CaseIndexEntry | None:
+        """Entry for the most recently modified file of a case, if any."""
+        entries = self.lookup(case_id)
+        return entries[-1] if entries else None
+
+    def path_for(self, case_id: str) -> Path | None:
+        """Path of the most recently modified file of a case, if any."""
+        entry = self.get(case_id)
+        return self.cases_dir / entry.filename if entry else None
+
+    def paths_for(self, case_id: str) -> list[Path]:
+        """Paths of every file for a case, oldest first."""
+        return [self.cases_dir / e.filename for e in self.lookup(case_id)]
+
+    def entries(self) -> list[CaseIndexEntry]:
+        """All entries sorted by filename, after an incremental refresh."""
+        with self._lock:
+            self.refresh()
+            return [self._entries[name] for name in sorted(self._entries)]
+
+    def paths(self) -> list[Path]:
+        """All case file paths sorted by filename."""
+        return [self.cases_dir / e.filename for e in self.entries()]
+
+    def case_ids(
+        self,
+        status: str | None = None,
+        require_final_case: bool = False,
+        valid_only: bool = True,
+    ) -> list[str]:
+        """Case IDs matching the given filters, in filename order.
+
+        Args:
+            status: Only include cases with this status (e.g., 'approved')
+            require_final_case: Only include cases whose last step is a BenchmarkCandidate
+            valid_only: Only include files that parse as a ``CaseRecord``
+
+        Returns:
+            List of case IDs
+        """
+        return [
+            e.case_id
+            for e in self.entries()
+            if (not valid_only or e.valid)
+            and (status is None or e.status == str(status))
+            and (not require_final_case or e.has_final_case)
+        ]
+
+
+_INDEXES: dict[Path, CaseIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_case_index(cases_dir: str | Path = "data/cases") -> CaseIndex:
+    """Return the process-wide ``CaseIndex`` for a cases directory.
+
+    Args:
+        cases_dir: Directory containing ``case_*.json`` files
+
+    Returns:
+        Shared CaseIndex instance (created on first use)
+    """
+    key = Path(cases_dir).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = CaseIndex(cases_dir)
+        return index
@@ -14,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from src.case_index import get_case_index
 from src.embeddings.base import BaseEmbeddingStore
 
 
@@ -385,17 +386,17 @@ class CaseEmbeddingStore(BaseEmbeddingStore):
         if not self.cases_dir.exists():
             return cases
         
-        for filepath in self.cases_dir.glob("case_*.json"):
+        for entry in get_case_index(self.cases_dir).entries():
+            # Filter by status if include_statuses is specified (from the
+            # index, so files with other statuses are never opened)
+            if include_statuses and (entry.status or '') not in include_statuses:
+                continue
+            
+            filepath = self.cases_dir / entry.filename
             try:
                 with open(filepath, 'r', encoding='utf-8') as f:
                     case_data = json.load(f)
                 
-                # Filter by status if include_statuses is specified
-                if include_statuses:
-                    case_status = case_data.get('status', '')
-                    if case_status not in include_statuses:
-                        continue
-                
                 # Get the final refinement iteration (last in refinement_history)
                 refinement_history = case_data.get('refinement_history', [])
                 if not refinement_history:
@@ -556,17 +557,8 @@ class CaseEmbeddingStore(BaseEmbeddingStore):
         # Build a mapping of case_id -> status for all cases in the directory
         case_status_map: Dict[str, str] = {}
         if self.cases_dir.exists():
-            for filepath in self.cases_dir.glob("case_*.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        case_data = json.load(f)
-                    case_id = case_data.get('case_id', '')
-                    status = case_data.get('status', '')
-                    if case_id:
-                        case_status_map[case_id] = status
-                except (json.JSONDecodeError, KeyError):
-                    # Skip malformed files
-                    continue
+            for entry in get_case_index(self.cases_dir).entries():
+                case_status_map[entry.case_id] = entry.status or ''
         
         # Identify embeddings to prune
         pruned_ids = []
@@ -23,7 +23,6 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 from omegaconf import OmegaConf
-from all_the_llms import LLM
 from tqdm import tqdm
 
 # Suppress litellm logging
@@ -37,6 +36,7 @@ logging.getLogger("LiteLLM").setLevel(logging.ERROR)
 logging.getLogger("litellm").setLevel(logging.ERROR)
 
 from src.generator import generate_single_case
+from src.llm_cache import build_llm
 from src.prompt_manager import PromptManager
 from src.embeddings import CaseEmbeddingStore
 
@@ -128,7 +128,7 @@ def main():
         return
 
     # Initialize LLM and prompt manager
-    llm = LLM(cfg.model_name)
+    llm = build_llm(cfg.model_name, cfg.get('cache'))
     pm = PromptManager()
 
     # Initialize diversity gate
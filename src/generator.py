@@ -8,6 +8,7 @@ from omegaconf import DictConfig, OmegaConf
 from all_the_llms import LLM
 from dotenv import load_dotenv
 from pydantic import ValidationError
+from src.llm_cache import build_llm
 from src.prompt_manager import PromptManager
 
 # Suppress litellm logging
@@ -504,7 +505,7 @@ def main(cfg: DictConfig) -> None:
     """
     load_dotenv()
 
-    llm = LLM(cfg.model_name)
+    llm = build_llm(cfg.model_name, cfg.get('cache'))
     pm = PromptManager()
 
     # Initialize diversity gate
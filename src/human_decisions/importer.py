@@ -16,6 +16,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from src.case_index import get_case_index
 from src.human_decisions.models import ParticipantInfo, ParticipantRegistry
 from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
 from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
@@ -171,7 +172,7 @@ def _load_case_from_llm_decisions(case_id: str, llm_decisions_dir: Path) -> Benc
 def _load_case_from_cases_dir(case_id: str, cases_dir: Path) -> BenchmarkCandidate | None:
     """Load a case from the cases directory.
     
-    Searches for a case file matching the pattern case_{uuid}_*.json
+    Looks up the case file (case_{uuid}_*.json) in the case index
     and extracts the BenchmarkCandidate from the final refinement step.
     
     Args:
@@ -181,16 +182,13 @@ def _load_case_from_cases_dir(case_id: str, cases_dir: Path) -> BenchmarkCandida
     Returns:
         BenchmarkCandidate if found, None otherwise
     """
-    # Case files are named: case_{uuid}_{hash}.json
-    pattern = f"case_{case_id}_*.json"
-    matches = list(cases_dir.glob(pattern))
+    # Case files are named: case_{uuid}_{hash}.json; there should only be
+    # one per UUID, so take the most recently modified if several exist
+    case_file = get_case_index(cases_dir).path_for(case_id)
     
-    if not matches:
+    if case_file is None:
         return None
     
-    # Use the first match (there should only be one per UUID)
-    case_file = matches[0]
-    
     with open(case_file, "r", encoding="utf-8") as f:
         data = json.load(f)
     
@@ -0,0 +1,287 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+``CachedLLM`` wraps an ``all_the_llms.LLM`` and stores every ``completion``
+and ``structured_completion`` result under a key derived from the model,
+messages, sampling kwargs (temperature etc.), sample index and, for structured
+calls, the JSON schema of the response model. Re-running identical prompts
+(re-parsing, resuming a crashed generation, CI reruns) then returns the
+stored response instead of paying for another API call.
+
+The sample index distinguishes repeated calls with an identical prompt, e.g.
+the independent runs per model in the decision runner. Callers that know the
+run index pass it explicitly; otherwise the n-th identical call made by the
+process gets index n, so replaying a pipeline from the start reproduces the
+same responses in order.
+
+The cache is bounded by total size on disk and evicts least recently used
+entries. In ``replay`` mode a miss raises ``CacheMissError`` instead of
+calling the API, and no underlying ``LLM`` needs to be constructed at all.
+
+Example:
+    >>> llm = build_llm("openai/gpt-4o-mini", cfg.get("cache"))
+    >>> llm.completion(messages, temperature=1.0, sample_index=0)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ResponseModelT = TypeVar("ResponseModelT", bound=BaseModel)
+
+CACHE_MODES = ("read_write", "replay")
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+class ResponseCache:
+    """Size-bounded LRU store of JSON payloads keyed by content hash.
+
+    Entries live at ``{cache_dir}/{key[:2]}/{key}.json``. Recency is tracked
+    in memory and persisted through file mtimes, so LRU order survives
+    restarts.
+
+    Args:
+        cache_dir: Directory holding the cache entries
+        max_bytes: Total size above which the least recently used entries are evicted
+    """
+
+    def __init__(self, cache_dir: str | Path = "data/llm_cache", max_bytes: int = 1024 ** 3):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._scan()
+
+    def _scan(self) -> None:
+        """Rebuild the LRU order from the entries already on disk."""
+        found = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.json"):
+                stat = path.stat()
+                found.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self.total_bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored payload for a key, or None on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                # Removed by another process or truncated; treat as a miss
+                self.total_bytes -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, payload: Any) -> None:
+        """Store a JSON-serializable payload, evicting old entries if needed."""
+        path = self._path(key)
+        data = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as f:
+                f.write(data)
+                tmp_path = Path(f.name)
+            os.replace(tmp_path, path)
+
+            size = path.stat().st_size
+            self.total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits (keeps the newest)."""
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def cache_key(
+    model_name: str,
+    messages: list[dict],
+    sample_index: int,
+    kwargs: dict | None = None,
+    response_model: type[BaseModel] | None = None,
+) -> str:
+    """SHA-256 over everything that determines an LLM response."""
+    content = {
+        "model": model_name,
+        "messages": messages,
+        "kwargs": kwargs or {},
+        "sample_index": sample_index,
+        "schema": response_model.model_json_schema() if response_model is not None else None,
+    }
+    encoded = json.dumps(content, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CachedLLM:
+    """Drop-in proxy for ``LLM`` that serves repeated requests from a cache.
+
+    Args:
+        llm: The wrapped LLM (may be None in replay mode)
+        cache: Backing ``ResponseCache``
+        model_name: Model id used in cache keys; defaults to ``llm.model_name``.
+            Pass the configured name (e.g. 'openai/gpt-4o') so keys do not
+            depend on how the router resolved it.
+        mode: 'read_write' (call the API on a miss and store the result) or
+            'replay' (raise ``CacheMissError`` on a miss)
+    """
+
+    def __init__(self, llm: Any | None, cache: ResponseCache, model_name: str | None = None, mode: str = "read_write"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode: '{mode}'. Must be one of {CACHE_MODES}")
+        if llm is None and mode != "replay":
+            raise ValueError("An LLM is required unless the cache is in replay mode")
+        self.llm = llm
+        self.cache = cache
+        self.mode = mode
+        self.model_name = model_name or llm.model_name
+        self.hits = 0
+        self.misses = 0
+        self._occurrences: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, messages, sample_index, kwargs, response_model=None) -> tuple[str, str | None]:
+        """Cache key for a request, plus the occurrence counter to advance on success."""
+        if sample_index is not None:
+            return cache_key(self.model_name, messages, sample_index, kwargs, response_model), None
+        # The n-th identical request in this process gets sample index n. The
+        # counter only advances once a response is obtained, so a retry after
+        # a failed call reuses the same index.
+        base = cache_key(self.model_name, messages, -1, kwargs, response_model)
+        with self._lock:
+            sample_index = self._occurrences.get(base, 0)
+        return cache_key(self.model_name, messages, sample_index, kwargs, response_model), base
+
+    def _advance(self, base: str | None) -> None:
+        if base is not None:
+            with self._lock:
+                self._occurrences[base] = self._occurrences.get(base, 0) + 1
+
+    def _lookup(self, key: str) -> Any | None:
+        payload = self.cache.get(key)
+        with self._lock:
+            if payload is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if payload is None and self.mode == "replay":
+            raise CacheMissError(f"No cached response for {self.model_name} (key {key[:12]})")
+        return payload
+
+    def completion(self, messages: list[dict], sample_index: int | None = None, **kwargs):
+        """Cached ``LLM.completion``; ``sample_index`` selects among repeated samples."""
+        key, base = self._key(messages, sample_index, kwargs)
+        payload = self._lookup(key)
+        if payload is not None:
+            self._advance(base)
+            if payload["kind"] == "model_response":
+                from litellm import ModelResponse
+                return ModelResponse(**payload["data"])
+            return payload["data"]
+
+        response = self.llm.completion(messages=messages, **kwargs)
+        if hasattr(response, "model_dump"):
+            self.cache.put(key, {"kind": "model_response", "data": response.model_dump(mode="json")})
+        else:
+            self.cache.put(key, {"kind": "dict", "data": dict(response)})
+        self._advance(base)
+        return response
+
+    def structured_completion(
+        self,
+        messages: list[dict],
+        response_model: type[ResponseModelT],
+        max_retries: int = 3,
+        sample_index: int | None = None,
+        **kwargs,
+    ) -> ResponseModelT:
+        """Cached ``LLM.structured_completion``; the response schema is part of the key."""
+        key, base = self._key(messages, sample_index, kwargs, response_model)
+        payload = self._lookup(key)
+        if payload is not None:
+            self._advance(base)
+            return response_model.model_validate(payload["data"])
+
+        result = self.llm.structured_completion(
+            messages=messages, response_model=response_model, max_retries=max_retries, **kwargs
+        )
+        self.cache.put(key, {"kind": "structured", "data": result.model_dump(mode="json")})
+        self._advance(base)
+        return result
+
+
+_CACHES: dict[Path, ResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(cache_dir: str | Path, max_bytes: int) -> ResponseCache:
+    """Process-wide ``ResponseCache`` for a directory (shared by all wrapped LLMs)."""
+    key = Path(cache_dir).resolve()
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = ResponseCache(cache_dir, max_bytes)
+        return cache
+
+
+def build_llm(model_name: str, cache_cfg: Any | None = None):
+    """Create an ``LLM``, wrapped in ``CachedLLM`` when the cache is enabled.
+
+    Args:
+        model_name: Model identifier (e.g., 'openai/gpt-4o-mini')
+        cache_cfg: The ``cache`` config section (enabled, dir, max_size_mb, mode),
+            or None to disable caching
+
+    Returns:
+        A plain ``LLM`` if caching is disabled, otherwise a ``CachedLLM``.
+        In replay mode no ``LLM`` is constructed, so no network access is needed.
+    """
+    from all_the_llms import LLM
+
+    if not cache_cfg or not cache_cfg.get("enabled", False):
+        return LLM(model_name)
+
+    mode = cache_cfg.get("mode", "read_write")
+    cache = get_response_cache(
+        cache_cfg.get("dir", "data/llm_cache"),
+        int(float(cache_cfg.get("max_size_mb", 1024)) * 1024 ** 2),
+    )
+    llm = None if mode == "replay" else LLM(model_name)
+    return CachedLLM(llm, cache, model_name=model_name, mode=mode)
@@ -11,18 +11,27 @@ from src.llm_decisions.models import (
     ModelDecisionData,
     DecisionRecord,
 )
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.heuristic_parser import HeuristicDecision, heuristic_parse
 from src.llm_decisions.parser import parse_response
+from src.llm_decisions.rate_limit import ProviderLimits, RateLimiter
+from src.llm_decisions.sampling import StoppingRule
 from src.llm_decisions.runner import (
     get_approved_case_ids,
     load_case_by_id,
     sanitize_model_name,
     get_decision_record,
     save_decision_record,
+    append_run,
+    compact_decision_record,
     get_or_create_model_data,
     call_target_llm,
+    supports_multi_sample,
     get_case_ids_from_config,
     run_evaluation,
 )
+from src.llm_decisions.engine import ConcurrencyLimits, run_grid_async
+from src.llm_decisions.batch import LocalBatchServer, run_batch
 
 __all__ = [
     "ParsedDecision",
@@ -30,14 +39,27 @@ __all__ = [
     "RunSummary",
     "ModelDecisionData",
     "DecisionRecord",
+    "RunJournal",
+    "HeuristicDecision",
+    "heuristic_parse",
     "parse_response",
+    "ProviderLimits",
+    "RateLimiter",
+    "StoppingRule",
     "get_approved_case_ids",
     "load_case_by_id",
     "sanitize_model_name",
     "get_decision_record",
     "save_decision_record",
+    "append_run",
+    "compact_decision_record",
     "get_or_create_model_data",
     "call_target_llm",
+    "supports_multi_sample",
     "get_case_ids_from_config",
     "run_evaluation",
+    "ConcurrencyLimits",
+    "run_grid_async",
+    "LocalBatchServer",
+    "run_batch",
 ]
@@ -0,0 +1,636 @@
+"""Provider batch-API submission mode for large evaluation grids.
+
+Interactive calls are the slowest and most expensive way to fill a full
+case × model × run grid. In batch mode every missing cell is compiled into
+one JSONL request line (OpenAI batch format), the lines are grouped into one
+batch job per model and submitted to the provider's batch API. Jobs are
+tracked in a manifest on disk, so the client does not have to stay alive
+while the provider works through them.
+
+Each invocation is idempotent:
+
+1. Poll the open jobs in the manifest and ingest the finished ones. Responses
+   go through the same parse step as interactive runs and are appended to the
+   ``DecisionRecord`` through the run journal.
+2. Compile the cells that are still missing and not already part of an open
+   job, and submit them.
+3. With ``batch.wait``, keep polling until every open job of the current
+   backend has been ingested, or until ``batch.max_wait`` seconds have passed.
+
+With adaptive sampling, each invocation submits the next step of runs for
+the pairs whose stopping rule is not met yet, so a sweep converges over
+several invocations.
+
+Failed or expired requests are simply missing from the records afterwards,
+so the next invocation resubmits them. A job that cannot be polled
+``batch.max_poll_failures`` times in a row (e.g. deleted on the provider
+side) is marked failed and its cells are resubmitted as well.
+
+Open jobs of another backend (e.g. after switching ``batch.backend`` in the
+same ``batch.dir``) are not polled; they are reported as orphaned and their
+cells are compiled again for the current backend.
+
+Models whose provider has no batch API in the backend (``supports``) are not
+compiled into jobs; the runner evaluates them interactively in the same
+invocation (``batch.fallback_mode``, see ``interactive_models``).
+
+Backends:
+
+- ``LiteLLMBatchBackend`` uses the provider batch APIs through litellm
+  (``create_file`` / ``create_batch`` / ``retrieve_batch`` / ``file_content``)
+- ``LocalBatchServer`` is a file-based stand-in that executes jobs with a
+  local responder, so the whole mode can be run and tested without network
+  access (e.g. against the response cache in replay mode)
+
+Files: ``{batch.dir}/{output dir name}/jobs.json`` (manifest) and
+``requests/*.jsonl`` (submitted request files) next to it.
+"""
+
+import json
+import shutil
+from abc import ABC, abstractmethod
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import litellm
+from omegaconf import DictConfig
+from tqdm import tqdm
+
+from all_the_llms import LLM
+from src.llm_cache import build_llm
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.models import RunResult
+from src.llm_decisions.rate_limit import RateLimiter, provider_for
+from src.llm_decisions.sampling import StoppingRule, runs_to_request, target_runs
+from src.llm_decisions.runner import (
+    _parse_with_retry,
+    _sync_record_prompts,
+    append_run,
+    compact_decision_record,
+    get_decision_record,
+    get_or_create_model_data,
+    sanitize_model_name,
+)
+from src.prompt_manager import PromptManager
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+MANIFEST_NAME = "jobs.json"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def make_custom_id(case_id: str, model_name: str, run_index: int) -> str:
+    """Request ID of a grid cell ('case::openai/gpt-4o::2')."""
+    return f"{case_id}::{model_name}::{run_index}"
+
+
+def split_custom_id(custom_id: str) -> tuple[str, str, int]:
+    """Inverse of ``make_custom_id``."""
+    case_id, model_name, run_index = custom_id.split("::")
+    return case_id, model_name, int(run_index)
+
+
+def _response_to_dict(response: Any) -> dict:
+    if hasattr(response, "model_dump"):
+        return response.model_dump()
+    if hasattr(response, "dict"):
+        return response.dict()
+    return dict(response)
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(mode="w", dir=path.parent, delete=False, suffix=".tmp") as tmp_file:
+        tmp_file.write(text)
+        tmp_file.flush()
+        tmp_path = tmp_file.name
+    shutil.move(tmp_path, path)
+
+
+@dataclass
+class BatchJob:
+    """A submitted batch job, as stored in the manifest.
+
+    Attributes:
+        job_id: ID assigned by the backend
+        model: Target model of every request in the job
+        backend: Name of the backend the job was submitted to
+        input_path: Request JSONL file that was submitted
+        n_requests: Number of request lines in the job
+        submitted_at: Submission time (Unix seconds)
+        status: Last polled status ('in_progress', 'completed', 'failed', ...)
+        ingested: Whether the job is finished with (results ingested or discarded)
+        poll_failures: Consecutive polls that raised an error
+    """
+    job_id: str
+    model: str
+    backend: str
+    input_path: str
+    n_requests: int
+    submitted_at: float
+    status: str = "in_progress"
+    ingested: bool = False
+    poll_failures: int = 0
+
+
+class BatchManifest:
+    """On-disk list of batch jobs for one output directory."""
+
+    def __init__(self, batch_dir: str | Path):
+        self.batch_dir = Path(batch_dir)
+        self.path = self.batch_dir / MANIFEST_NAME
+        self.jobs: list[BatchJob] = []
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.jobs = [BatchJob(**job) for job in json.load(f).get("jobs", [])]
+
+    def open_jobs(self, backend: str | None = None) -> list[BatchJob]:
+        """Jobs whose results have not been ingested yet (of ``backend``, if given)."""
+        return [job for job in self.jobs if not job.ingested and backend in (None, job.backend)]
+
+    def open_custom_ids(self, backend: str | None = None) -> set[str]:
+        """Request IDs that are part of an open job (and must not be resubmitted)."""
+        custom_ids = set()
+        for job in self.open_jobs(backend):
+            custom_ids.update(line["custom_id"] for line in _read_jsonl(Path(job.input_path)))
+        return custom_ids
+
+    def add(self, job: BatchJob) -> None:
+        self.jobs.append(job)
+        self.save()
+
+    def save(self) -> None:
+        _atomic_write_text(self.path, json.dumps({"jobs": [asdict(job) for job in self.jobs]}, indent=2))
+
+
+class BatchBackend(ABC):
+    """Interface of a batch backend.
+
+    Result lines follow the OpenAI batch output format: ``custom_id`` plus
+    either ``response`` (``status_code`` and the completion ``body``) or
+    ``error``.
+    """
+
+    name = "base"
+
+    def supports(self, model_name: str) -> bool:
+        """Whether ``model_name`` can be submitted as a batch job."""
+        return True
+
+    def request_model(self, model_name: str) -> str:
+        """Model name to put in the request body for ``model_name``."""
+        return model_name
+
+    @abstractmethod
+    def submit(self, model_name: str, input_path: Path) -> str:
+        """Submit a request file and return the job ID."""
+
+    @abstractmethod
+    def status(self, job_id: str, model_name: str) -> str:
+        """Normalized status: 'in_progress', 'completed', 'failed', 'expired' or 'cancelled'."""
+
+    @abstractmethod
+    def results(self, job_id: str, model_name: str) -> list[dict]:
+        """Result lines of a completed job."""
+
+
+class LiteLLMBatchBackend(BatchBackend):
+    """Provider batch APIs through litellm.
+
+    The provider is the prefix of the model id ('openai/gpt-4o' -> 'openai');
+    the rest of the id is sent as the model name in each request. Only
+    providers for which litellm implements both file upload and batch
+    creation are supported.
+    """
+
+    name = "litellm"
+    BATCH_PROVIDERS = frozenset({"openai", "azure"})
+    _STATUS_MAP = {
+        "validating": "in_progress",
+        "in_progress": "in_progress",
+        "finalizing": "in_progress",
+        "cancelling": "in_progress",
+        "completed": "completed",
+        "failed": "failed",
+        "expired": "expired",
+        "cancelled": "cancelled",
+    }
+
+    def supports(self, model_name: str) -> bool:
+        return provider_for(model_name) in self.BATCH_PROVIDERS
+
+    def request_model(self, model_name: str) -> str:
+        return model_name.split("/", 1)[1] if "/" in model_name else model_name
+
+    def submit(self, model_name: str, input_path: Path) -> str:
+        provider = provider_for(model_name)
+        with open(input_path, "rb") as f:
+            file_obj = litellm.create_file(file=f, purpose="batch", custom_llm_provider=provider)
+        batch = litellm.create_batch(
+            completion_window="24h",
+            endpoint=BATCH_ENDPOINT,
+            input_file_id=file_obj.id,
+            custom_llm_provider=provider,
+        )
+        return batch.id
+
+    def status(self, job_id: str, model_name: str) -> str:
+        batch = litellm.retrieve_batch(job_id, custom_llm_provider=provider_for(model_name))
+        return self._STATUS_MAP.get(batch.status, "in_progress")
+
+    def results(self, job_id: str, model_name: str) -> list[dict]:
+        provider = provider_for(model_name)
+        batch = litellm.retrieve_batch(job_id, custom_llm_provider=provider)
+        lines = []
+        for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+            if not file_id:
+                continue
+            content = litellm.file_content(file_id=file_id, custom_llm_provider=provider).content
+            lines.extend(json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip())
+        return lines
+
+
+class LocalBatchServer(BatchBackend):
+    """File-based stand-in for a provider batch API.
+
+    Each job is a directory under ``root`` holding the submitted requests,
+    a status file and, once processed, the output lines. A job is processed
+    the first time it is polled, by calling ``responder`` with each request
+    body (a dict with ``model``, ``messages`` and ``temperature``) to get the
+    completion. Without a responder jobs stay in progress until
+    ``process(job_id, responder)`` is called, e.g. from another process.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str | Path, responder: Callable[[dict], Any] | None = None):
+        self.root = Path(root)
+        self.responder = responder
+
+    def _job_dir(self, job_id: str) -> Path:
+        return self.root / job_id
+
+    def _read_status(self, job_id: str) -> str:
+        path = self._job_dir(job_id) / "status.json"
+        if not path.exists():
+            raise ValueError(f"Unknown local batch job: {job_id}")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["status"]
+
+    def _write_status(self, job_id: str, status: str) -> None:
+        _atomic_write_text(self._job_dir(job_id) / "status.json", json.dumps({"status": status}))
+
+    def submit(self, model_name: str, input_path: Path) -> str:
+        job_id = f"local-batch-{uuid.uuid4().hex[:12]}"
+        job_dir = self._job_dir(job_id)
+        job_dir.mkdir(parents=True)
+        shutil.copyfile(input_path, job_dir / "input.jsonl")
+        self._write_status(job_id, "in_progress")
+        return job_id
+
+    def process(self, job_id: str, responder: Callable[[dict], Any]) -> None:
+        """Answer every request of a job and mark it completed."""
+        output = []
+        for line in _read_jsonl(self._job_dir(job_id) / "input.jsonl"):
+            try:
+                body = _response_to_dict(responder(line["body"]))
+                output.append({"custom_id": line["custom_id"], "response": {"status_code": 200, "body": body}, "error": None})
+            except Exception as e:
+                output.append({"custom_id": line["custom_id"], "response": None, "error": {"message": str(e)}})
+        _atomic_write_text(self._job_dir(job_id) / "output.jsonl", "".join(json.dumps(o) + "\n" for o in output))
+        self._write_status(job_id, "completed")
+
+    def status(self, job_id: str, model_name: str) -> str:
+        status = self._read_status(job_id)
+        if status == "in_progress" and self.responder is not None:
+            self.process(job_id, self.responder)
+            status = "completed"
+        return status
+
+    def results(self, job_id: str, model_name: str) -> list[dict]:
+        return _read_jsonl(self._job_dir(job_id) / "output.jsonl")
+
+
+def llm_responder(cache_cfg: Any | None = None) -> Callable[[dict], Any]:
+    """Responder for ``LocalBatchServer`` that answers with ``build_llm`` models.
+
+    With the response cache in replay mode this needs no network access.
+    """
+    llms: dict[str, LLM] = {}
+
+    def respond(body: dict) -> Any:
+        model_name = body["model"]
+        if model_name not in llms:
+            llms[model_name] = build_llm(model_name, cache_cfg)
+        return llms[model_name].completion(messages=body["messages"], temperature=body["temperature"])
+
+    return respond
+
+
+def backend_from_config(cfg: DictConfig, batch_dir: Path) -> BatchBackend:
+    """Build the backend named in ``batch.backend``."""
+    name = (cfg.get("batch", None) or {}).get("backend", "litellm")
+    if name == "litellm":
+        return LiteLLMBatchBackend()
+    if name == "local":
+        return LocalBatchServer(batch_dir / "local_server", responder=llm_responder(cfg.get("cache")))
+    raise ValueError(f"Invalid batch backend: '{name}'. Must be 'litellm' or 'local'")
+
+
+def interactive_models(cfg: DictConfig, backend: BatchBackend | None = None) -> list[str]:
+    """Configured models the batch backend cannot run (evaluated interactively instead)."""
+    if backend is None:
+        backend = backend_from_config(cfg, _batch_dir(cfg))
+    return [model_name for model_name in cfg.models if not backend.supports(model_name)]
+
+
+def compile_batch_requests(
+    cfg: DictConfig,
+    case_ids: list[str],
+    prompt_manager: PromptManager,
+    backend: BatchBackend,
+    requests_dir: str | Path,
+    cases_dir: str | Path = "data/cases",
+    exclude: set[str] | None = None,
+) -> dict[str, tuple[Path, int]]:
+    """Write one request JSONL file per model for every missing grid cell.
+
+    Args:
+        cfg: Decisions config (models, execution, output)
+        case_ids: Cases to compile
+        prompt_manager: PromptManager used to build the messages
+        backend: Backend the requests are compiled for
+        requests_dir: Directory for the request files
+        cases_dir: Directory containing case JSON files
+        exclude: Request IDs already part of an open job
+
+    Returns:
+        Dict mapping model name to (request file, number of requests);
+        models the backend does not support are left out
+    """
+    exclude = exclude or set()
+    requests_dir = Path(requests_dir)
+    requests_dir.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    runs_per_model = cfg.execution.runs_per_model
+    stopping = StoppingRule.from_config(cfg)
+
+    lines: dict[str, list[str]] = {model_name: [] for model_name in cfg.models if backend.supports(model_name)}
+    for case_id in case_ids:
+        try:
+            record = get_decision_record(case_id, cfg.output.dir, cases_dir)
+        except Exception as e:
+            tqdm.write(f"ERROR: Failed to load case {case_id}: {e}")
+            continue
+        if not _sync_record_prompts(record, prompt_manager, cfg.execution.prompt_workflow, cfg.output.dir):
+            continue
+
+        messages = prompt_manager.build_messages(
+            cfg.execution.prompt_workflow,
+            {
+                "vignette": record.case.vignette,
+                "choice_1": record.case.choice_1.choice,
+                "choice_2": record.case.choice_2.choice,
+            },
+        )
+        for model_name in lines:
+            runs = record.models[model_name].runs if model_name in record.models else []
+            n_runs = runs_to_request(runs, runs_per_model, stopping)
+            for run_index in range(len(runs), len(runs) + n_runs):
+                custom_id = make_custom_id(case_id, model_name, run_index)
+                if custom_id in exclude:
+                    continue
+                lines[model_name].append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": {
+                        "model": backend.request_model(model_name),
+                        "messages": messages,
+                        "temperature": cfg.execution.temperature,
+                    },
+                }))
+
+    compiled = {}
+    for model_name, model_lines in lines.items():
+        if not model_lines:
+            continue
+        path = requests_dir / f"{sanitize_model_name(model_name)}-{stamp}-{uuid.uuid4().hex[:6]}.jsonl"
+        path.write_text("".join(line + "\n" for line in model_lines), encoding="utf-8")
+        compiled[model_name] = (path, len(model_lines))
+    return compiled
+
+
+def ingest_batch_results(
+    results: list[dict],
+    cfg: DictConfig,
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    cases_dir: str | Path = "data/cases",
+    rate_limiter: RateLimiter | None = None,
+    workers: int = 16,
+) -> tuple[int, int]:
+    """Parse batch result lines and append them to their decision records.
+
+    Results are applied per case in run order. Runs beyond
+    ``runs_per_model`` (``max_runs`` with adaptive sampling), e.g. filled
+    interactively in the meantime, are dropped.
+
+    Returns:
+        Tuple of (runs added, requests that failed or could not be parsed)
+    """
+    max_runs = target_runs(cfg, StoppingRule.from_config(cfg))
+    use_heuristic_parser = cfg.execution.get("heuristic_parser", False)
+    compact_every = cfg.output.get("compact_every", 25)
+
+    by_case: dict[str, list[tuple[str, int, dict | None]]] = {}
+    for line in results:
+        case_id, model_name, run_index = split_custom_id(line["custom_id"])
+        response = line.get("response") or {}
+        body = response.get("body") if response.get("status_code") == 200 and not line.get("error") else None
+        by_case.setdefault(case_id, []).append((model_name, run_index, body))
+
+    added = failed = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-parse") as executor:
+        for case_id, cells in by_case.items():
+            try:
+                record = get_decision_record(case_id, cfg.output.dir, cases_dir)
+            except Exception as e:
+                tqdm.write(f"ERROR: Failed to load case {case_id}: {e}")
+                failed += len(cells)
+                continue
+
+            cells.sort(key=lambda cell: (cell[0], cell[1]))
+            parses = [
+                executor.submit(
+                    _parse_with_retry,
+                    record.case,
+                    body.get("choices", [{}])[0].get("message", {}).get("content", ""),
+                    parser_llm,
+                    prompt_manager,
+                    cfg.retry.max_parse_retries,
+                    cfg.retry.backoff_base,
+                    rate_limiter,
+                    use_heuristic_parser,
+                    cfg.execution.get("parser_model"),
+                ) if body is not None else None
+                for _, _, body in cells
+            ]
+
+            journal = RunJournal(case_id, cfg.output.dir)
+            for (model_name, _, body), future in zip(cells, parses):
+                parsed = future.result() if future is not None else None
+                if parsed is None:
+                    failed += 1
+                    continue
+                model_data = get_or_create_model_data(record, model_name, cfg.execution.temperature)
+                if model_data.runs_completed >= max_runs:
+                    continue
+                parsed_choice, parse_method = parsed
+                result = RunResult(full_response=body, parsed_choice=parsed_choice, parse_method=parse_method)
+                append_run(record, model_name, result, journal, cfg.output.dir, compact_every)
+                added += 1
+            compact_decision_record(record, journal, cfg.output.dir)
+    return added, failed
+
+
+def _batch_dir(cfg: DictConfig) -> Path:
+    batch_cfg = cfg.get("batch", None) or {}
+    return Path(batch_cfg.get("dir", "data/llm_batches")) / Path(cfg.output.dir).name
+
+
+def _poll_and_ingest(
+    manifest: BatchManifest,
+    backend: BatchBackend,
+    cfg: DictConfig,
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    cases_dir: str | Path,
+    rate_limiter: RateLimiter,
+    verbose: bool,
+    max_poll_failures: int = 5,
+) -> int:
+    """Poll every open job of ``backend`` and ingest the finished ones. Returns runs added."""
+    total_added = 0
+    for job in manifest.open_jobs(backend.name):
+        try:
+            job.status = backend.status(job.job_id, job.model)
+            job.poll_failures = 0
+        except Exception as e:
+            job.poll_failures += 1
+            tqdm.write(f"ERROR: Failed to poll batch {job.job_id} "
+                       f"({job.poll_failures}/{max_poll_failures}): {e}")
+            if job.poll_failures < max_poll_failures:
+                manifest.save()
+                continue
+            job.status = "failed"
+        if job.status not in TERMINAL_STATUSES:
+            continue
+
+        if job.status == "completed":
+            try:
+                results = backend.results(job.job_id, job.model)
+            except Exception as e:
+                tqdm.write(f"ERROR: Failed to fetch results of batch {job.job_id}: {e}")
+                continue
+            added, failed = ingest_batch_results(results, cfg, parser_llm, prompt_manager, cases_dir, rate_limiter)
+            total_added += added
+            if verbose:
+                tqdm.write(f"Ingested batch {job.job_id} ({job.model}): {added} runs added, {failed} failed")
+        elif verbose:
+            tqdm.write(f"Batch {job.job_id} ({job.model}) ended as {job.status}; its cells will be resubmitted")
+        job.ingested = True
+        manifest.save()
+    return total_added
+
+
+def run_batch(
+    cfg: DictConfig,
+    case_ids: list[str],
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    cases_dir: str | Path = "data/cases",
+    verbose: bool = True,
+    rate_limiter: RateLimiter | None = None,
+    backend: BatchBackend | None = None,
+) -> BatchManifest:
+    """Ingest finished batch jobs and submit jobs for the remaining grid cells.
+
+    Configured through the ``batch`` config section (``backend``, ``dir``,
+    ``wait``, ``poll_interval``, ``max_wait`` and ``max_poll_failures``). Safe
+    to call repeatedly: cells already in an open job of the same backend are
+    not resubmitted, and finished jobs are ingested once. Models the backend
+    does not support are skipped (see ``interactive_models``).
+
+    Returns:
+        The updated job manifest
+    """
+    batch_cfg = cfg.get("batch", None) or {}
+    batch_dir = _batch_dir(cfg)
+    if rate_limiter is None:
+        rate_limiter = RateLimiter.from_config(cfg)
+    if backend is None:
+        backend = backend_from_config(cfg, batch_dir)
+
+    max_poll_failures = int(batch_cfg.get("max_poll_failures", 5))
+
+    manifest = BatchManifest(batch_dir)
+    orphaned = [job for job in manifest.open_jobs() if job.backend != backend.name]
+    if orphaned and verbose:
+        tqdm.write(f"WARNING: {len(orphaned)} open batch job(s) belong to another backend "
+                   f"({', '.join(sorted({job.backend for job in orphaned}))}); "
+                   f"their cells are resubmitted to '{backend.name}'")
+    _poll_and_ingest(
+        manifest, backend, cfg, parser_llm, prompt_manager, cases_dir, rate_limiter, verbose, max_poll_failures
+    )
+
+    compiled = compile_batch_requests(
+        cfg, case_ids, prompt_manager, backend, batch_dir / "requests", cases_dir,
+        manifest.open_custom_ids(backend.name),
+    )
+    for model_name, (input_path, n_requests) in compiled.items():
+        try:
+            job_id = backend.submit(model_name, input_path)
+        except Exception as e:
+            tqdm.write(f"ERROR: Failed to submit batch for {model_name}: {e}")
+            input_path.unlink(missing_ok=True)
+            continue
+        manifest.add(BatchJob(
+            job_id=job_id,
+            model=model_name,
+            backend=backend.name,
+            input_path=str(input_path),
+            n_requests=n_requests,
+            submitted_at=time.time(),
+        ))
+        if verbose:
+            tqdm.write(f"Submitted batch {job_id} for {model_name} ({n_requests:,} requests)")
+
+    if batch_cfg.get("wait", False):
+        poll_interval = float(batch_cfg.get("poll_interval", 60))
+        max_wait = batch_cfg.get("max_wait", None)
+        deadline = time.monotonic() + float(max_wait) if max_wait is not None else None
+        while manifest.open_jobs(backend.name):
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                if verbose:
+                    tqdm.write(f"Stopped waiting after batch.max_wait ({max_wait}s)")
+                break
+            time.sleep(poll_interval)
+            _poll_and_ingest(
+                manifest, backend, cfg, parser_llm, prompt_manager, cases_dir, rate_limiter, verbose, max_poll_failures
+            )
+
+    if verbose:
+        open_jobs = manifest.open_jobs(backend.name)
+        print(f"\n{len(open_jobs)} batch job(s) open "
+              f"({sum(job.n_requests for job in open_jobs):,} requests). Manifest: {manifest.path}")
+    return manifest
@@ -0,0 +1,364 @@
+"""Concurrent evaluation engine for LLM decision evaluation.
+
+The serial loop in ``run_evaluation`` walks cases → models → runs one call at
+a time, so wall time grows with the latency of the slowest provider. This
+module schedules every missing (case, model, run) cell as an asyncio task and
+keeps up to ``max_in_flight`` of them running at once, with an optional
+per-model cap so a single provider is not flooded.
+
+The underlying ``LLM`` client is synchronous, so each cell runs in a worker
+thread. Records are only mutated and saved on the event loop thread, which
+keeps writes to a ``DecisionRecord`` and its run journal serialized without
+extra locking. Resume semantics match the serial runner: the number of runs
+still needed for a model is derived from ``runs_completed`` on the stored
+record. With adaptive sampling, each (case, model) pair is scheduled as one
+task that requests runs in steps until its stopping rule is met.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from omegaconf import DictConfig
+from tqdm import tqdm
+from all_the_llms import LLM
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.models import DecisionRecord
+from src.llm_decisions.rate_limit import RateLimiter
+from src.llm_decisions.sampling import StoppingRule, target_runs
+from src.llm_decisions.runner import (
+    _run_multi_evaluation,
+    _run_single_evaluation,
+    _sync_record_prompts,
+    append_run,
+    compact_decision_record,
+    get_decision_record,
+    get_or_create_model_data,
+    supports_multi_sample,
+)
+from src.prompt_manager import PromptManager
+
+
+@dataclass
+class ConcurrencyLimits:
+    """Concurrency caps for the async engine.
+
+    Attributes:
+        max_in_flight: Maximum number of cells running at once across all models
+        default_per_model: Cap applied to models without an explicit entry
+            (None means only the global cap applies)
+        per_model: Explicit caps keyed by model name (e.g., 'openai/gpt-4o')
+    """
+    max_in_flight: int = 16
+    default_per_model: int | None = None
+    per_model: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "ConcurrencyLimits":
+        """Build limits from the ``execution.concurrency`` config section."""
+        concurrency = cfg.execution.get("concurrency", None) or {}
+        limits = cls(
+            max_in_flight=int(concurrency.get("max_in_flight", 16)),
+            default_per_model=concurrency.get("default_per_model", None),
+            per_model={str(k): int(v) for k, v in (concurrency.get("per_model", None) or {}).items()},
+        )
+        if limits.max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {limits.max_in_flight}")
+        return limits
+
+    def for_model(self, model_name: str) -> int:
+        """Effective cap for a model (never larger than the global cap)."""
+        cap = self.per_model.get(model_name, self.default_per_model)
+        if cap is None:
+            return self.max_in_flight
+        if cap < 1:
+            raise ValueError(f"Concurrency cap for {model_name} must be >= 1, got {cap}")
+        return min(int(cap), self.max_in_flight)
+
+
+async def _evaluate_cell(
+    record: DecisionRecord,
+    journal: RunJournal,
+    model_name: str,
+    run_index: int,
+    n_runs: int,
+    cfg: DictConfig,
+    llm: LLM,
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    global_slots: asyncio.Semaphore,
+    model_slots: asyncio.Semaphore,
+    pbar: tqdm,
+    rate_limiter: RateLimiter,
+) -> int:
+    """Run a cell of ``n_runs`` runs of one (case, model) and store the results.
+
+    Cells with ``n_runs > 1`` request all runs in one multi-sample call and
+    fall back to separate calls for any runs it did not produce.
+
+    Returns:
+        Number of runs added to the record
+    """
+    eval_kwargs = dict(
+        llm=llm,
+        case=record.case,
+        temperature=cfg.execution.temperature,
+        prompt_workflow=cfg.execution.prompt_workflow,
+        max_api_retries=cfg.retry.max_api_retries,
+        max_parse_retries=cfg.retry.max_parse_retries,
+        backoff_base=cfg.retry.backoff_base,
+        parser_llm=parser_llm,
+        prompt_manager=prompt_manager,
+        rate_limiter=rate_limiter,
+        use_heuristic_parser=cfg.execution.get("heuristic_parser", False),
+        model_id=model_name,
+        parser_model=cfg.execution.get("parser_model")
+    )
+    compact_every = cfg.output.get("compact_every", 25)
+    added = 0
+
+    def store(result) -> None:
+        # Back on the event loop thread: mutating and journaling here is serialized
+        nonlocal added
+        append_run(record, model_name, result, journal, cfg.output.dir, compact_every)
+        added += 1
+        pbar.update(1)
+        pbar.set_postfix({"choice": result.parsed_choice})
+
+    # Take the per-model slot first so cells waiting on a saturated model
+    # do not hold global slots that other models could use
+    async with model_slots:
+        # Likewise, sit out a throttled provider's cooldown before taking a global slot
+        provider = rate_limiter.for_model(model_name)
+        while (cooldown := provider.cooldown_remaining()) > 0:
+            await asyncio.sleep(cooldown)
+        async with global_slots:
+            if n_runs > 1:
+                results = await asyncio.to_thread(
+                    _run_multi_evaluation, n=n_runs, sample_index=run_index, **eval_kwargs
+                )
+                for result in results:
+                    store(result)
+            for sample_index in range(run_index + added, run_index + n_runs):
+                result = await asyncio.to_thread(
+                    _run_single_evaluation, sample_index=sample_index, **eval_kwargs
+                )
+                if result:
+                    store(result)
+
+    return added
+
+
+async def _evaluate_pair(
+    record: DecisionRecord,
+    journal: RunJournal,
+    model_name: str,
+    stopping: StoppingRule,
+    multi_sample: bool,
+    cfg: DictConfig,
+    llm: LLM,
+    *cell_args,
+) -> int:
+    """Draw runs for one (case, model) pair until the stopping rule is met.
+
+    Each step's runs are evaluated concurrently (or as one multi-sample
+    cell), then the rule is consulted again on the updated record.
+
+    Returns:
+        Number of runs added to the record
+    """
+    runs = record.models[model_name].runs
+    added = 0
+    while (n_runs := stopping.runs_to_request(runs)) > 0:
+        start = len(runs)
+        if multi_sample and n_runs > 1 and supports_multi_sample(llm):
+            step = await _evaluate_cell(record, journal, model_name, start, n_runs, cfg, llm, *cell_args)
+        else:
+            step = sum(await asyncio.gather(*(
+                _evaluate_cell(record, journal, model_name, start + i, 1, cfg, llm, *cell_args)
+                for i in range(n_runs)
+            )))
+        if step == 0:
+            # Every call in this step failed; leave the pair for the next invocation
+            break
+        added += step
+    return added
+
+
+async def _run_grid(
+    cfg: DictConfig,
+    case_ids: list[str],
+    model_llms: dict[str, LLM],
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    cases_dir: str | Path,
+    verbose: bool,
+    rate_limiter: RateLimiter,
+) -> tuple[int, int]:
+    """Schedule all missing cells and wait for them to finish.
+
+    Returns:
+        Tuple of (runs completed, runs expected) across the whole grid.
+    """
+    limits = ConcurrencyLimits.from_config(cfg)
+    runs_per_model = cfg.execution.runs_per_model
+    stopping = StoppingRule.from_config(cfg)
+    max_runs = target_runs(cfg, stopping)
+    total_expected_runs = len(cfg.models) * len(case_ids) * max_runs
+
+    # The LLM client is blocking, so size the thread pool to the global cap
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=limits.max_in_flight, thread_name_prefix="llm-eval")
+    loop.set_default_executor(executor)
+
+    global_slots = asyncio.Semaphore(limits.max_in_flight)
+    model_slots = {m: asyncio.Semaphore(limits.for_model(m)) for m in cfg.models}
+
+    # Load every record up front and work out which cells are missing
+    multi_sample = cfg.execution.get("multi_sample", False)
+    pending: list[tuple[DecisionRecord, str, int, int]] = []
+    adaptive_pairs: list[tuple[DecisionRecord, str]] = []
+    journals: dict[str, tuple[DecisionRecord, RunJournal]] = {}
+    already_completed = 0
+    for case_id in case_ids:
+        try:
+            record = get_decision_record(case_id, cfg.output.dir, cases_dir)
+        except Exception as e:
+            tqdm.write(f"ERROR: Failed to load case {case_id}: {e}")
+            continue
+
+        if not _sync_record_prompts(record, prompt_manager, cfg.execution.prompt_workflow, cfg.output.dir):
+            continue
+
+        journals[case_id] = (record, RunJournal(case_id, cfg.output.dir))
+        for model_name in cfg.models:
+            model_data = get_or_create_model_data(record, model_name, cfg.execution.temperature)
+            runs_completed = model_data.runs_completed
+            already_completed += min(runs_completed, max_runs)
+            remaining = runs_per_model - runs_completed
+            if stopping is not None:
+                if stopping.runs_to_request(model_data.runs) > 0:
+                    adaptive_pairs.append((record, model_name))
+            elif multi_sample and remaining > 1 and supports_multi_sample(model_llms[model_name]):
+                # One cell requests all remaining runs as an n-sample call
+                pending.append((record, model_name, runs_completed, remaining))
+            else:
+                pending.extend((record, model_name, i, 1) for i in range(runs_completed, runs_per_model))
+
+    if verbose and stopping is not None:
+        tqdm.write(
+            f"Scheduling {len(adaptive_pairs):,} case/model pairs for adaptive sampling "
+            f"({stopping.min_runs}-{stopping.max_runs} runs, {stopping.rule} rule, "
+            f"max {limits.max_in_flight} in flight)"
+        )
+    elif verbose:
+        tqdm.write(
+            f"Scheduling {sum(n for *_, n in pending):,} missing runs in {len(pending):,} cells "
+            f"(max {limits.max_in_flight} in flight)"
+        )
+
+    pbar = tqdm(
+        total=total_expected_runs,
+        initial=already_completed,
+        desc="Runs",
+        disable=not verbose,
+    )
+
+    tasks = [
+        asyncio.create_task(
+            _evaluate_cell(
+                record,
+                journals[record.case_id][1],
+                model_name,
+                run_index,
+                n_runs,
+                cfg,
+                model_llms[model_name],
+                parser_llm,
+                prompt_manager,
+                global_slots,
+                model_slots[model_name],
+                pbar,
+                rate_limiter,
+            )
+        )
+        for record, model_name, run_index, n_runs in pending
+    ]
+    tasks.extend(
+        asyncio.create_task(
+            _evaluate_pair(
+                record,
+                journals[record.case_id][1],
+                model_name,
+                stopping,
+                multi_sample,
+                cfg,
+                model_llms[model_name],
+                parser_llm,
+                prompt_manager,
+                global_slots,
+                model_slots[model_name],
+                pbar,
+                rate_limiter,
+            )
+        )
+        for record, model_name in adaptive_pairs
+    )
+
+    try:
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        pbar.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Fold every outstanding journal into its record
+        for record, journal in journals.values():
+            compact_decision_record(record, journal, cfg.output.dir)
+
+    new_runs = 0
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            tqdm.write(f"ERROR: {outcome}")
+        else:
+            new_runs += outcome
+
+    return already_completed + new_runs, total_expected_runs
+
+
+def run_grid_async(
+    cfg: DictConfig,
+    case_ids: list[str],
+    model_llms: dict[str, LLM],
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    cases_dir: str | Path = "data/cases",
+    verbose: bool = True,
+    rate_limiter: RateLimiter | None = None,
+) -> None:
+    """Evaluate the full case × model × run grid with bounded concurrency.
+
+    Configured through ``execution.concurrency`` in ``decisions.yaml``:
+    ``max_in_flight`` caps the total number of cells running at once and
+    ``default_per_model`` / ``per_model`` cap individual models. Every
+    successful run is saved immediately, so an interrupted grid resumes
+    from the stored records on the next invocation.
+
+    Target and parser calls also go through ``rate_limiter`` (built from the
+    ``rate_limits`` config section if not given), so a provider that starts
+    returning 429s is slowed down without stalling the others.
+    """
+    if rate_limiter is None:
+        rate_limiter = RateLimiter.from_config(cfg)
+    try:
+        total_runs_completed, total_expected_runs = asyncio.run(
+            _run_grid(cfg, case_ids, model_llms, parser_llm, prompt_manager, cases_dir, verbose, rate_limiter)
+        )
+    except KeyboardInterrupt:
+        if verbose:
+            tqdm.write("\n\nInterrupted by user. Completed runs have already been saved.")
+        raise
+
+    if verbose:
+        print(f"\n✓ Evaluation complete!")
+        print(f"Total runs completed: {total_runs_completed}/{total_expected_runs} ({100*total_runs_completed/total_expected_runs:.1f}%)")
+        print(f"Results saved to: {cfg.output.dir}")
@@ -0,0 +1,41 @@
+"""Agreement report of the heuristic fast-path parser.
+
+Compares ``heuristic_parse`` with the LLM-parsed choices already stored in
+decision records (see ``agreement_report``), to check the rules before
+turning on ``execution.heuristic_parser``.
+
+Usage:
+    python -m src.llm_decisions.heuristic_agreement data/llm_decisions/physician_recommendation
+"""
+
+import argparse
+
+from src.llm_decisions.heuristic_parser import agreement_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Report agreement between the heuristic parser and stored LLM-parsed runs"
+    )
+    parser.add_argument(
+        "decisions_dirs",
+        nargs="*",
+        default=["data/llm_decisions/physician_recommendation"],
+        help="Directories of decision record JSON files",
+    )
+    parser.add_argument("--examples", type=int, default=20, help="Number of disagreements to list")
+    args = parser.parse_args()
+
+    for decisions_dir in args.decisions_dirs:
+        report = agreement_report(decisions_dir, max_examples=args.examples)
+        print(f"\n{decisions_dir}")
+        print(report.summary())
+        for d in report.disagreements:
+            print(
+                f"  ✗ {d['case_id'][:8]} {d['model']} run {d['run_index']}: "
+                f"{d['rule']} said {d['heuristic']}, LLM said {d['llm']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
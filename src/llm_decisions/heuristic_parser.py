@@ -0,0 +1,224 @@
+"""Deterministic fast-path parser for LLM decision responses.
+
+``parse_response`` makes a structured call to the parser model for every run,
+which adds a network round-trip per evaluation. Most responses state their
+recommendation explicitly ("**Recommendation: Choice 2**"), so this module
+resolves the clear cases locally and leaves everything else to the LLM parser.
+
+Rules, tried in order (any conflict between them means "ambiguous"):
+
+- ``empty``: a blank response is recorded as REFUSAL, as the LLM parser does
+- ``marker``: explicit recommendation markers such as "I recommend Choice 1"
+  or "Recommendation: Choice 2" that all point to the same choice, with no
+  negation ("I do not recommend Choice 1") nearby
+- ``overlap``: a recommendation sentence that reproduces the text of exactly
+  one of the two choices
+- ``refusal``: refusal phrases ("I cannot recommend either option") with no
+  recommendation marker anywhere in the response
+
+Measure agreement with the stored LLM-parsed runs with:
+
+    python -m src.llm_decisions.heuristic_agreement data/llm_decisions/physician_recommendation
+"""
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+Choice = Literal["choice_1", "choice_2", "REFUSAL"]
+
+# Verbs/nouns that introduce the model's own recommendation
+_RECOMMEND = (
+    r"(?:recommend(?:ation|ed|s)?|i\s+(?:would\s+)?(?:choose|select|favou?r|opt\s+for|go\s+with|endorse|advise)"
+    r"|my\s+(?:choice|decision|answer|advice)|final\s+(?:answer|decision|choice))"
+)
+_CHOICE_REF = r"(?:choice|option)\s*(?:#\s*)?([12])\b"
+
+# "I recommend Choice 1", "**Recommendation: Choice 2 –", "I would choose Option 1"
+_MARKER = re.compile(_RECOMMEND + r"[\s*:_\-–—]*(?:is\s+|for\s+|to\s+)?(?:\*\*)?\s*" + _CHOICE_REF, re.IGNORECASE)
+# "Choice 1 is my recommendation", "**Choice 2 (...) is recommended**"
+_MARKER_AFTER = re.compile(
+    _CHOICE_REF + r"[^.\n]{0,120}?\bis\s+(?:my\s+|the\s+)?(?:recommend(?:ation|ed)|choice\s+i\s+recommend)",
+    re.IGNORECASE,
+)
+_NEGATION = re.compile(
+    r"\b(?:not|n't|never|cannot|against|rather\s+than|instead\s+of|over|versus|vs\.?)\W+(?:\w+\W+){0,3}$",
+    re.IGNORECASE,
+)
+_REFUSAL = re.compile(
+    r"\b(?:i\s+(?:cannot|can't|can\s+not|won't|will\s+not|am\s+unable\s+to|am\s+not\s+able\s+to|must\s+decline\s+to)"
+    r"\s+(?:in\s+good\s+conscience\s+)?(?:recommend|choose|select|make\s+(?:a|this)\s+(?:recommendation|choice|decision))"
+    r"|i\s+(?:decline|refuse)\s+to\s+(?:recommend|choose)"
+    r"|(?:recommend|choose)\s+neither)",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {
+    "a", "an", "and", "the", "to", "of", "for", "with", "in", "on", "at", "by", "or", "her",
+    "his", "their", "him", "them", "is", "be", "as", "that", "this", "from", "while", "despite",
+}
+
+
+@dataclass
+class HeuristicDecision:
+    """A decision resolved locally, with the rule that decided it."""
+    selected_choice: Choice
+    rule: Literal["empty", "marker", "overlap", "refusal"]
+
+    @property
+    def parse_method(self) -> str:
+        return f"heuristic:{self.rule}"
+
+
+def _content_words(text: str) -> set[str]:
+    return {w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS and len(w) > 2}
+
+
+def _marker_choices(text: str) -> set[str]:
+    """Choices named by explicit recommendation markers that are not negated."""
+    found = set()
+    for pattern in (_MARKER, _MARKER_AFTER):
+        for match in pattern.finditer(text):
+            if _NEGATION.search(text[max(0, match.start() - 40):match.start()]):
+                # "I would not recommend Choice 1" / "rather than Choice 2"
+                return {"ambiguous"}
+            found.add(f"choice_{match.group(1)}")
+    return found
+
+
+def _overlap_choice(text: str, choice_1_text: str, choice_2_text: str) -> str | None:
+    """The choice whose wording a recommendation sentence reproduces, if unique."""
+    words_1 = _content_words(choice_1_text)
+    words_2 = _content_words(choice_2_text)
+    # Words shared by both choices say nothing about which was picked
+    distinct_1, distinct_2 = words_1 - words_2, words_2 - words_1
+    if len(distinct_1) < 2 or len(distinct_2) < 2:
+        return None
+
+    picked = set()
+    for sentence in re.split(r"(?<=[.!?])\s+|\n+", text):
+        if not re.search(r"\brecommend", sentence, re.IGNORECASE) or re.search(r"\b(?:not|n't)\b", sentence):
+            continue
+        words = _content_words(sentence)
+        cover_1 = len(distinct_1 & words) / len(distinct_1)
+        cover_2 = len(distinct_2 & words) / len(distinct_2)
+        if cover_1 >= 0.8 and cover_2 <= 0.2:
+            picked.add("choice_1")
+        elif cover_2 >= 0.8 and cover_1 <= 0.2:
+            picked.add("choice_2")
+    return picked.pop() if len(picked) == 1 else None
+
+
+def heuristic_parse(choice_1_text: str, choice_2_text: str, llm_response: str | None) -> HeuristicDecision | None:
+    """Resolve a response locally when the decision is unambiguous.
+
+    Args:
+        choice_1_text: The text of the first choice
+        choice_2_text: The text of the second choice
+        llm_response: The LLM's free-text response
+
+    Returns:
+        HeuristicDecision if a rule decides the response, None if it is
+        ambiguous and should go to the LLM parser
+
+    Example:
+        >>> heuristic_parse("Operate now", "Wait", "**Recommendation: Choice 1**").selected_choice
+        'choice_1'
+    """
+    text = (llm_response or "").strip()
+    if not text:
+        return HeuristicDecision("REFUSAL", "empty")
+
+    markers = _marker_choices(text)
+    refusal = bool(_REFUSAL.search(text))
+    if "ambiguous" in markers or len(markers) > 1:
+        return None
+    if markers:
+        if refusal:
+            return None
+        return HeuristicDecision(markers.pop(), "marker")
+
+    overlap = _overlap_choice(text, choice_1_text, choice_2_text)
+    if overlap:
+        return None if refusal else HeuristicDecision(overlap, "overlap")
+    if refusal:
+        return HeuristicDecision("REFUSAL", "refusal")
+    return None
+
+
+@dataclass
+class AgreementReport:
+    """Agreement between the heuristic parser and stored LLM-parsed runs."""
+    total: int = 0
+    resolved: int = 0
+    agreed: int = 0
+    by_rule: Counter = field(default_factory=Counter)
+    agreed_by_rule: Counter = field(default_factory=Counter)
+    disagreements: list[dict] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        return self.resolved / self.total if self.total else 0.0
+
+    @property
+    def agreement(self) -> float:
+        return self.agreed / self.resolved if self.resolved else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"Runs checked:       {self.total:,}",
+            f"Resolved locally:   {self.resolved:,} ({100 * self.coverage:.1f}%)",
+            f"Agreement with LLM: {self.agreed:,}/{self.resolved:,} ({100 * self.agreement:.2f}%)",
+        ]
+        for rule, count in self.by_rule.most_common():
+            lines.append(f"  {rule:<8} {count:>6,} resolved, {self.agreed_by_rule[rule]:>6,} agree")
+        return "\n".join(lines)
+
+
+def agreement_report(decisions_dir: str | Path, max_examples: int = 20) -> AgreementReport:
+    """Compare heuristic decisions with the LLM-parsed choices already stored.
+
+    Only runs that were parsed by the LLM (``parse_method`` missing or 'llm')
+    are compared, so the stored choice is an independent reference.
+
+    Args:
+        decisions_dir: Directory of DecisionRecord JSON files
+        max_examples: Maximum number of disagreements kept for inspection
+
+    Returns:
+        AgreementReport with coverage, agreement and per-rule counts
+    """
+    report = AgreementReport()
+    for path in sorted(Path(decisions_dir).glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+        choice_1 = record["case"]["choice_1"]["choice"]
+        choice_2 = record["case"]["choice_2"]["choice"]
+        for model_name, model_data in record.get("models", {}).items():
+            for run_index, run in enumerate(model_data.get("runs", [])):
+                if run.get("parse_method") not in (None, "llm"):
+                    continue
+                report.total += 1
+                text = run["full_response"].get("choices", [{}])[0].get("message", {}).get("content", "")
+                decision = heuristic_parse(choice_1, choice_2, text)
+                if decision is None:
+                    continue
+                report.resolved += 1
+                report.by_rule[decision.rule] += 1
+                if decision.selected_choice == run["parsed_choice"]:
+                    report.agreed += 1
+                    report.agreed_by_rule[decision.rule] += 1
+                elif len(report.disagreements) < max_examples:
+                    report.disagreements.append({
+                        "case_id": record["case_id"],
+                        "model": model_name,
+                        "run_index": run_index,
+                        "rule": decision.rule,
+                        "heuristic": decision.selected_choice,
+                        "llm": run["parsed_choice"],
+                    })
+    return report
+
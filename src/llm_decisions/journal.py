@@ -0,0 +1,113 @@
+"""Append-only run journal for decision records.
+
+Re-serializing a full ``DecisionRecord`` after every run costs megabytes of
+I/O per run once a case has accumulated many models. Instead, each new
+``RunResult`` is appended as one JSON line to a per-case journal next to the
+record, and the journal is periodically compacted into the canonical record
+JSON. If the process dies before compaction, the journal is replayed the next
+time the record is loaded.
+
+Journal file: ``{output_dir}/{case_id}.journal.jsonl``. Each line holds the
+case ID, model name, run index, temperature and the serialized ``RunResult``.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from tqdm import tqdm
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+class RunJournal:
+    """Write-ahead journal of run results for a single case.
+
+    Entries are keyed by (model, run index), so replaying a journal onto a
+    record that already contains some of its runs is idempotent: entries
+    whose run index is already present in the record are skipped.
+    """
+
+    def __init__(self, case_id: str, output_dir: str | Path = "data/llm_decisions"):
+        self.case_id = case_id
+        self.path = Path(output_dir) / f"{case_id}{JOURNAL_SUFFIX}"
+        self._pending = len(self.entries()) if self.path.exists() else 0
+
+    @property
+    def pending(self) -> int:
+        """Number of journaled runs not yet compacted into the record."""
+        return self._pending
+
+    def append(self, model_name: str, run_index: int, temperature: float, run: RunResult) -> None:
+        """Durably append a single run to the journal."""
+        entry = {
+            "case_id": self.case_id,
+            "model": model_name,
+            "run_index": run_index,
+            "temperature": temperature,
+            "run": run.model_dump(mode="json"),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending += 1
+
+    def entries(self) -> list[dict]:
+        """Read all complete journal entries.
+
+        A trailing line left half-written by a crash is ignored.
+        """
+        if not self.path.exists():
+            return []
+
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    tqdm.write(f"Warning: Skipping corrupt journal line {line_number} in {self.path.name}")
+                    continue
+                if entry.get("case_id") != self.case_id:
+                    raise ValueError(
+                        f"Journal {self.path.name} contains case_id {entry.get('case_id')}, expected {self.case_id}"
+                    )
+                entries.append(entry)
+        return entries
+
+    def replay(self, record: DecisionRecord) -> int:
+        """Apply journaled runs that are missing from a record.
+
+        Returns:
+            Number of runs added to the record.
+        """
+        replayed = 0
+        for entry in self.entries():
+            model_name = entry["model"]
+            if model_name not in record.models:
+                record.models[model_name] = ModelDecisionData(temperature=entry["temperature"])
+            runs = record.models[model_name].runs
+
+            run_index = entry["run_index"]
+            if run_index < len(runs):
+                # Already compacted into the record
+                continue
+            if run_index > len(runs):
+                tqdm.write(
+                    f"Warning: Journal for {self.case_id} skips from run {len(runs)} "
+                    f"to {run_index} for {model_name}; appending anyway"
+                )
+            runs.append(RunResult.model_validate(entry["run"]))
+            replayed += 1
+        return replayed
+
+    def clear(self) -> None:
+        """Remove the journal after its runs were compacted into the record."""
+        self.path.unlink(missing_ok=True)
+        self._pending = 0
@@ -44,6 +44,17 @@ class RunResult(BaseModel):
         ..., 
         description="Extracted choice from the response"
     )
+    parse_method: Optional[str] = Field(
+        default=None,
+        description=(
+            "How parsed_choice was obtained: 'llm' for the parser model, "
+            "'heuristic:<rule>' for the local fast path (None for older runs)"
+        )
+    )
+    alternate_parses: dict[str, Literal["choice_1", "choice_2", "REFUSAL"]] = Field(
+        default_factory=dict,
+        description="Choices from offline re-parses kept alongside parsed_choice, keyed by column name"
+    )
     
     @property
     def response_text(self) -> str:
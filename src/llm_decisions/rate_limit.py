@@ -0,0 +1,364 @@
+"""Per-provider rate limiting for target and parser LLM calls.
+
+Every call made by the runner goes through a ``RateLimiter``, which keeps one
+``ProviderLimiter`` per provider prefix (the part of the model id before the
+first ``/``, e.g. ``openai`` or ``anthropic``). Target models and the parser
+model share the limiter for their provider, so parser calls count against the
+same quota as the targets they sit next to.
+
+Each provider limiter combines:
+
+- Token buckets for requests per minute and tokens per minute
+- AIMD concurrency: the number of calls allowed in flight is halved when the
+  provider answers with 429 or a 5xx error and grows by roughly one per
+  window of successful calls, up to ``max_concurrency``
+- A provider-wide cooldown after throttling (honouring ``Retry-After`` when
+  the provider sends it) and jittered exponential backoff between retries
+
+Waiting only ever blocks the calling thread on that provider's limiter, so in
+async mode a throttled provider does not hold up calls to the others.
+
+Example:
+    >>> limiter = RateLimiter.from_config(cfg)
+    >>> response = limiter.call(
+    ...     "openai/gpt-4o",
+    ...     lambda: llm.completion(messages=messages),
+    ...     max_retries=3,
+    ...     backoff_base=2.0,
+    ...     estimated_tokens=estimate_tokens(messages),
+    ... )
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from omegaconf import DictConfig
+from tqdm import tqdm
+
+T = TypeVar("T")
+
+# Exception class names used by litellm/openai when no status code is attached
+_THROTTLE_ERROR_NAMES = {
+    "RateLimitError",
+    "ServiceUnavailableError",
+    "InternalServerError",
+    "APIConnectionError",
+    "Timeout",
+    "APITimeoutError",
+}
+
+
+def provider_for(model_name: str) -> str:
+    """Provider prefix of a model id ('openai/gpt-4o' -> 'openai')."""
+    return model_name.split("/", 1)[0] if "/" in model_name else "default"
+
+
+def estimate_tokens(messages: list[dict] | str) -> int:
+    """Rough prompt size in tokens (about four characters per token)."""
+    if isinstance(messages, str):
+        return len(messages) // 4 + 1
+    return sum(len(str(m.get("content", ""))) for m in messages) // 4 + 1
+
+
+def _status_code(error: BaseException) -> int | None:
+    """Find an HTTP status code on an exception or anything it wraps."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status = getattr(error, "status_code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        if isinstance(status, int):
+            return status
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Whether an error means the provider is overloaded (429 or 5xx)."""
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in _THROTTLE_ERROR_NAMES
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Value of a ``Retry-After`` header attached to an error, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _total_tokens(response: Any) -> int | None:
+    """Token usage reported on a completion response (dict or object)."""
+    usage = response.get("usage") if isinstance(response, dict) else getattr(response, "usage", None)
+    if usage is None:
+        return None
+    total = usage.get("total_tokens") if isinstance(usage, dict) else getattr(usage, "total_tokens", None)
+    return total if isinstance(total, int) else None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate_per_minute / 60`` per second.
+
+    The bucket holds at most one minute's worth of tokens. Consumption may
+    drive the level negative (e.g. when actual usage exceeds the estimate),
+    which delays later callers until the debt is repaid.
+    """
+
+    def __init__(self, rate_per_minute: float, clock: Callable[[], float] = time.monotonic):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be > 0, got {rate_per_minute}")
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+
+@dataclass
+class ProviderLimits:
+    """Limits for one provider.
+
+    Attributes:
+        requests_per_minute: Request quota (None = unlimited)
+        tokens_per_minute: Token quota, prompt plus completion (None = unlimited)
+        max_concurrency: Upper bound for the AIMD concurrency limit
+        min_concurrency: Lower bound the limit never drops below
+        decrease_factor: Multiplier applied to the limit on throttling
+        cooldown: Minimum pause for the whole provider after throttling (seconds)
+    """
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    max_concurrency: int = 16
+    min_concurrency: int = 1
+    decrease_factor: float = 0.5
+    cooldown: float = 1.0
+
+    def __post_init__(self):
+        if self.min_concurrency < 1 or self.max_concurrency < self.min_concurrency:
+            raise ValueError(
+                f"Need 1 <= min_concurrency <= max_concurrency, got "
+                f"{self.min_concurrency} and {self.max_concurrency}"
+            )
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be in (0, 1), got {self.decrease_factor}")
+
+
+class ProviderLimiter:
+    """Thread-safe limiter for all calls to one provider."""
+
+    def __init__(self, provider: str, limits: ProviderLimits, clock: Callable[[], float] = time.monotonic):
+        self.provider = provider
+        self.limits = limits
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._requests = TokenBucket(limits.requests_per_minute, clock) if limits.requests_per_minute else None
+        self._tokens = TokenBucket(limits.tokens_per_minute, clock) if limits.tokens_per_minute else None
+        self.concurrency_limit = float(limits.max_concurrency)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._last_decrease = float("-inf")
+
+    def cooldown_remaining(self) -> float:
+        """Seconds left in the provider-wide cooldown after throttling."""
+        with self._cond:
+            return max(0.0, self.blocked_until - self._clock())
+
+    def _wait_time(self, tokens: int) -> float | None:
+        """Seconds to wait before a call may start (None = wait for a release)."""
+        if self.in_flight >= max(1, int(self.concurrency_limit)):
+            return None
+        wait = self.blocked_until - self._clock()
+        if self._requests:
+            wait = max(wait, self._requests.time_until(1))
+        if self._tokens and tokens:
+            wait = max(wait, self._tokens.time_until(tokens))
+        return max(0.0, wait)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a call with the estimated token count may start."""
+        with self._cond:
+            while True:
+                wait = self._wait_time(tokens)
+                if wait == 0.0:
+                    break
+                self._cond.wait(timeout=wait)
+            self.in_flight += 1
+            if self._requests:
+                self._requests.consume(1)
+            if self._tokens and tokens:
+                self._tokens.consume(tokens)
+
+    def release(self, error: BaseException | None = None, tokens_estimate: int = 0, tokens_used: int | None = None) -> None:
+        """Finish a call started with ``acquire`` and update the AIMD state.
+
+        Args:
+            error: Exception raised by the call, or None on success
+            tokens_estimate: Token count passed to ``acquire``
+            tokens_used: Actual usage reported by the provider, if known
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if self._tokens and tokens_used is not None:
+                self._tokens.consume(tokens_used - tokens_estimate)
+
+            if error is None:
+                # Additive increase: about +1 per limit's worth of successes
+                self.concurrency_limit = min(
+                    float(self.limits.max_concurrency),
+                    self.concurrency_limit + 1.0 / self.concurrency_limit,
+                )
+            elif is_throttle_error(error):
+                now = self._clock()
+                # Calls already in flight when the provider started throttling
+                # fail together; only back off once per cooldown window
+                if now - self._last_decrease >= self.limits.cooldown:
+                    self.concurrency_limit = max(
+                        float(self.limits.min_concurrency),
+                        self.concurrency_limit * self.limits.decrease_factor,
+                    )
+                    self._last_decrease = now
+                pause = max(self.limits.cooldown, retry_after_seconds(error) or 0.0)
+                self.blocked_until = max(self.blocked_until, now + pause)
+            self._cond.notify_all()
+
+
+@dataclass
+class RateLimiter:
+    """Registry of per-provider limiters shared by all LLM calls in a run.
+
+    Attributes:
+        default: Limits for providers without an explicit entry
+        providers: Limits keyed by provider prefix (e.g., 'openai')
+        expected_output_tokens: Completion size added to prompt estimates
+            when charging the tokens-per-minute bucket
+    """
+    default: ProviderLimits = field(default_factory=ProviderLimits)
+    providers: dict[str, ProviderLimits] = field(default_factory=dict)
+    expected_output_tokens: int = 1024
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+
+    def __post_init__(self):
+        self._limiters: dict[str, ProviderLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "RateLimiter":
+        """Build a limiter from the ``rate_limits`` config section (optional)."""
+        section = cfg.get("rate_limits", None) or {}
+        default_cfg = dict(section.get("default", None) or {})
+        providers = {
+            str(name): ProviderLimits(**{**default_cfg, **dict(limits or {})})
+            for name, limits in (section.get("providers", None) or {}).items()
+        }
+        return cls(
+            default=ProviderLimits(**default_cfg),
+            providers=providers,
+            expected_output_tokens=int(section.get("expected_output_tokens", 1024)),
+        )
+
+    def for_model(self, model_name: str) -> ProviderLimiter:
+        """Limiter for the provider of a model id (created on first use)."""
+        provider = provider_for(model_name)
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limits = self.providers.get(provider, self.default)
+                limiter = self._limiters[provider] = ProviderLimiter(provider, limits, self.clock)
+            return limiter
+
+    def backoff_delay(self, attempt: int, backoff_base: float, error: BaseException | None = None) -> float:
+        """Jittered exponential delay before retry ``attempt + 1``.
+
+        Uses "equal jitter": half of ``backoff_base ** attempt`` plus a random
+        amount up to the other half, so concurrent retries spread out without
+        ever retrying much sooner than the unjittered schedule.
+        """
+        cap = backoff_base ** attempt if backoff_base > 0 else 0.0
+        delay = cap / 2 + random.uniform(0, cap / 2)
+        if error is not None:
+            delay = max(delay, retry_after_seconds(error) or 0.0)
+        return delay
+
+    def call(
+        self,
+        model_name: str,
+        fn: Callable[[], T],
+        max_retries: int = 3,
+        backoff_base: float = 2.0,
+        estimated_tokens: int = 0,
+        label: str = "LLM call",
+        verbose: bool = True,
+    ) -> T:
+        """Run ``fn`` under the provider's limits, retrying failures.
+
+        Args:
+            model_name: Model id used to pick the provider limiter
+            fn: Zero-argument callable performing the request
+            max_retries: Total number of attempts
+            backoff_base: Exponential backoff base in seconds
+            estimated_tokens: Prompt size estimate (see ``estimate_tokens``)
+            label: Description used in retry warnings
+            verbose: Print a warning before each retry
+
+        Returns:
+            Whatever ``fn`` returns on the first successful attempt
+
+        Raises:
+            ValueError: If max_retries is less than 1
+            Exception: The last error if every attempt fails
+        """
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be >= 1, got {max_retries}")
+        limiter = self.for_model(model_name)
+        tokens = estimated_tokens + self.expected_output_tokens if estimated_tokens else 0
+        last_exception: BaseException | None = None
+
+        for attempt in range(max_retries):
+            limiter.acquire(tokens)
+            try:
+                result = fn()
+            except BaseException as e:
+                limiter.release(error=e, tokens_estimate=tokens)
+                if not isinstance(e, Exception):
+                    raise
+                last_exception = e
+                if attempt == max_retries - 1:
+                    break
+                delay = self.backoff_delay(attempt, backoff_base, e)
+                if verbose:
+                    kind = "throttled" if is_throttle_error(e) else "failed"
+                    tqdm.write(
+                        f"Warning: {label} to {model_name} {kind} (attempt {attempt + 1}/{max_retries}): {e}. "
+                        f"Retrying in {delay:.1f} seconds..."
+                    )
+                self.sleep(delay)
+                continue
+            limiter.release(tokens_estimate=tokens, tokens_used=_total_tokens(result) if tokens else None)
+            return result
+
+        raise last_exception
@@ -0,0 +1,273 @@
+"""Offline bulk re-parse of stored LLM responses.
+
+Every ``RunResult`` keeps the raw completion in ``full_response``, so changing
+the parse prompt or parser model does not require re-running the target
+models. This module streams the decision records in a directory, re-parses
+every stored response with a pool of worker threads and writes the new
+choices back atomically, either replacing ``parsed_choice`` or into a
+parallel column in ``RunResult.alternate_parses``. Runs whose choice flips
+are reported.
+
+Parser calls go through the same rate limiter, response cache and heuristic
+fast path as the evaluation runner, configured from ``decisions.yaml``.
+
+Usage:
+    # Compare a new parser model without touching parsed_choice
+    python -m src.llm_decisions.reparse data/llm_decisions/physician_recommendation \\
+        --parser-model openai/gpt-4.1-mini --column gpt41mini
+
+    # Replace parsed_choice, writing a CSV of every flip
+    python -m src.llm_decisions.reparse data/llm_decisions/physician_recommendation \\
+        --replace --flips-csv flips.csv
+
+    # See what would change without writing anything
+    python -m src.llm_decisions.reparse data/llm_decisions/physician_recommendation --dry-run
+"""
+
+import argparse
+import csv
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from omegaconf import DictConfig, OmegaConf
+from tqdm import tqdm
+
+from all_the_llms import LLM
+from src.llm_cache import build_llm
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.models import DecisionRecord
+from src.llm_decisions.rate_limit import RateLimiter
+from src.llm_decisions.runner import _parse_with_retry, get_decision_record, save_decision_record
+from src.prompt_manager import PromptManager
+
+
+@dataclass
+class ReparseReport:
+    """Outcome of a bulk re-parse.
+
+    Attributes:
+        records: Number of decision records processed
+        runs: Number of runs re-parsed
+        failed: Runs whose re-parse failed (left unchanged)
+        flips: One dict per run whose choice changed
+        transitions: Counts of (old choice, new choice) pairs that flipped
+        methods: Counts of parse methods used (e.g. 'llm', 'heuristic:marker')
+    """
+    records: int = 0
+    runs: int = 0
+    failed: int = 0
+    flips: list[dict] = field(default_factory=list)
+    transitions: Counter = field(default_factory=Counter)
+    methods: Counter = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        flip_rate = 100 * len(self.flips) / self.runs if self.runs else 0.0
+        lines = [
+            f"Records:  {self.records:,}",
+            f"Runs:     {self.runs:,} ({self.failed:,} failed)",
+            f"Flips:    {len(self.flips):,} ({flip_rate:.2f}%)",
+        ]
+        for (old, new), count in self.transitions.most_common():
+            lines.append(f"  {old} → {new}: {count:,}")
+        by_model = Counter(f["model"] for f in self.flips)
+        for model_name, count in by_model.most_common():
+            lines.append(f"  {model_name}: {count:,} flips")
+        lines.append("Parse methods: " + ", ".join(f"{m}={c:,}" for m, c in self.methods.most_common()))
+        return "\n".join(lines)
+
+
+def _apply_results(
+    record: DecisionRecord,
+    jobs: list[tuple[str, int, Future]],
+    column: str | None,
+    report: ReparseReport,
+) -> bool:
+    """Write finished parses onto a record. Returns True if anything changed."""
+    changed = False
+    for model_name, run_index, future in jobs:
+        run = record.models[model_name].runs[run_index]
+        parsed = future.result()
+        report.runs += 1
+        if parsed is None:
+            report.failed += 1
+            continue
+
+        new_choice, parse_method = parsed
+        report.methods[parse_method] += 1
+        old_choice = run.alternate_parses.get(column, run.parsed_choice) if column else run.parsed_choice
+        if new_choice != run.parsed_choice:
+            report.transitions[(run.parsed_choice, new_choice)] += 1
+            report.flips.append({
+                "case_id": record.case_id,
+                "model": model_name,
+                "run_index": run_index,
+                "old": run.parsed_choice,
+                "new": new_choice,
+                "parse_method": parse_method,
+            })
+
+        if column:
+            changed |= old_choice != new_choice or column not in run.alternate_parses
+            run.alternate_parses[column] = new_choice
+        else:
+            changed |= old_choice != new_choice or run.parse_method != parse_method
+            run.parsed_choice = new_choice
+            run.parse_method = parse_method
+    return changed
+
+
+def reparse_directory(
+    decisions_dir: str | Path,
+    parser_llm: LLM,
+    prompt_manager: PromptManager | None = None,
+    column: str | None = None,
+    workers: int = 16,
+    max_parse_retries: int = 2,
+    backoff_base: float = 2.0,
+    rate_limiter: RateLimiter | None = None,
+    use_heuristic_parser: bool = False,
+    parser_model: str | None = None,
+    models: list[str] | None = None,
+    dry_run: bool = False,
+    verbose: bool = True,
+) -> ReparseReport:
+    """Re-parse every stored response under a decisions directory.
+
+    Records are streamed: each file is loaded, its runs are queued on the
+    worker pool, and once they finish the record is written back with an
+    atomic replace. Only a bounded number of runs is in flight at a time, so
+    memory stays flat regardless of the directory size.
+
+    Args:
+        decisions_dir: Directory of DecisionRecord JSON files
+        parser_llm: LLM used for responses the heuristic path does not resolve
+        prompt_manager: PromptManager for the parse prompt (created if None)
+        column: Store results in ``alternate_parses[column]`` instead of
+            replacing ``parsed_choice``
+        workers: Number of concurrent parse workers
+        max_parse_retries: Attempts per response before giving up
+        backoff_base: Exponential backoff base (seconds)
+        rate_limiter: Shared per-provider limiter (unlimited if None)
+        use_heuristic_parser: Resolve clear-cut responses locally first
+        parser_model: Configured parser model ID used to pick the provider
+            limiter (defaults to ``parser_llm.model_name``)
+        models: Only re-parse runs of these models (all if None)
+        dry_run: Report flips without writing anything
+        verbose: Show a progress bar
+
+    Returns:
+        ReparseReport with flip details and counts
+
+    Raises:
+        ValueError: If the directory doesn't exist or workers < 1
+    """
+    decisions_dir = Path(decisions_dir)
+    if not decisions_dir.is_dir():
+        raise ValueError(f"Decisions directory does not exist: {decisions_dir}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if prompt_manager is None:
+        prompt_manager = PromptManager()
+    if rate_limiter is None:
+        rate_limiter = RateLimiter()
+
+    report = ReparseReport()
+    record_paths = sorted(decisions_dir.glob("*.json"))
+    max_pending = workers * 8
+    pending: deque[tuple[DecisionRecord, list[tuple[str, int, Future]]]] = deque()
+    pending_runs = 0
+
+    def finish_oldest() -> None:
+        nonlocal pending_runs
+        record, jobs = pending.popleft()
+        pending_runs -= len(jobs)
+        changed = _apply_results(record, jobs, column, report)
+        report.records += 1
+        pbar.update(len(jobs))
+        pbar.set_postfix({"flips": len(report.flips)})
+        if changed and not dry_run:
+            save_decision_record(record, decisions_dir)
+            # Any journaled runs were replayed on load and are now in the record
+            RunJournal(record.case_id, decisions_dir).clear()
+
+    pbar = tqdm(desc="Re-parsing", unit="run", disable=not verbose)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reparse") as executor:
+        for path in record_paths:
+            record = get_decision_record(path.stem, decisions_dir)
+            jobs = []
+            for model_name, model_data in record.models.items():
+                if models and model_name not in models:
+                    continue
+                for run_index, run in enumerate(model_data.runs):
+                    future = executor.submit(
+                        _parse_with_retry,
+                        record.case, run.response_text, parser_llm, prompt_manager,
+                        max_parse_retries, backoff_base, rate_limiter, use_heuristic_parser, parser_model,
+                    )
+                    jobs.append((model_name, run_index, future))
+            pending.append((record, jobs))
+            pending_runs += len(jobs)
+            while pending_runs > max_pending:
+                finish_oldest()
+        while pending:
+            finish_oldest()
+    pbar.close()
+    return report
+
+
+def _write_flips_csv(flips: list[dict], path: str | Path) -> None:
+    fieldnames = ["case_id", "model", "run_index", "old", "new", "parse_method"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(flips)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-parse stored LLM responses without re-running target models")
+    parser.add_argument("decisions_dir", help="Directory of decision records, e.g. data/llm_decisions/physician_recommendation")
+    parser.add_argument("--config", default="src/config/decisions.yaml", help="Config providing parser, retry, rate limit and cache settings")
+    parser.add_argument("--parser-model", help="Parser model (default: execution.parser_model from the config)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--column", help="Write results to alternate_parses[COLUMN] (default)")
+    target.add_argument("--replace", action="store_true", help="Overwrite parsed_choice and parse_method")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent parse workers")
+    parser.add_argument("--models", nargs="+", help="Only re-parse runs of these models")
+    parser.add_argument("--heuristic", action=argparse.BooleanOptionalAction, default=None,
+                        help="Use the local fast path (default: execution.heuristic_parser from the config)")
+    parser.add_argument("--dry-run", action="store_true", help="Report flips without writing records")
+    parser.add_argument("--flips-csv", help="Write every flip to this CSV file")
+    args = parser.parse_args()
+
+    cfg: DictConfig = OmegaConf.load(args.config)
+    parser_model = args.parser_model or cfg.execution.parser_model
+    column = None if args.replace else (args.column or parser_model.replace("/", "_"))
+    use_heuristic = cfg.execution.get("heuristic_parser", False) if args.heuristic is None else args.heuristic
+
+    print(f"Re-parsing {args.decisions_dir} with {parser_model} "
+          f"({'replacing parsed_choice' if column is None else f'column {column!r}'}"
+          f"{', dry run' if args.dry_run else ''})")
+
+    report = reparse_directory(
+        args.decisions_dir,
+        parser_llm=build_llm(parser_model, cfg.get("cache")),
+        column=column,
+        workers=args.workers,
+        max_parse_retries=cfg.retry.max_parse_retries,
+        backoff_base=cfg.retry.backoff_base,
+        rate_limiter=RateLimiter.from_config(cfg),
+        use_heuristic_parser=use_heuristic,
+        parser_model=parser_model,
+        models=args.models,
+        dry_run=args.dry_run,
+    )
+    print(report.summary())
+    if args.flips_csv:
+        _write_flips_csv(report.flips, args.flips_csv)
+        print(f"Flips written to {args.flips_csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,23 @@ import json
 import logging
 import tempfile
 import shutil
-import time
 from pathlib import Path
 
 import hydra
 from omegaconf import DictConfig, OmegaConf
 from tqdm import tqdm
 from all_the_llms import LLM
+from src.case_index import CaseIndex, get_case_index
+from src.llm_cache import CachedLLM, build_llm
 from src.response_models.case import BenchmarkCandidate
 from src.response_models.record import CaseRecord
 from src.response_models.status import CaseStatus
 from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.heuristic_parser import heuristic_parse
 from src.llm_decisions.parser import parse_response
+from src.llm_decisions.rate_limit import RateLimiter, estimate_tokens
+from src.llm_decisions.sampling import StoppingRule, runs_to_request, target_runs
 from src.prompt_manager import PromptManager
 
 # Suppress LiteLLM logging and informational output
@@ -44,21 +49,24 @@ def _load_case_record(case_file: Path) -> CaseRecord | None:
         return None
 
 
-def _get_case_files(cases_dir: Path) -> list[Path]:
-    """Helper to get and validate case files."""
+def _get_case_index(cases_dir: Path) -> CaseIndex:
+    """Helper to get the case index and validate it has case files."""
     if not cases_dir.exists():
         raise ValueError(f"Cases directory does not exist: {cases_dir}")
     
-    case_files = list(cases_dir.glob("case_*.json"))
-    if not case_files:
+    index = get_case_index(cases_dir)
+    if not index.entries():
         raise ValueError(f"No case files found in {cases_dir}")
     
-    return case_files
+    return index
 
 
 def get_approved_case_ids(cases_dir: str | Path = "data/cases") -> list[str]:
     """Get list of all approved case IDs.
     
+    Status and final-case presence are read from the case index, so only
+    files that changed since the last call are parsed.
+    
     Args:
         cases_dir: Path to directory containing case JSON files
     
@@ -68,15 +76,8 @@ def get_approved_case_ids(cases_dir: str | Path = "data/cases") -> list[str]:
     Raises:
         ValueError: If cases directory doesn't exist or has no case files
     """
-    case_files = _get_case_files(Path(cases_dir))
-    
-    approved_ids = []
-    for case_file in case_files:
-        record = _load_case_record(case_file)
-        if record and record.status == CaseStatus.APPROVED and record.final_case:
-            approved_ids.append(record.case_id)
-    
-    return approved_ids
+    index = _get_case_index(Path(cases_dir))
+    return index.case_ids(status=CaseStatus.APPROVED.value, require_final_case=True)
 
 
 def load_case_by_id(case_id: str, cases_dir: str | Path = "data/cases") -> BenchmarkCandidate:
@@ -92,8 +93,7 @@ def load_case_by_id(case_id: str, cases_dir: str | Path = "data/cases") -> Bench
     Raises:
         ValueError: If case is not found, not approved, or has no valid final_case
     """
-    cases_dir = Path(cases_dir)
-    matching_files = list(cases_dir.glob(f"case_{case_id}_*.json"))
+    matching_files = get_case_index(cases_dir).paths_for(case_id)
     
     if not matching_files:
         raise ValueError(f"Case ID not found: {case_id}")
@@ -130,7 +130,8 @@ def get_decision_record(
     """Load existing decision record or create new one for a case.
     
     Enables resume functionality - if a record already exists with partial
-    results, it will be loaded and can be continued.
+    results, it will be loaded and can be continued. Runs left in the case's
+    journal by an interrupted evaluation are replayed onto the record.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -143,12 +144,17 @@ def get_decision_record(
         
         if record.case_id != case_id:
             raise ValueError(f"Record file contains case_id {record.case_id}, expected {case_id}")
-        
-        return record
+    else:
+        # Create new record
+        case = load_case_by_id(case_id, cases_dir)
+        record = DecisionRecord(case_id=case_id, case=case)
+    
+    # Crash recovery: apply runs that were journaled but never compacted
+    replayed = RunJournal(case_id, output_dir).replay(record)
+    if replayed:
+        tqdm.write(f"Recovered {replayed} journaled runs for {case_id}")
     
-    # Create new record
-    case = load_case_by_id(case_id, cases_dir)
-    return DecisionRecord(case_id=case_id, case=case)
+    return record
 
 
 def save_decision_record(record: DecisionRecord, output_dir: str | Path = "data/llm_decisions") -> None:
@@ -167,6 +173,40 @@ def save_decision_record(record: DecisionRecord, output_dir: str | Path = "data/
     shutil.move(tmp_path, record_path)
 
 
+def append_run(
+    record: DecisionRecord,
+    model_name: str,
+    result: RunResult,
+    journal: RunJournal,
+    output_dir: str | Path = "data/llm_decisions",
+    compact_every: int = 25,
+) -> None:
+    """Add a run to a record, journaling it instead of rewriting the record.
+    
+    The run is appended to the case's journal (a few KB) and to the in-memory
+    record. The full record is only rewritten once ``compact_every`` runs have
+    accumulated in the journal (0 disables periodic compaction).
+    """
+    model_data = record.models[model_name]
+    journal.append(model_name, len(model_data.runs), model_data.temperature, result)
+    model_data.runs.append(result)
+    
+    if compact_every > 0 and journal.pending >= compact_every:
+        compact_decision_record(record, journal, output_dir)
+
+
+def compact_decision_record(
+    record: DecisionRecord,
+    journal: RunJournal,
+    output_dir: str | Path = "data/llm_decisions",
+) -> None:
+    """Write the canonical record JSON and drop the journal it now contains."""
+    if journal.pending == 0:
+        return
+    save_decision_record(record, output_dir)
+    journal.clear()
+
+
 def get_or_create_model_data(record: DecisionRecord, model_name: str, temperature: float) -> ModelDecisionData:
     """Get existing model data or create new entry in the record."""
     if model_name not in record.models:
@@ -181,11 +221,27 @@ def call_target_llm(
     prompt_workflow: str,
     max_api_retries: int = 3,
     backoff_base: float = 2.0,
-    prompt_manager: PromptManager | None = None
+    prompt_manager: PromptManager | None = None,
+    rate_limiter: RateLimiter | None = None,
+    sample_index: int | None = None,
+    n: int = 1,
+    model_id: str | None = None
 ) -> dict:
-    """Call target LLM with specified prompt workflow and retry logic."""
+    """Call target LLM with specified prompt workflow and retry logic.
+    
+    Calls go through the provider's limiter in ``rate_limiter`` (an unlimited
+    one if not given), which spaces retries with jittered backoff and slows
+    down when the provider returns 429/5xx errors. When ``llm`` is a
+    ``CachedLLM``, ``sample_index`` (the run index) selects the cached sample.
+    With ``n > 1`` all samples are requested in one call and the response
+    holds one entry per sample in ``choices``. ``model_id`` is the configured
+    model ID (as listed in ``cfg.models``) that selects the provider limiter;
+    it defaults to ``llm.model_name``, which may be a router-resolved ID.
+    """
     if prompt_manager is None:
         prompt_manager = PromptManager()
+    if rate_limiter is None:
+        rate_limiter = RateLimiter()
     
     messages = prompt_manager.build_messages(
         prompt_workflow,
@@ -196,32 +252,69 @@ def call_target_llm(
         }
     )
     
-    last_exception = None
+    extra_kwargs = {"sample_index": sample_index} if isinstance(llm, CachedLLM) else {}
+    if n > 1:
+        extra_kwargs["n"] = n
+    
+    try:
+        response = rate_limiter.call(
+            model_id or getattr(llm, "model_name", "default"),
+            lambda: llm.completion(messages=messages, temperature=temperature, **extra_kwargs),
+            max_retries=max_api_retries,
+            backoff_base=backoff_base,
+            estimated_tokens=estimate_tokens(messages),
+            label="LLM call",
+        )
+    except Exception as e:
+        raise Exception(f"Failed to get response after {max_api_retries} attempts") from e
     
-    for attempt in range(max_api_retries):
+    # Convert response to dict
+    if hasattr(response, 'model_dump'):
+        return response.model_dump()
+    elif hasattr(response, 'dict'):
+        return response.dict()
+    else:
+        return dict(response)
+
+
+_MULTI_SAMPLE_SUPPORT: dict[str, bool] = {}
+
+
+def supports_multi_sample(llm: LLM) -> bool:
+    """Whether a model accepts ``n > 1`` in a single completion request.
+    
+    Based on litellm's list of supported OpenAI parameters for the model. The
+    answer is downgraded at runtime if the provider silently returns fewer
+    choices than requested (see ``_run_multi_evaluation``).
+    """
+    model_name = getattr(llm, "model_name", None)
+    if not model_name:
+        return False
+    if model_name not in _MULTI_SAMPLE_SUPPORT:
         try:
-            response = llm.completion(messages=messages, temperature=temperature)
-            
-            # Convert response to dict
-            if hasattr(response, 'model_dump'):
-                return response.model_dump()
-            elif hasattr(response, 'dict'):
-                return response.dict()
-            else:
-                return dict(response)
-                
-        except Exception as e:
-            last_exception = e
-            
-            if attempt == max_api_retries - 1:
-                break
-            
-            delay = backoff_base ** attempt
-            print(f"Warning: LLM call failed (attempt {attempt + 1}/{max_api_retries}): {e}")
-            print(f"Retrying in {delay:.1f} seconds...")
-            time.sleep(delay)
+            params = litellm.get_supported_openai_params(model=model_name) or []
+        except Exception:
+            params = []
+        _MULTI_SAMPLE_SUPPORT[model_name] = "n" in params
+    return _MULTI_SAMPLE_SUPPORT[model_name]
+
+
+def _split_multi_sample(full_response: dict) -> list[dict]:
+    """Split an ``n > 1`` response into one single-choice response per sample.
     
-    raise Exception(f"Failed to get response after {max_api_retries} attempts") from last_exception
+    Each part keeps the shared metadata (model, usage, created, ...) plus a
+    ``multi_sample`` entry recording the batch size and the sample's position,
+    so token usage can be de-duplicated in cost analyses.
+    """
+    choices = full_response.get("choices") or []
+    return [
+        {
+            **full_response,
+            "choices": [choice],
+            "multi_sample": {"n": len(choices), "choice_index": i},
+        }
+        for i, choice in enumerate(choices)
+    ]
 
 
 def get_case_ids_from_config(config: DictConfig, cases_dir: str | Path = "data/cases") -> list[str]:
@@ -233,13 +326,7 @@ def get_case_ids_from_config(config: DictConfig, cases_dir: str | Path = "data/c
         return get_approved_case_ids(cases_dir)
     
     elif mode == "all":
-        case_files = _get_case_files(Path(cases_dir))
-        case_ids = []
-        for case_file in case_files:
-            record = _load_case_record(case_file)
-            if record:
-                case_ids.append(record.case_id)
-        return case_ids
+        return _get_case_index(Path(cases_dir)).case_ids()
     
     elif mode == "explicit":
         case_ids = case_selection.get("case_ids", [])
@@ -257,25 +344,49 @@ def _parse_with_retry(
     parser_llm: LLM,
     prompt_manager: PromptManager,
     max_retries: int,
-    backoff_base: float
-) -> str | None:
-    """Parse LLM response with retry logic."""
-    for attempt in range(max_retries):
-        try:
-            parsed_decision = parse_response(
+    backoff_base: float,
+    rate_limiter: RateLimiter | None = None,
+    use_heuristic_parser: bool = False,
+    parser_model: str | None = None
+) -> tuple[str, str] | None:
+    """Parse LLM response with retry logic (shares the provider limiter with target calls).
+    
+    With ``use_heuristic_parser``, clear-cut responses are resolved locally and
+    only ambiguous ones are sent to the parser model. ``parser_model`` is the
+    configured parser model ID that selects the provider limiter (defaults to
+    ``parser_llm.model_name``).
+    
+    Returns:
+        Tuple of (parsed choice, parse method), or None if parsing failed
+    """
+    if use_heuristic_parser:
+        decision = heuristic_parse(case.choice_1.choice, case.choice_2.choice, response_text)
+        if decision is not None:
+            return decision.selected_choice, decision.parse_method
+    
+    if rate_limiter is None:
+        rate_limiter = RateLimiter()
+    
+    try:
+        parsed_decision = rate_limiter.call(
+            parser_model or getattr(parser_llm, "model_name", "default"),
+            lambda: parse_response(
                 choice_1_text=case.choice_1.choice,
                 choice_2_text=case.choice_2.choice,
                 llm_response=response_text,
                 parser_llm=parser_llm,
                 prompt_manager=prompt_manager
-            )
-            return parsed_decision.selected_choice
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(backoff_base ** attempt)
-            else:
-                tqdm.write(f"PARSE ERROR: {e}")
-                return None
+            ),
+            max_retries=max_retries,
+            backoff_base=backoff_base,
+            estimated_tokens=estimate_tokens(response_text),
+            label="Parse call",
+            verbose=False,
+        )
+        return parsed_decision.selected_choice, "llm"
+    except Exception as e:
+        tqdm.write(f"PARSE ERROR: {e}")
+        return None
 
 
 def _run_single_evaluation(
@@ -287,7 +398,12 @@ def _run_single_evaluation(
     max_parse_retries: int,
     backoff_base: float,
     parser_llm: LLM,
-    prompt_manager: PromptManager
+    prompt_manager: PromptManager,
+    rate_limiter: RateLimiter | None = None,
+    sample_index: int | None = None,
+    use_heuristic_parser: bool = False,
+    model_id: str | None = None,
+    parser_model: str | None = None
 ) -> RunResult | None:
     """Run a single evaluation and return the result."""
     try:
@@ -299,25 +415,145 @@ def _run_single_evaluation(
             prompt_workflow=prompt_workflow,
             max_api_retries=max_api_retries,
             backoff_base=backoff_base,
-            prompt_manager=prompt_manager
+            prompt_manager=prompt_manager,
+            rate_limiter=rate_limiter,
+            sample_index=sample_index,
+            model_id=model_id
         )
         
         # Extract and parse response
         response_text = full_response.get("choices", [{}])[0].get("message", {}).get("content", "")
-        parsed_choice = _parse_with_retry(
-            case, response_text, parser_llm, prompt_manager, max_parse_retries, backoff_base
+        parsed = _parse_with_retry(
+            case, response_text, parser_llm, prompt_manager, max_parse_retries, backoff_base,
+            rate_limiter, use_heuristic_parser, parser_model
         )
         
-        if not parsed_choice:
+        if not parsed:
             return None
         
-        return RunResult(full_response=full_response, parsed_choice=parsed_choice)
+        parsed_choice, parse_method = parsed
+        return RunResult(full_response=full_response, parsed_choice=parsed_choice, parse_method=parse_method)
         
     except Exception as e:
         tqdm.write(f"ERROR: {e}")
         return None
 
 
+def _run_multi_evaluation(
+    llm: LLM,
+    case: BenchmarkCandidate,
+    n: int,
+    temperature: float,
+    prompt_workflow: str,
+    max_api_retries: int,
+    max_parse_retries: int,
+    backoff_base: float,
+    parser_llm: LLM,
+    prompt_manager: PromptManager,
+    rate_limiter: RateLimiter | None = None,
+    sample_index: int | None = None,
+    use_heuristic_parser: bool = False,
+    model_id: str | None = None,
+    parser_model: str | None = None
+) -> list[RunResult]:
+    """Collect up to ``n`` runs from a single ``n``-sample request.
+    
+    Returns the runs that were parsed successfully, which may be fewer than
+    ``n``; callers fill the gap with separate calls. If the provider returns
+    only one choice, the model is marked as not supporting multi-sample
+    requests for the rest of the process.
+    """
+    try:
+        full_response = call_target_llm(
+            llm=llm,
+            case=case,
+            temperature=temperature,
+            prompt_workflow=prompt_workflow,
+            max_api_retries=max_api_retries,
+            backoff_base=backoff_base,
+            prompt_manager=prompt_manager,
+            rate_limiter=rate_limiter,
+            sample_index=sample_index,
+            n=n,
+            model_id=model_id
+        )
+    except Exception as e:
+        tqdm.write(f"ERROR: {e}")
+        return []
+    
+    samples = _split_multi_sample(full_response)
+    if n > 1 and len(samples) <= 1:
+        _MULTI_SAMPLE_SUPPORT[getattr(llm, "model_name", "")] = False
+    
+    results = []
+    for sample in samples[:n]:
+        response_text = sample["choices"][0].get("message", {}).get("content", "")
+        parsed = _parse_with_retry(
+            case, response_text, parser_llm, prompt_manager, max_parse_retries, backoff_base,
+            rate_limiter, use_heuristic_parser, parser_model
+        )
+        if parsed:
+            parsed_choice, parse_method = parsed
+            results.append(RunResult(full_response=sample, parsed_choice=parsed_choice, parse_method=parse_method))
+    return results
+
+
+def _sync_record_prompts(
+    record: DecisionRecord,
+    prompt_manager: PromptManager,
+    prompt_workflow: str,
+    output_dir: str | Path,
+) -> bool:
+    """Store the rendered prompts on a record, or check they match existing ones.
+    
+    Returns:
+        True if runs may be written to the record, False on a prompt mismatch.
+    """
+    case_id = record.case_id
+    
+    # Build prompts from workflow
+    messages = prompt_manager.build_messages(
+        prompt_workflow,
+        {
+            "vignette": record.case.vignette,
+            "choice_1": record.case.choice_1.choice,
+            "choice_2": record.case.choice_2.choice
+        }
+    )
+    # Extract system and user prompts from messages
+    current_system_prompt = None
+    current_user_prompt = None
+    for msg in messages:
+        if msg["role"] == "system":
+            current_system_prompt = msg["content"]
+        elif msg["role"] == "user":
+            current_user_prompt = msg["content"]
+    
+    # Validate or store prompts
+    prompts_updated = False
+    if record.system_prompt is None:
+        tqdm.write(f"Found DecisionRecord with no system_prompt for {case_id}, setting it")
+        record.system_prompt = current_system_prompt
+        prompts_updated = True
+    elif record.system_prompt != current_system_prompt:
+        tqdm.write(f"ERROR: System prompt mismatch for case {case_id}. Cannot write model runs to record. Skipping.")
+        return False
+    
+    if record.user_prompt is None:
+        tqdm.write(f"Found DecisionRecord with no user_prompt for {case_id}, setting it")
+        record.user_prompt = current_user_prompt
+        prompts_updated = True
+    elif record.user_prompt != current_user_prompt:
+        tqdm.write(f"ERROR: User prompt mismatch for case {case_id}. Skipping.")
+        return False
+    
+    # Save immediately if prompts were updated
+    if prompts_updated:
+        save_decision_record(record, output_dir)
+    
+    return True
+
+
 @hydra.main(version_base=None, config_path="../config", config_name="decisions")
 def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbose: bool = True) -> None:
     """Main execution loop for LLM decision evaluation with resume support."""
@@ -331,17 +567,50 @@ def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbos
     
     # Initialize shared resources
     prompt_manager = PromptManager()
-    parser_llm = LLM(cfg.execution.parser_model)
+    parser_llm = build_llm(cfg.execution.parser_model, cfg.get("cache"))
+
+    # One limiter per provider, shared by the target models and the parser
+    rate_limiter = RateLimiter.from_config(cfg)
+
+    # Batch mode submits the missing cells as provider batch jobs; the target
+    # models are called by the provider, not by this process
+    mode = cfg.execution.get("mode", "serial")
+    if mode == "batch":
+        from src.llm_decisions.batch import interactive_models, run_batch
+        run_batch(cfg, case_ids, parser_llm, prompt_manager, cases_dir, verbose, rate_limiter)
+        # Models without a batch API are evaluated with the interactive path
+        fallback_models = interactive_models(cfg)
+        if not fallback_models:
+            return
+        mode = (cfg.get("batch", None) or {}).get("fallback_mode", "serial")
+        if verbose:
+            print(f"No batch API for {', '.join(fallback_models)}; running them in {mode} mode")
+        cfg = OmegaConf.merge(cfg, {"models": fallback_models})
     
     # Create model instances once and reuse them
     model_llms = {}
     for model_name in cfg.models:
-        model = LLM(model_name)
+        model = build_llm(model_name, cfg.get("cache"))
         print(f"Looking for {model_name} and found {model.model_name}")
         model_llms[model_name] = model
+
+    # Async mode keeps many (case, model, run) cells in flight at once
+    if mode == "async":
+        from src.llm_decisions.engine import run_grid_async
+        run_grid_async(cfg, case_ids, model_llms, parser_llm, prompt_manager, cases_dir, verbose, rate_limiter)
+        return
+    elif mode != "serial":
+        raise ValueError(f"Invalid execution mode: '{mode}'. Must be 'serial', 'async' or 'batch'")
+
+    # With adaptive sampling, runs are drawn until the stopping rule is met
+    # (between min_runs and max_runs) instead of a fixed runs_per_model
+    stopping = StoppingRule.from_config(cfg)
+    max_runs = target_runs(cfg, stopping)
     
     total_runs_completed = 0
-    total_expected_runs = len(cfg.models) * len(case_ids) * cfg.execution.runs_per_model
+    total_expected_runs = len(cfg.models) * len(case_ids) * max_runs
+    compact_every = cfg.output.get("compact_every", 25)
+    multi_sample = cfg.execution.get("multi_sample", False)
     
     # Main loop with progress bars
     for case_id in tqdm(case_ids, desc="Cases", position=0, disable=not verbose):
@@ -351,67 +620,59 @@ def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbos
             tqdm.write(f"ERROR: Failed to load case {case_id}: {e}")
             continue
         
-        # Build prompts from workflow
-        messages = prompt_manager.build_messages(
-            cfg.execution.prompt_workflow,
-            {
-                "vignette": record.case.vignette,
-                "choice_1": record.case.choice_1.choice,
-                "choice_2": record.case.choice_2.choice
-            }
-        )
-        # Extract system and user prompts from messages
-        current_system_prompt = None
-        current_user_prompt = None
-        for msg in messages:
-            if msg["role"] == "system":
-                current_system_prompt = msg["content"]
-            elif msg["role"] == "user":
-                current_user_prompt = msg["content"]
-        
-        # Validate or store prompts
-        prompts_updated = False
-        if record.system_prompt is None:
-            tqdm.write(f"Found DecisionRecord with no system_prompt for {case_id}, setting it")
-            record.system_prompt = current_system_prompt
-            prompts_updated = True
-        elif record.system_prompt != current_system_prompt:
-            tqdm.write(f"ERROR: System prompt mismatch for case {case_id}. Cannot write model runs to record. Skipping.")
-            continue
-        
-        if record.user_prompt is None:
-            tqdm.write(f"Found DecisionRecord with no user_prompt for {case_id}, setting it")
-            record.user_prompt = current_user_prompt
-            prompts_updated = True
-        elif record.user_prompt != current_user_prompt:
-            tqdm.write(f"ERROR: User prompt mismatch for case {case_id}. Skipping.")
+        if not _sync_record_prompts(record, prompt_manager, cfg.execution.prompt_workflow, cfg.output.dir):
             continue
         
-        # Save immediately if prompts were updated
-        if prompts_updated:
-            save_decision_record(record, cfg.output.dir)
+        journal = RunJournal(case_id, cfg.output.dir)
         
         for model_name in tqdm(cfg.models, desc="Models", position=1, leave=False, disable=not verbose):
             try:
                 model_data = get_or_create_model_data(record, model_name, cfg.execution.temperature)
                 runs_completed = model_data.runs_completed
+                remaining = runs_to_request(model_data.runs, cfg.execution.runs_per_model, stopping)
                 
-                if runs_completed >= cfg.execution.runs_per_model:
-                    total_runs_completed += cfg.execution.runs_per_model
+                if remaining == 0:
+                    total_runs_completed += min(runs_completed, max_runs)
                     continue
                 
-                # Run missing evaluations
+                # Request all remaining runs in one n-sample call where supported
+                if multi_sample and remaining > 1 and supports_multi_sample(model_llms[model_name]):
+                    results = _run_multi_evaluation(
+                        llm=model_llms[model_name],
+                        case=record.case,
+                        n=remaining,
+                        temperature=cfg.execution.temperature,
+                        prompt_workflow=cfg.execution.prompt_workflow,
+                        max_api_retries=cfg.retry.max_api_retries,
+                        max_parse_retries=cfg.retry.max_parse_retries,
+                        backoff_base=cfg.retry.backoff_base,
+                        parser_llm=parser_llm,
+                        prompt_manager=prompt_manager,
+                        rate_limiter=rate_limiter,
+                        sample_index=runs_completed,
+                        use_heuristic_parser=cfg.execution.get("heuristic_parser", False),
+                        model_id=model_name,
+                        parser_model=cfg.execution.parser_model
+                    )
+                    for result in results:
+                        append_run(record, model_name, result, journal, cfg.output.dir, compact_every)
+                        total_runs_completed += 1
+                    runs_completed = model_data.runs_completed
+                
+                # Run missing evaluations (separate calls for anything still missing)
                 runs_pbar = tqdm(
-                    range(runs_completed, cfg.execution.runs_per_model),
+                    range(runs_completed, max_runs),
                     desc="Runs",
                     position=2,
                     leave=False,
                     disable=not verbose,
                     initial=runs_completed,
-                    total=cfg.execution.runs_per_model
+                    total=max_runs
                 )
                 
-                for _ in runs_pbar:
+                for run_index in runs_pbar:
+                    if stopping and stopping.should_stop(model_data.runs):
+                        break
                     try:
                         result = _run_single_evaluation(
                             llm=model_llms[model_name],
@@ -422,12 +683,16 @@ def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbos
                             max_parse_retries=cfg.retry.max_parse_retries,
                             backoff_base=cfg.retry.backoff_base,
                             parser_llm=parser_llm,
-                            prompt_manager=prompt_manager
+                            prompt_manager=prompt_manager,
+                            rate_limiter=rate_limiter,
+                            sample_index=run_index,
+                            use_heuristic_parser=cfg.execution.get("heuristic_parser", False),
+                            model_id=model_name,
+                            parser_model=cfg.execution.parser_model
                         )
                         
                         if result:
-                            model_data.runs.append(result)
-                            save_decision_record(record, cfg.output.dir)
+                            append_run(record, model_name, result, journal, cfg.output.dir, compact_every)
                             total_runs_completed += 1
                             runs_pbar.set_postfix({"choice": result.parsed_choice})
                             
@@ -435,7 +700,7 @@ def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbos
                         if verbose:
                             tqdm.write("\n\nInterrupted by user. Saving progress...")
                             tqdm.write(f"Completed {total_runs_completed}/{total_expected_runs} runs ({100*total_runs_completed/total_expected_runs:.1f}%)")
-                        save_decision_record(record, cfg.output.dir)
+                        compact_decision_record(record, journal, cfg.output.dir)
                         raise
                 
                 runs_pbar.close()
@@ -444,6 +709,9 @@ def run_evaluation(cfg: DictConfig, cases_dir: str | Path = "data/cases", verbos
                 raise
             except Exception as e:
                 tqdm.write(f"ERROR with model {model_name}: {e}")
+        
+        # Fold this case's journal into the record before moving on
+        compact_decision_record(record, journal, cfg.output.dir)
     
     if verbose:
         print(f"\n✓ Evaluation complete!")
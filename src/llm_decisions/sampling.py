@@ -0,0 +1,208 @@
+"""Sequential early stopping for the number of runs per case/model.
+
+A fixed ``runs_per_model`` spends as many calls on a model that answers the
+same way every time as on one that is genuinely split, although only the
+split pairs move the entropy and consistency metrics. With adaptive sampling
+enabled, runs are drawn until a stopping rule says the choice distribution is
+pinned down, between ``min_runs`` and ``max_runs``:
+
+- ``interval``: stop once the equal-tailed credible interval for
+  P(choice_1) under a Jeffreys Beta(1/2, 1/2) prior is at most ``max_width``
+  wide. Intervals shrink fastest for near-unanimous pairs, so these stop
+  early while split pairs keep sampling.
+- ``sprt``: Wald's sequential probability ratio test of "unanimous" (the
+  majority choice has probability ``p_unanimous``) against "split"
+  (probability ``p_split``). Sampling stops when the test accepts
+  "unanimous"; once it accepts "split" the pair is sampled up to
+  ``max_runs``. ``beta`` bounds the rate at which a split pair is wrongly
+  stopped as unanimous.
+
+Refusals count towards the run budget but carry no information about
+P(choice_1). A pair that has only refused after ``min_runs`` is stopped
+(reason ``refused``): neither rule can ever narrow down its choices, so it
+would otherwise use the whole ``max_runs`` budget.
+
+Replay the rule on stored runs to see how many calls it would have saved:
+
+    python -m src.llm_decisions.stopping_replay data/llm_decisions/physician_recommendation --max-runs 10
+"""
+
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from omegaconf import DictConfig
+from scipy.stats import beta as beta_dist
+
+from src.llm_decisions.models import RunResult, RunSummary
+
+
+@dataclass
+class StoppingRule:
+    """Stopping rule for adaptive sampling.
+
+    Attributes:
+        min_runs: Runs always drawn before the rule is consulted
+        max_runs: Hard budget per case/model
+        rule: 'interval' (Bayesian credible interval) or 'sprt'
+        max_width: Interval rule: stop when the credible interval is at most this wide
+        credibility: Interval rule: mass of the credible interval
+        p_unanimous: SPRT: majority-choice probability of a unanimous pair
+        p_split: SPRT: majority-choice probability of a split pair
+        alpha: SPRT: rate of calling a unanimous pair split (keeps sampling)
+        beta: SPRT: rate of calling a split pair unanimous (stops too early)
+        batch_size: Runs requested per step once min_runs is reached
+    """
+    min_runs: int = 3
+    max_runs: int = 10
+    rule: Literal["interval", "sprt"] = "interval"
+    max_width: float = 0.3
+    credibility: float = 0.95
+    p_unanimous: float = 0.95
+    p_split: float = 0.6
+    alpha: float = 0.2
+    beta: float = 0.05
+    batch_size: int = 1
+
+    def __post_init__(self):
+        if not 1 <= self.min_runs <= self.max_runs:
+            raise ValueError(f"Need 1 <= min_runs <= max_runs, got min_runs={self.min_runs}, max_runs={self.max_runs}")
+        if self.rule not in ("interval", "sprt"):
+            raise ValueError(f"Invalid stopping rule: '{self.rule}'. Must be 'interval' or 'sprt'")
+        if not 0.5 <= self.p_split < self.p_unanimous < 1:
+            raise ValueError(f"Need 0.5 <= p_split < p_unanimous < 1, got {self.p_split}, {self.p_unanimous}")
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+
+    @classmethod
+    def from_config(cls, cfg: DictConfig) -> "StoppingRule | None":
+        """Build the rule from ``execution.adaptive_sampling`` (None if disabled)."""
+        section = cfg.execution.get("adaptive_sampling", None) or {}
+        if not section.get("enabled", False):
+            return None
+        fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in section.items() if k in fields})
+
+    def credible_interval(self, summary: RunSummary) -> tuple[float, float]:
+        """Equal-tailed credible interval for P(choice_1) (Jeffreys prior)."""
+        a = summary.choice_1_count + 0.5
+        b = summary.choice_2_count + 0.5
+        tail = (1 - self.credibility) / 2
+        return float(beta_dist.ppf(tail, a, b)), float(beta_dist.ppf(1 - tail, a, b))
+
+    def sprt_llr(self, summary: RunSummary) -> float:
+        """Log-likelihood ratio of 'split' over 'unanimous' for the majority count."""
+        majority = max(summary.choice_1_count, summary.choice_2_count)
+        minority = summary.total_valid_runs - majority
+        return (
+            majority * math.log(self.p_split / self.p_unanimous)
+            + minority * math.log((1 - self.p_split) / (1 - self.p_unanimous))
+        )
+
+    def stop_reason(self, runs: list[RunResult]) -> str | None:
+        """Why sampling should stop for these runs, or None to keep sampling."""
+        if len(runs) >= self.max_runs:
+            return "max_runs"
+        if len(runs) < self.min_runs:
+            return None
+
+        summary = RunSummary(runs=runs)
+        if summary.total_valid_runs == 0:
+            return "refused"
+        if self.rule == "interval":
+            low, high = self.credible_interval(summary)
+            return "interval" if high - low <= self.max_width else None
+
+        llr = self.sprt_llr(summary)
+        if llr <= math.log(self.beta / (1 - self.alpha)):
+            return "sprt"
+        # Accepting 'split' (or no decision yet) means sampling on to max_runs
+        return None
+
+    def should_stop(self, runs: list[RunResult]) -> bool:
+        return self.stop_reason(runs) is not None
+
+    def runs_to_request(self, runs: list[RunResult]) -> int:
+        """Number of runs to draw next (0 once the rule says stop)."""
+        if len(runs) < self.min_runs:
+            return self.min_runs - len(runs)
+        if self.should_stop(runs):
+            return 0
+        return min(self.batch_size, self.max_runs - len(runs))
+
+
+def target_runs(cfg: DictConfig, stopping: StoppingRule | None = None) -> int:
+    """Maximum number of runs per case/model (``max_runs`` when adaptive)."""
+    return stopping.max_runs if stopping else cfg.execution.runs_per_model
+
+
+def runs_to_request(runs: list[RunResult], runs_per_model: int, stopping: StoppingRule | None = None) -> int:
+    """Runs still to draw for a case/model under the fixed or adaptive budget."""
+    if stopping is None:
+        return max(0, runs_per_model - len(runs))
+    return stopping.runs_to_request(runs)
+
+
+@dataclass
+class StoppingSimulation:
+    """Outcome of replaying a stopping rule on stored runs."""
+    pairs: int = 0
+    runs_stored: int = 0
+    runs_used: int = 0
+    majority_changed: int = 0
+    reasons: Counter = field(default_factory=Counter)
+    runs_used_by_stored_majority: Counter = field(default_factory=Counter)
+    pairs_by_stored_majority: Counter = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        saved = 1 - self.runs_used / self.runs_stored if self.runs_stored else 0.0
+        lines = [
+            f"Case/model pairs:  {self.pairs:,}",
+            f"Runs used:         {self.runs_used:,} of {self.runs_stored:,} stored ({100 * saved:.1f}% saved)",
+            f"Majority changed:  {self.majority_changed:,} pairs",
+            "Stop reasons:      " + ", ".join(f"{r}={c:,}" for r, c in self.reasons.most_common()),
+        ]
+        for share in sorted(self.pairs_by_stored_majority, reverse=True):
+            pairs = self.pairs_by_stored_majority[share]
+            mean_runs = self.runs_used_by_stored_majority[share] / pairs
+            lines.append(f"  stored majority {share:>4.0%}: {pairs:>4,} pairs, {mean_runs:.1f} runs on average")
+        return "\n".join(lines)
+
+
+def simulate_stopping(decisions_dir: str | Path, stopping: StoppingRule) -> StoppingSimulation:
+    """Replay a stopping rule on the runs stored in a decisions directory.
+
+    Runs are consumed in stored order until the rule stops (or the stored
+    runs run out). The majority choice at the stopping point is compared with
+    the majority over all stored runs.
+    """
+    simulation = StoppingSimulation()
+    for path in sorted(Path(decisions_dir).glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+        for model_data in record.get("models", {}).values():
+            runs = [RunResult(full_response={}, parsed_choice=r["parsed_choice"]) for r in model_data.get("runs", [])]
+            if not runs:
+                continue
+            used = len(runs)
+            reason = "exhausted"
+            for n in range(1, len(runs) + 1):
+                reason_n = stopping.stop_reason(runs[:n])
+                if reason_n is not None:
+                    used, reason = n, reason_n
+                    break
+
+            full = RunSummary(runs=runs)
+            simulation.pairs += 1
+            simulation.runs_stored += len(runs)
+            simulation.runs_used += used
+            simulation.reasons[reason] += 1
+            simulation.majority_changed += RunSummary(runs=runs[:used]).majority_choice != full.majority_choice
+            share = round(full.majority_choice_probability or 0.0, 1)
+            simulation.pairs_by_stored_majority[share] += 1
+            simulation.runs_used_by_stored_majority[share] += used
+    return simulation
+
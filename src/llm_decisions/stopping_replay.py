@@ -0,0 +1,44 @@
+"""Replay of an adaptive stopping rule on stored runs.
+
+Shows how many calls a ``StoppingRule`` would have saved on the runs already
+stored in decision records, and how often it would have changed the majority
+choice (see ``simulate_stopping``).
+
+Usage:
+    python -m src.llm_decisions.stopping_replay data/llm_decisions/physician_recommendation --max-runs 10
+"""
+
+import argparse
+
+from src.llm_decisions.sampling import StoppingRule, simulate_stopping
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay an adaptive stopping rule on stored runs")
+    parser.add_argument(
+        "decisions_dirs",
+        nargs="*",
+        default=["data/llm_decisions/physician_recommendation"],
+        help="Directories of decision record JSON files",
+    )
+    parser.add_argument("--rule", choices=["interval", "sprt"], default="interval")
+    parser.add_argument("--min-runs", type=int, default=3)
+    parser.add_argument("--max-runs", type=int, default=10)
+    parser.add_argument("--max-width", type=float, default=0.3, help="Interval rule: maximum credible interval width")
+    parser.add_argument("--p-split", type=float, default=0.6, help="SPRT: majority probability of a split pair")
+    args = parser.parse_args()
+
+    stopping = StoppingRule(
+        min_runs=args.min_runs,
+        max_runs=args.max_runs,
+        rule=args.rule,
+        max_width=args.max_width,
+        p_split=args.p_split,
+    )
+    for decisions_dir in args.decisions_dirs:
+        print(f"\n{decisions_dir}")
+        print(simulate_stopping(decisions_dir, stopping).summary())
+
+
+if __name__ == "__main__":
+    main()
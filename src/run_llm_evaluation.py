@@ -17,6 +17,9 @@ Usage:
     # Change output directory
     uv run python src/run_llm_evaluation.py output.dir=data/my_results
 
+    # Keep up to 32 evaluations in flight at once
+    uv run python src/run_llm_evaluation.py execution.mode=async execution.concurrency.max_in_flight=32
+
 The script uses Hydra for configuration management and is fully resumable - 
 if interrupted, running it again will pick up where it left off.
 """
@@ -23,6 +23,7 @@ from typing import Optional
 
 import gspread
 
+from src.case_index import get_case_index
 from src.sheets.utils import load_config, get_gspread_client, open_spreadsheet, get_worksheet
 
 
@@ -43,7 +44,9 @@ def load_cases_raw(cases_dir: str) -> list[dict]:
         raise FileNotFoundError(f"Cases directory not found: {cases_path}")
     
     cases = []
-    json_files = sorted(cases_path.glob("case_*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    index = get_case_index(cases_path)
+    entries = sorted(index.entries(), key=lambda e: e.mtime_ns, reverse=True)
+    json_files = [cases_path / e.filename for e in entries]
     
     for file_path in json_files:
         try:
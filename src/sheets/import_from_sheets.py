@@ -41,6 +41,7 @@ from dataclasses import dataclass
 import gspread
 from pydantic import ValidationError
 
+from src.case_index import get_case_index
 from src.sheets.utils import load_config, get_gspread_client, open_spreadsheet, get_worksheet
 from src.response_models.case import BenchmarkCandidate, ChoiceWithValues, ValueAlignmentStatus
 from src.response_models.status import CaseStatus
@@ -978,10 +979,8 @@ def update_case_json(
         - unchanged: True if data matched and no update was needed, False if updated
         - new_status: The new status value if status changed, None otherwise
     """
-    cases_path = Path(cases_dir)
-    
-    # Find the case file by case_id
-    matching_files = list(cases_path.glob(f"case_{case_id}_*.json"))
+    # Find the case file by case_id (sorted oldest to newest)
+    matching_files = get_case_index(cases_dir).paths_for(case_id)
     
     if not matching_files:
         if verbose:
@@ -992,7 +991,7 @@ def update_case_json(
         print(f"  ⚠️  Multiple files found for {case_id}, using most recent")
     
     # Use the most recently modified file
-    case_file = max(matching_files, key=lambda p: p.stat().st_mtime)
+    case_file = matching_files[-1]
     
     # Load the existing case data
     with open(case_file, 'r', encoding='utf-8') as f:
@@ -0,0 +1,38 @@
+"""Random DecisionTensor builder shared by the analysis tests."""
+
+import numpy as np
+
+from src.analysis.tensor import DecisionTensor
+from src.response_models.case import VALUE_NAMES
+
+
+def random_tensor(
+    n_cases: int = 20,
+    seed: int = 0,
+    decision_makers: tuple[str, ...] = ("a/x", "b/y"),
+    random_alignment: bool = False,
+) -> DecisionTensor:
+    """DecisionTensor with random choice counts (0-3 per choice) for every decision-maker.
+
+    Choice 1 promotes autonomy and violates beneficence on every case, choice 2
+    the reverse; with ``random_alignment`` the two opposed values are drawn per
+    case, and every other value is neutral.
+    """
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 4, size=(n_cases, len(decision_makers), 3))
+    alignment = np.zeros((n_cases, len(VALUE_NAMES), 2), dtype=np.int8)
+    if random_alignment:
+        for i in range(n_cases):
+            up, down = rng.choice(len(VALUE_NAMES), size=2, replace=False)
+            alignment[i, up] = [1, -1]
+            alignment[i, down] = [-1, 1]
+    else:
+        alignment[:, 0] = [1, -1]
+        alignment[:, 1] = [-1, 1]
+    return DecisionTensor(
+        counts=counts,
+        present=np.ones(counts.shape[:2], dtype=bool),
+        alignment=alignment,
+        case_ids=[f"case-{i}" for i in range(n_cases)],
+        decision_makers=list(decision_makers),
+    )
@@ -0,0 +1,225 @@
+"""Tests for batch submission mode in src/llm_decisions/batch.py"""
+
+import json
+from pathlib import Path
+
+import pytest
+from omegaconf import OmegaConf
+
+from src.llm_decisions.batch import (
+    BatchBackend,
+    BatchManifest,
+    LiteLLMBatchBackend,
+    LocalBatchServer,
+    interactive_models,
+    run_batch,
+    split_custom_id,
+)
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, ParsedDecision, RunResult
+from src.prompt_manager import PromptManager
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+
+class FakeParserLLM:
+    model_name = "openai/parser"
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        return ParsedDecision(selected_choice="choice_2")
+
+
+class FlakyResponder:
+    """Answers batch requests, failing every request for ``fail_case`` once."""
+
+    def __init__(self, fail_case=None):
+        self.fail_case = fail_case
+
+    def __call__(self, body):
+        if self.fail_case and self.fail_case in body["messages"][-1]["content"]:
+            self.fail_case = None
+            raise RuntimeError("model overloaded")
+        return {"model": body["model"], "choices": [{"message": {"content": "Hmm."}}]}
+
+
+def _make_cfg(tmp_path, models=("a/x", "b/y")):
+    return OmegaConf.create({
+        "models": list(models),
+        "execution": {
+            "runs_per_model": 2,
+            "temperature": 1.0,
+            "prompt_workflow": "workflows/physician_recommendation",
+            "mode": "batch",
+        },
+        "retry": {"max_api_retries": 1, "max_parse_retries": 1, "backoff_base": 0.0},
+        "output": {"dir": str(tmp_path / "decisions")},
+        "batch": {"backend": "local", "dir": str(tmp_path / "batches")},
+    })
+
+
+def _seed(cfg, case_ids):
+    out = Path(cfg.output.dir)
+    out.mkdir(parents=True)
+    for case_id in case_ids:
+        case = BenchmarkCandidate(
+            vignette=f"Vignette for {case_id}",
+            choice_1=ChoiceWithValues(
+                choice="Choice one", autonomy="promotes", beneficence="violates",
+                nonmaleficence="neutral", justice="neutral",
+            ),
+            choice_2=ChoiceWithValues(
+                choice="Choice two", autonomy="violates", beneficence="promotes",
+                nonmaleficence="neutral", justice="neutral",
+            ),
+        )
+        record = DecisionRecord(case_id=case_id, case=case)
+        if case_id == case_ids[0]:
+            record.models["a/x"] = ModelDecisionData(
+                temperature=1.0, runs=[RunResult(full_response={}, parsed_choice="choice_1")]
+            )
+        (out / f"{case_id}.json").write_text(record.model_dump_json())
+
+
+def _runs(cfg, case_id):
+    record = DecisionRecord(**json.loads((Path(cfg.output.dir) / f"{case_id}.json").read_text()))
+    return {m: [r.parsed_choice for r in d.runs] for m, d in record.models.items()}
+
+
+def test_submit_then_ingest_on_next_invocation(tmp_path):
+    cfg = _make_cfg(tmp_path)
+    _seed(cfg, ["case-0", "case-1"])
+    server = LocalBatchServer(tmp_path / "server")
+
+    manifest = run_batch(cfg, ["case-0", "case-1"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    # One job per model, covering only the missing cells
+    assert sorted((job.model, job.n_requests) for job in manifest.open_jobs()) == [("a/x", 3), ("b/y", 4)]
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1"]}
+
+    # Nothing is resubmitted while the jobs are still open
+    manifest = run_batch(cfg, ["case-0", "case-1"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert len(manifest.jobs) == 2
+
+    # Once the server has answered, the next invocation ingests the results
+    server.responder = FlakyResponder()
+    manifest = run_batch(cfg, ["case-0", "case-1"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert not manifest.open_jobs() and len(manifest.jobs) == 2
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1", "choice_2"], "b/y": ["choice_2"] * 2}
+    assert _runs(cfg, "case-1") == {"a/x": ["choice_2"] * 2, "b/y": ["choice_2"] * 2}
+    assert BatchManifest(tmp_path / "batches" / "decisions").jobs == manifest.jobs
+
+
+def test_failed_requests_are_resubmitted(tmp_path):
+    cfg = _make_cfg(tmp_path, models=["a/x"])
+    _seed(cfg, ["case-0", "case-1"])
+    responder = FlakyResponder(fail_case="case-1")
+    server = LocalBatchServer(tmp_path / "server", responder=responder)
+
+    # Submitted, then answered and ingested on the next poll
+    run_batch(cfg, ["case-0", "case-1"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    run_batch(cfg, ["case-0", "case-1"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1", "choice_2"]}
+    assert _runs(cfg, "case-1") == {"a/x": ["choice_2"]}
+
+    # The failed cell went into a new job with the run index it is still missing
+    manifest = BatchManifest(tmp_path / "batches" / "decisions")
+    [job] = manifest.open_jobs()
+    lines = [json.loads(line) for line in open(job.input_path)]
+    assert [split_custom_id(line["custom_id"]) for line in lines] == [("case-1", "a/x", 1)]
+    assert lines[0]["body"]["model"] == "a/x"
+
+
+class PartialServer(LocalBatchServer):
+    """Local server that only batches ``a/`` models and fails to return ``broken`` job results."""
+
+    broken = set()
+
+    def supports(self, model_name):
+        return model_name.startswith("a/")
+
+    def results(self, job_id, model_name):
+        if job_id in self.broken:
+            raise ConnectionError("file download failed")
+        return super().results(job_id, model_name)
+
+
+def test_backends_must_implement_the_job_methods():
+    class NoResults(BatchBackend):
+        def submit(self, model_name, input_path):
+            return "job"
+
+        def status(self, job_id, model_name):
+            return "completed"
+
+    with pytest.raises(TypeError, match="results"):
+        NoResults()
+
+
+def test_unsupported_models_are_left_to_the_interactive_path(tmp_path):
+    assert LiteLLMBatchBackend().supports("openai/gpt-4o")
+    assert not LiteLLMBatchBackend().supports("google/gemini-2.5-flash")
+
+    cfg = _make_cfg(tmp_path, models=["a/x", "b/y"])
+    _seed(cfg, ["case-0"])
+    server = PartialServer(tmp_path / "server")
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert [job.model for job in manifest.jobs] == ["a/x"]
+    assert interactive_models(cfg, server) == ["b/y"]
+
+
+def test_result_fetch_errors_do_not_stop_ingestion(tmp_path):
+    cfg = _make_cfg(tmp_path, models=["a/x", "a/z"])
+    _seed(cfg, ["case-0"])
+    server = PartialServer(tmp_path / "server")
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    server.broken = {manifest.jobs[0].job_id}
+
+    server.responder = FlakyResponder()
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert [job.model for job in manifest.open_jobs()] == ["a/x"]
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1"], "a/z": ["choice_2"] * 2}
+
+    # Fetched again on the next poll
+    server.broken = set()
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert not manifest.open_jobs()
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1", "choice_2"], "a/z": ["choice_2"] * 2}
+
+
+class GoneServer(LocalBatchServer):
+    """Local server whose jobs have been deleted on the provider side."""
+
+    def status(self, job_id, model_name):
+        raise ValueError(f"Unknown local batch job: {job_id}")
+
+
+def test_wait_ends_on_jobs_of_other_backends_and_unpollable_jobs(tmp_path):
+    cfg = _make_cfg(tmp_path, models=["a/x"])
+    _seed(cfg, ["case-0"])
+
+    # A job left open by another backend is not waited on, and its cells are compiled again
+    run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=LocalBatchServer(tmp_path / "a"))
+    manifest = BatchManifest(tmp_path / "batches" / "decisions")
+    manifest.jobs[0].backend = "other"
+    manifest.save()
+
+    cfg.batch.update({"wait": True, "poll_interval": 0})
+    server = LocalBatchServer(tmp_path / "b", responder=FlakyResponder())
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False, backend=server)
+    assert [job.backend for job in manifest.open_jobs()] == ["other"]
+    assert _runs(cfg, "case-0") == {"a/x": ["choice_1", "choice_2"]}
+
+    # A job that keeps failing to poll is marked failed instead of polled forever
+    cfg2 = _make_cfg(tmp_path / "gone", models=["a/x"])
+    cfg2.batch.update({"wait": True, "poll_interval": 0, "max_poll_failures": 3})
+    _seed(cfg2, ["case-0"])
+    manifest = run_batch(cfg2, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False,
+                         backend=GoneServer(tmp_path / "gone" / "server"))
+    assert not manifest.open_jobs()
+    assert [(job.status, job.poll_failures) for job in manifest.jobs] == [("failed", 3)]
+
+
+def test_wait_stops_after_max_wait(tmp_path):
+    cfg = _make_cfg(tmp_path, models=["a/x"])
+    cfg.batch.update({"wait": True, "poll_interval": 0.01, "max_wait": 0.05})
+    _seed(cfg, ["case-0"])
+    manifest = run_batch(cfg, ["case-0"], FakeParserLLM(), PromptManager(), verbose=False,
+                         backend=LocalBatchServer(tmp_path / "server"))
+    assert len(manifest.open_jobs()) == 1
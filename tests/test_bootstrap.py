@@ -0,0 +1,198 @@
+"""Tests for bootstrap resampling of the metrics and value weights."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.analysis import metrics
+from src.analysis.bootstrap import BootstrapIndices, adaptive_bootstrap, bootstrap_indices, bootstrap_weights
+from src.analysis.matrices import agreement_matrix, preference_matrix
+from src.analysis.metrics import agreement_rate, refusal_rate, value_preference
+from src.analysis.tradeoffs import _fit_logistic_regression, _fit_logistic_regression_batch, value_weights
+from src.response_models.case import VALUE_NAMES
+
+from random_tensors import random_tensor
+
+
+def test_analytic_inference_matches_closed_form():
+    tensor = _random_tensor()
+    indices = bootstrap_indices(20, 2000, seed=1)
+
+    result = value_preference(tensor, "a/x", "autonomy", inference="analytic")
+    case_values = value_preference(tensor, "a/x", "autonomy", return_all_cases=True)
+    values = np.array(list(case_values.values()))
+    assert result.mean == pytest.approx(value_preference(tensor, "a/x", "autonomy"))
+    assert result.n_cases == len(values) and result.method == "normal"
+    half_width = 1.959964 * np.std(values, ddof=1) / np.sqrt(len(values))
+    assert result.ci(95) == pytest.approx((result.mean - half_width, result.mean + half_width))
+    # Close to the bootstrap interval
+    boot = value_preference(tensor, "a/x", "autonomy", indices=indices)
+    assert np.allclose(result.ci(95), boot.ci(95), atol=0.05)
+
+    assert refusal_rate(tensor, "a/x", inference="analytic").mean == pytest.approx(refusal_rate(tensor, "a/x"))
+
+    # Wilson interval stays inside [0, 1]
+    agreement = agreement_rate(tensor, "a/x", "a/x", inference="analytic")
+    assert agreement.method == "wilson" and agreement.mean == 1.0
+    low, high = agreement.ci(95)
+    assert 0.0 < low < high == pytest.approx(1.0)
+
+    with pytest.raises(ValueError, match="indices must be None"):
+        refusal_rate(tensor, "a/x", indices=indices, inference="analytic")
+    with pytest.raises(ValueError, match="Invalid inference"):
+        refusal_rate(tensor, "a/x", inference="exact")
+
+
+def _loop_case_means(case_values, has_data, indices):
+    """Reference: one Python loop per bootstrap sample."""
+    out = np.empty(indices.shape[0])
+    for i, row in enumerate(indices):
+        sample = [case_values[idx] for idx in row if has_data[idx]]
+        out[i] = np.mean(sample) if sample else np.nan
+    return out
+
+
+@pytest.mark.parametrize("chunk_elements", [1, 7, 1 << 22])
+@pytest.mark.parametrize("n_cases", [6, 300])
+def test_bootstrap_case_means_matches_loop(monkeypatch, chunk_elements, n_cases):
+    monkeypatch.setattr(metrics, "_BOOTSTRAP_CHUNK_ELEMENTS", chunk_elements)
+    rng = np.random.default_rng(0)
+    case_values = rng.normal(size=n_cases)
+    # Mostly empty with 6 cases; with 300, long rows exercise pairwise summation
+    has_data = np.array([True, False, True, False, False, True]) if n_cases == 6 else rng.random(n_cases) < 0.7
+    case_values[~has_data] = np.nan
+    indices = bootstrap_indices(n_cases, 200, seed=1)
+
+    result = metrics._bootstrap_case_means(case_values, has_data, indices)
+    expected = _loop_case_means(case_values, has_data, indices)
+
+    if n_cases == 6:
+        # Some resamples draw no case with data and must come out NaN
+        assert np.isnan(expected).any()
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_bootstrap_weights_count_draws():
+    indices = bootstrap_indices(5, 50, seed=2)
+    weights = bootstrap_weights(indices, 5)
+    assert weights.shape == (50, 5)
+    for row, counts in zip(indices, weights):
+        np.testing.assert_array_equal(counts, np.bincount(row, minlength=5))
+
+
+def test_batched_value_weights_match_statsmodels():
+    rng = np.random.default_rng(4)
+    n_cases = 30
+    X = rng.choice([-2.0, -1.0, 0.0, 1.0, 2.0], size=(n_cases, 4))
+    y = rng.integers(0, 11, size=n_cases) / 10
+    n_trials = np.full(n_cases, 10)
+    y[:2] = [1.0, 0.0]
+    X[:2] = [[1, 0, 0, 0], [-1, 0, 0, 0]]
+
+    freq_weights = bootstrap_weights(bootstrap_indices(n_cases, 40, seed=5), n_cases) * n_trials
+    # Edge cases: no data, constant y, and a perfectly separated replicate
+    freq_weights[0] = 0
+    freq_weights[1] = np.where(y == 1.0, 10, 0)
+    freq_weights[2] = 0
+    freq_weights[2, :2] = 10
+
+    coefficients, fitted = _fit_logistic_regression_batch(X, y, freq_weights)
+
+    assert not fitted[0] and fitted[1:].all()
+    np.testing.assert_array_equal(coefficients[1], 0.0)
+    for b in range(1, len(freq_weights)):
+        rows = freq_weights[b] > 0
+        expected, _, _, _ = _fit_logistic_regression(X[rows], y[rows], freq_weights[b, rows])
+        np.testing.assert_allclose(coefficients[b], [expected[v] for v in VALUE_NAMES], atol=1e-8)
+
+
+def test_lazy_indices_are_chunked_and_reproducible():
+    indices = BootstrapIndices(n_cases=300, n_samples=25, seed=7, chunk_size=10)
+    dense = indices.to_array()
+    assert dense.shape == indices.shape == (25, 300)
+    assert dense.dtype == np.uint16 and BootstrapIndices(n_cases=256, seed=0).dtype == np.uint8
+    assert dense.min() >= 0 and dense.max() < 300
+
+    # Rows do not depend on how many samples, which slice or which block size is read
+    np.testing.assert_array_equal(BootstrapIndices(300, 13, seed=7, chunk_size=10).to_array(), dense[:13])
+    np.testing.assert_array_equal(indices[8:21].to_array(), dense[8:21])
+    np.testing.assert_array_equal(np.concatenate(list(indices.iter_chunks(3))), dense)
+    for i in [0, 9, 10, 24]:
+        np.testing.assert_array_equal(indices.row(i), dense[i])
+    assert not np.array_equal(BootstrapIndices(300, 25, seed=8, chunk_size=10).to_array(), dense)
+
+    weights = np.concatenate(list(indices.iter_weights()))
+    assert weights.dtype == np.uint16
+    np.testing.assert_array_equal(weights, bootstrap_weights(dense, 300))
+    np.testing.assert_array_equal(bootstrap_weights(indices, 300), weights)
+
+    unseeded = BootstrapIndices(n_cases=5, n_samples=4)
+    np.testing.assert_array_equal(unseeded.to_array(), unseeded.to_array())
+    with pytest.raises(IndexError):
+        indices.row(25)
+
+    # Pickles as its parameters only, not the last generated chunk
+    large = BootstrapIndices(n_cases=1000, n_samples=300, seed=1)
+    large.row(0)
+    copy = pickle.loads(pickle.dumps(large))
+    assert len(pickle.dumps(large)) < 1000 and copy == large
+    np.testing.assert_array_equal(copy.row(299), large.row(299))
+
+
+def _random_tensor(n_cases=20, seed=6):
+    return random_tensor(n_cases, seed)
+
+
+def test_metrics_accept_lazy_indices(monkeypatch):
+    n_cases = 20
+    tensor = _random_tensor(n_cases)
+    # Small blocks so every metric crosses chunk boundaries
+    monkeypatch.setattr(metrics, "_BOOTSTRAP_CHUNK_ELEMENTS", 7 * n_cases)
+    lazy = BootstrapIndices(n_cases, 45, seed=3, chunk_size=16)
+    dense = lazy.to_array()
+
+    np.testing.assert_array_equal(
+        value_preference(tensor, "a/x", "autonomy", indices=lazy).samples,
+        value_preference(tensor, "a/x", "autonomy", indices=dense).samples,
+    )
+    np.testing.assert_array_equal(
+        refusal_rate(tensor, "b/y", indices=lazy).samples,
+        refusal_rate(tensor, "b/y", indices=dense).samples,
+    )
+    for v in VALUE_NAMES[:2]:
+        np.testing.assert_allclose(
+            value_weights(tensor, "a/x", indices=lazy).bootstrap_samples[v],
+            value_weights(tensor, "a/x", indices=dense).bootstrap_samples[v],
+        )
+    np.testing.assert_allclose(
+        preference_matrix(tensor, indices=lazy).samples, preference_matrix(tensor, indices=dense).samples
+    )
+    np.testing.assert_allclose(
+        agreement_matrix(tensor, indices=lazy).samples, agreement_matrix(tensor, indices=dense).samples
+    )
+
+
+def test_adaptive_bootstrap_stops_when_ci_is_stable():
+    tensor = _random_tensor()
+    kwargs = dict(model="a/x", value="autonomy")
+
+    loose = adaptive_bootstrap(
+        value_preference, tensor, seed=5, tol=0.05, chunk_size=100, min_samples=200, max_samples=5000, **kwargs
+    )
+    assert loose.converged and loose.n_samples < 5000 and loose.n_samples % 100 == 0
+    fixed = value_preference(tensor, indices=BootstrapIndices(20, loose.n_samples, seed=5, chunk_size=100), **kwargs)
+    np.testing.assert_array_equal(loose.samples, fixed.samples)
+    assert value_preference(tensor, indices=bootstrap_indices(20, 10), **kwargs).converged is None
+
+    tight = adaptive_bootstrap(
+        value_preference, tensor, seed=5, tol=1e-12, chunk_size=100, min_samples=200, max_samples=500, **kwargs
+    )
+    assert not tight.converged and tight.n_samples == 500
+    n = min(tight.n_samples, loose.n_samples)
+    np.testing.assert_array_equal(tight.samples[:n], loose.samples[:n])
+
+    with pytest.raises(ValueError, match="min_samples"):
+        adaptive_bootstrap(value_preference, tensor, seed=5, min_samples=10, max_samples=5, **kwargs)
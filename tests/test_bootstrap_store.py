@@ -0,0 +1,91 @@
+"""Tests for the extendable bootstrap store in src/analysis/bootstrap_store.py"""
+
+import numpy as np
+import pytest
+
+from src.analysis.bootstrap import BootstrapIndices
+from src.analysis.bootstrap_store import BootstrapStore
+from src.analysis.metrics import refusal_rate, value_preference
+from src.analysis.tradeoffs import value_weights
+
+from random_tensors import random_tensor
+
+
+def _tensor(seed=0, n_cases=15):
+    return random_tensor(n_cases, seed)
+
+
+@pytest.fixture
+def calls():
+    """Bootstrap rows evaluated by value_preference through the store."""
+    rows = []
+
+    def counting(tensor, model, value, indices=None):
+        rows.append(len(indices))
+        return value_preference(tensor, model, value, indices=indices)
+
+    return rows, counting
+
+
+def test_extending_only_computes_new_samples(tmp_path, calls):
+    rows, metric = calls
+    store = BootstrapStore(tmp_path)
+    tensor = _tensor()
+
+    first = store.bootstrap(metric, tensor, 30, seed=4, chunk_size=8, model="a/x", value="autonomy")
+    extended = store.bootstrap(metric, tensor, 75, seed=4, chunk_size=8, model="a/x", value="autonomy")
+    shorter = store.bootstrap(metric, tensor, 10, seed=4, chunk_size=8, model="a/x", value="autonomy")
+
+    assert rows == [30, 45]
+    np.testing.assert_array_equal(extended.samples[:30], first.samples)
+    np.testing.assert_array_equal(shorter.samples, first.samples[:10])
+    expected = value_preference(tensor, "a/x", "autonomy", indices=BootstrapIndices(15, 75, seed=4, chunk_size=8))
+    np.testing.assert_array_equal(extended.samples, expected.samples)
+    assert store.n_stored(metric, tensor, seed=4, chunk_size=8, model="a/x", value="autonomy") == 75
+
+
+def test_entries_are_keyed_by_data_arguments_and_seed(tmp_path, calls):
+    rows, metric = calls
+    store = BootstrapStore(tmp_path)
+    store.bootstrap(metric, _tensor(), 20, seed=1, model="a/x", value="autonomy")
+    store.bootstrap(metric, _tensor(), 20, seed=2, model="a/x", value="autonomy")
+    store.bootstrap(metric, _tensor(), 20, seed=1, model="b/y", value="autonomy")
+    store.bootstrap(metric, _tensor(seed=9), 20, seed=1, model="a/x", value="autonomy")
+    store.bootstrap(metric, _tensor(), 20, seed=1, model="a/x", value="autonomy")
+    assert rows == [20, 20, 20, 20]
+
+    result = BootstrapStore(tmp_path).bootstrap(refusal_rate, _tensor(), 5, seed=1, model="a/x")
+    assert len(result.samples) == 5
+
+
+def test_rejects_unseeded_and_non_bootstrap_metrics(tmp_path):
+    store = BootstrapStore(tmp_path)
+    with pytest.raises(ValueError, match="seed"):
+        store.bootstrap(refusal_rate, _tensor(), 10, seed=None, model="a/x")
+    with pytest.raises(TypeError, match="BootstrapResult"):
+        store.bootstrap(value_weights, _tensor(), 10, seed=0, model="a/x")
+
+
+def test_damaged_entries_are_recomputed(tmp_path, calls):
+    rows, metric = calls
+    store = BootstrapStore(tmp_path)
+    first = store.bootstrap(metric, _tensor(), 20, seed=1, model="a/x", value="autonomy")
+    (entry,) = tmp_path.rglob("*.npz")
+    entry.write_bytes(entry.read_bytes()[:50])
+
+    again = store.bootstrap(metric, _tensor(), 20, seed=1, model="a/x", value="autonomy")
+    assert rows == [20, 20]
+    np.testing.assert_array_equal(again.samples, first.samples)
+
+
+def test_metrics_with_the_same_name_do_not_share_entries(tmp_path):
+    store = BootstrapStore(tmp_path)
+
+    def shadow(tensor, model, indices=None):
+        return value_preference(tensor, model, "autonomy", indices=indices)
+
+    shadow.__name__ = refusal_rate.__name__
+    stored = store.bootstrap(refusal_rate, _tensor(), 20, seed=1, model="a/x")
+    other = store.bootstrap(shadow, _tensor(), 20, seed=1, model="a/x")
+    assert not np.array_equal(stored.samples, other.samples)
+    assert len(list(tmp_path.rglob("*.npz"))) == 2
@@ -0,0 +1,85 @@
+"""Tests for the persistent case index in src/case_index.py"""
+
+import json
+import os
+
+from src.case_index import INDEX_FILENAME, CaseIndex
+from src.llm_decisions.runner import get_approved_case_ids, load_case_by_id
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+from src.response_models.record import CaseRecord, IterationRecord, SeedContext
+from src.response_models.status import CaseStatus
+
+
+def _write_case(cases_dir, case_id, status=CaseStatus.APPROVED, suffix="abc123abc123"):
+    case = BenchmarkCandidate(
+        vignette=f"Vignette for {case_id}",
+        choice_1=ChoiceWithValues(
+            choice="Choice one", autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice="Choice two", autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+    record = CaseRecord(
+        case_id=case_id,
+        model_name="test",
+        generator_config={},
+        seed=SeedContext(mode="synthetic", parameters={}),
+        refinement_history=[IterationRecord(iteration=0, step_description="final", data=case)],
+        status=status,
+    )
+    path = cases_dir / f"case_{case_id}_{suffix}.json"
+    path.write_text(record.model_dump_json())
+    return path
+
+
+def test_index_tracks_status_and_final_case(tmp_path):
+    _write_case(tmp_path, "a", CaseStatus.APPROVED)
+    _write_case(tmp_path, "b", CaseStatus.NEEDS_REVIEW)
+    (tmp_path / "case_c_broken.json").write_text("{not json")
+
+    index = CaseIndex(tmp_path)
+    assert index.case_ids() == ["a", "b"]
+    assert index.case_ids(status="approved", require_final_case=True) == ["a"]
+    assert index.get("a").content_hash is not None
+    assert (tmp_path / INDEX_FILENAME).exists()
+    assert get_approved_case_ids(tmp_path) == ["a"]
+    assert load_case_by_id("a", tmp_path).vignette == "Vignette for a"
+
+
+def test_refresh_only_reparses_changed_files(tmp_path, monkeypatch):
+    _write_case(tmp_path, "a")
+    path_b = _write_case(tmp_path, "b")
+    CaseIndex(tmp_path).refresh()
+
+    # A new process picks up the manifest; only the modified file is re-parsed
+    data = json.loads(path_b.read_text())
+    data["status"] = CaseStatus.DEPRECATED.value
+    path_b.write_text(json.dumps(data))
+    os.utime(path_b, ns=(1, 1))
+
+    parsed = []
+    import src.case_index as case_index
+    original = case_index._index_file
+    monkeypatch.setattr(case_index, "_index_file", lambda p, s: parsed.append(p.name) or original(p, s))
+
+    index = CaseIndex(tmp_path)
+    assert index.get("b").status == "deprecated"
+    assert parsed == [path_b.name]
+
+
+def test_lookup_sees_added_and_removed_files(tmp_path):
+    old = _write_case(tmp_path, "a", suffix="000000000000")
+    index = CaseIndex(tmp_path)
+    assert index.path_for("a") == old
+
+    new = _write_case(tmp_path, "a", suffix="111111111111")
+    os.utime(new, ns=(old.stat().st_mtime_ns + 10**9,) * 2)
+    assert index.paths_for("a") == [old, new]
+    assert index.path_for("a") == new
+
+    new.unlink()
+    old.unlink()
+    assert index.path_for("a") is None
@@ -0,0 +1,192 @@
+"""Tests for the concurrent evaluation engine in src/llm_decisions/engine.py"""
+
+import json
+import threading
+import time
+
+import pytest
+from omegaconf import OmegaConf
+
+from src.llm_decisions.engine import ConcurrencyLimits, run_grid_async
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, ParsedDecision, RunResult
+from src.prompt_manager import PromptManager
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+
+class FakeTargetLLM:
+    """Stand-in for all_the_llms.LLM that records how many calls overlap."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def completion(self, messages, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.calls += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return {"choices": [{"message": {"content": "I recommend Choice 1."}}]}
+
+
+class FakeParserLLM:
+    def structured_completion(self, messages, response_model, **kwargs):
+        return ParsedDecision(selected_choice="choice_1")
+
+
+def _make_case() -> BenchmarkCandidate:
+    return BenchmarkCandidate(
+        vignette="Test vignette",
+        choice_1=ChoiceWithValues(
+            choice="Choice one", autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice="Choice two", autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+
+
+def _make_cfg(output_dir, models, runs_per_model=3, **concurrency):
+    return OmegaConf.create({
+        "models": list(models),
+        "execution": {
+            "runs_per_model": runs_per_model,
+            "temperature": 1.0,
+            "prompt_workflow": "workflows/physician_recommendation",
+            "mode": "async",
+            "concurrency": concurrency,
+        },
+        "retry": {"max_api_retries": 1, "max_parse_retries": 1, "backoff_base": 0.0},
+        "output": {"dir": str(output_dir)},
+    })
+
+
+def _seed_records(output_dir, case_ids):
+    for case_id in case_ids:
+        record = DecisionRecord(case_id=case_id, case=_make_case())
+        (output_dir / f"{case_id}.json").write_text(record.model_dump_json())
+
+
+def test_limits_from_config():
+    cfg = _make_cfg("out", ["a/x", "b/y"], max_in_flight=8, default_per_model=3, per_model={"a/x": 20})
+    limits = ConcurrencyLimits.from_config(cfg)
+    assert limits.for_model("a/x") == 8  # clamped to global cap
+    assert limits.for_model("b/y") == 3
+
+
+def test_limits_invalid_global_cap():
+    cfg = _make_cfg("out", ["a/x"], max_in_flight=0)
+    with pytest.raises(ValueError):
+        ConcurrencyLimits.from_config(cfg)
+
+
+def test_grid_runs_concurrently_and_saves(tmp_path):
+    case_ids = [f"case-{i}" for i in range(4)]
+    _seed_records(tmp_path, case_ids)
+    llms = {"a/x": FakeTargetLLM(), "b/y": FakeTargetLLM()}
+    cfg = _make_cfg(tmp_path, llms, max_in_flight=8, default_per_model=2)
+
+    run_grid_async(cfg, case_ids, llms, FakeParserLLM(), PromptManager(), verbose=False)
+
+    for llm in llms.values():
+        assert llm.calls == 12
+        assert 1 < llm.max_active <= 2
+    for case_id in case_ids:
+        record = DecisionRecord(**json.loads((tmp_path / f"{case_id}.json").read_text()))
+        assert record.system_prompt is not None
+        assert {m: d.runs_completed for m, d in record.models.items()} == {"a/x": 3, "b/y": 3}
+
+
+def test_grid_resumes_from_existing_runs(tmp_path):
+    _seed_records(tmp_path, ["case-0"])
+    path = tmp_path / "case-0.json"
+    record = DecisionRecord(**json.loads(path.read_text()))
+    record.models["a/x"] = ModelDecisionData(
+        temperature=1.0,
+        runs=[RunResult(full_response={}, parsed_choice="choice_2")] * 2,
+    )
+    path.write_text(record.model_dump_json())
+
+    llm = FakeTargetLLM(delay=0.0)
+    cfg = _make_cfg(tmp_path, ["a/x"], max_in_flight=4)
+    run_grid_async(cfg, ["case-0"], {"a/x": llm}, FakeParserLLM(), PromptManager(), verbose=False)
+
+    assert llm.calls == 1
+    record = DecisionRecord(**json.loads(path.read_text()))
+    assert [r.parsed_choice for r in record.models["a/x"].runs] == ["choice_2", "choice_2", "choice_1"]
+    assert not (tmp_path / "case-0.journal.jsonl").exists()
+
+
+class MultiSampleLLM(FakeTargetLLM):
+    """Returns one choice per requested sample, or a single one if max_choices=1."""
+
+    model_name = "openai/multi"
+
+    def __init__(self, max_choices=None):
+        super().__init__(delay=0.0)
+        self.max_choices = max_choices
+        self.requested = []
+
+    def completion(self, messages, n=1, **kwargs):
+        super().completion(messages, **kwargs)
+        self.requested.append(n)
+        count = min(n, self.max_choices or n)
+        return {
+            "model": self.model_name,
+            "choices": [{"index": i, "message": {"content": f"Sample {i}: I recommend Choice 1."}} for i in range(count)],
+        }
+
+
+@pytest.mark.parametrize("max_choices, expected_requests", [(None, [3]), (1, [3, 1, 1])])
+def test_grid_multi_sample_requests(tmp_path, monkeypatch, max_choices, expected_requests):
+    monkeypatch.setattr("src.llm_decisions.engine.supports_multi_sample", lambda llm: True)
+    _seed_records(tmp_path, ["case-0"])
+    llm = MultiSampleLLM(max_choices)
+    cfg = _make_cfg(tmp_path, ["a/x"], max_in_flight=4)
+    cfg.execution.multi_sample = True
+
+    run_grid_async(cfg, ["case-0"], {"a/x": llm}, FakeParserLLM(), PromptManager(), verbose=False)
+
+    assert llm.requested == expected_requests
+    record = DecisionRecord(**json.loads((tmp_path / "case-0.json").read_text()))
+    runs = record.models["a/x"].runs
+    assert len(runs) == 3
+    if max_choices is None:
+        assert [r.response_text for r in runs] == [f"Sample {i}: I recommend Choice 1." for i in range(3)]
+        assert [r.full_response["multi_sample"] for r in runs] == [{"n": 3, "choice_index": i} for i in range(3)]
+
+
+class AlternatingParserLLM:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        with self.lock:
+            self.calls += 1
+            return ParsedDecision(selected_choice="choice_1" if self.calls % 2 else "choice_2")
+
+
+def test_grid_adaptive_sampling_spends_budget_on_split_pairs(tmp_path):
+    _seed_records(tmp_path, ["case-0"])
+    llms = {"a/x": FakeTargetLLM(delay=0.0)}
+    cfg = _make_cfg(tmp_path, llms, max_in_flight=4)
+    cfg.execution.adaptive_sampling = {"enabled": True, "min_runs": 3, "max_runs": 10}
+
+    run_grid_async(cfg, ["case-0"], llms, FakeParserLLM(), PromptManager(), verbose=False)
+    assert llms["a/x"].calls == 7
+
+    cfg.models = ["b/y"]
+    llms["b/y"] = FakeTargetLLM(delay=0.0)
+    run_grid_async(cfg, ["case-0"], llms, AlternatingParserLLM(), PromptManager(), verbose=False)
+    assert llms["b/y"].calls == 10
+
+    record = DecisionRecord(**json.loads((tmp_path / "case-0.json").read_text()))
+    assert {m: d.runs_completed for m, d in record.models.items()} == {"a/x": 7, "b/y": 10}
@@ -0,0 +1,60 @@
+"""Tests for the local fast-path parser in src/llm_decisions/heuristic_parser.py"""
+
+import pytest
+
+from src.llm_decisions.heuristic_parser import heuristic_parse
+from src.llm_decisions.runner import _parse_with_retry
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+CHOICE_1 = "Proceed with urgent operative source control under sedation despite his refusal"
+CHOICE_2 = "Defer surgery tonight and treat medically while reassessing capacity in the morning"
+
+
+@pytest.mark.parametrize("response, expected, rule", [
+    ("**Recommendation: Choice 1 — Proceed with surgery tonight.**\n\nRationale...", "choice_1", "marker"),
+    ("This is a hard case.\n\n**I recommend Choice 2: Defer surgery tonight.**", "choice_2", "marker"),
+    ("After weighing both, Option 2 is my recommendation.", "choice_2", "marker"),
+    ("I recommend that we defer surgery tonight and treat medically while reassessing "
+     "capacity in the morning.", "choice_2", "overlap"),
+    ("I cannot in good conscience recommend either option here.", "REFUSAL", "refusal"),
+    ("", "REFUSAL", "empty"),
+])
+def test_clear_cases_are_resolved(response, expected, rule):
+    decision = heuristic_parse(CHOICE_1, CHOICE_2, response)
+    assert (decision.selected_choice, decision.rule) == (expected, rule)
+
+
+@pytest.mark.parametrize("response", [
+    "I would not recommend Choice 1. Instead, Choice 2 is my recommendation.",
+    "I recommend Choice 1 for the short term, but ultimately I recommend Choice 2.",
+    "Both options carry risk; the team should discuss further with the family.",
+    "I recommend Choice 1, although I cannot recommend surgery without consent.",
+])
+def test_ambiguous_cases_fall_back(response):
+    assert heuristic_parse(CHOICE_1, CHOICE_2, response) is None
+
+
+class FailingParserLLM:
+    model_name = "openai/gpt-4o-mini"
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        raise AssertionError("parser model should not be called")
+
+
+def test_parse_with_retry_records_method():
+    case = BenchmarkCandidate(
+        vignette="Test vignette",
+        choice_1=ChoiceWithValues(
+            choice=CHOICE_1, autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice=CHOICE_2, autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+    parsed = _parse_with_retry(
+        case, "**Recommendation: Choice 2**", FailingParserLLM(), None, 1, 0.0,
+        use_heuristic_parser=True,
+    )
+    assert parsed == ("choice_2", "heuristic:marker")
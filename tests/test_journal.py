@@ -0,0 +1,99 @@
+"""Tests for the append-only run journal in src/llm_decisions/journal.py"""
+
+import json
+
+import pytest
+
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
+from src.llm_decisions.runner import (
+    append_run,
+    compact_decision_record,
+    get_decision_record,
+    save_decision_record,
+)
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+
+def _make_record(case_id: str = "case-0") -> DecisionRecord:
+    case = BenchmarkCandidate(
+        vignette="Test vignette",
+        choice_1=ChoiceWithValues(
+            choice="Choice one", autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice="Choice two", autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+    record = DecisionRecord(case_id=case_id, case=case)
+    record.models["a/x"] = ModelDecisionData(temperature=1.0)
+    return record
+
+
+def _run(choice: str) -> RunResult:
+    return RunResult(
+        full_response={"choices": [{"message": {"content": f"I pick {choice}"}}]},
+        parsed_choice=choice,
+    )
+
+
+def test_append_does_not_rewrite_record(tmp_path):
+    record = _make_record()
+    save_decision_record(record, tmp_path)
+    before = (tmp_path / "case-0.json").read_text()
+
+    journal = RunJournal("case-0", tmp_path)
+    append_run(record, "a/x", _run("choice_1"), journal, tmp_path, compact_every=10)
+
+    assert (tmp_path / "case-0.json").read_text() == before
+    assert journal.pending == 1
+    entry = json.loads(journal.path.read_text().splitlines()[0])
+    assert (entry["model"], entry["run_index"]) == ("a/x", 0)
+
+
+def test_compacts_every_n_runs(tmp_path):
+    record = _make_record()
+    journal = RunJournal("case-0", tmp_path)
+    for choice in ["choice_1", "choice_2", "REFUSAL"]:
+        append_run(record, "a/x", _run(choice), journal, tmp_path, compact_every=3)
+
+    assert not journal.path.exists()
+    stored = DecisionRecord(**json.loads((tmp_path / "case-0.json").read_text()))
+    assert [r.parsed_choice for r in stored.models["a/x"].runs] == ["choice_1", "choice_2", "REFUSAL"]
+
+
+def test_crash_recovery_replays_journal(tmp_path):
+    record = _make_record()
+    save_decision_record(record, tmp_path)
+    journal = RunJournal("case-0", tmp_path)
+    append_run(record, "a/x", _run("choice_2"), journal, tmp_path, compact_every=0)
+    append_run(record, "a/x", _run("choice_1"), journal, tmp_path, compact_every=0)
+    # Simulate a crash in the middle of writing a third line
+    with open(journal.path, "a") as f:
+        f.write('{"case_id": "case-0", "model": "a/x", "run_in')
+
+    recovered = get_decision_record("case-0", tmp_path)
+    assert [r.parsed_choice for r in recovered.models["a/x"].runs] == ["choice_2", "choice_1"]
+
+
+def test_replay_is_idempotent_after_compaction(tmp_path):
+    record = _make_record()
+    journal = RunJournal("case-0", tmp_path)
+    append_run(record, "a/x", _run("choice_1"), journal, tmp_path, compact_every=0)
+    # Record written, but the process died before the journal was removed
+    save_decision_record(record, tmp_path)
+
+    recovered = get_decision_record("case-0", tmp_path)
+    assert recovered.models["a/x"].runs_completed == 1
+
+    compact_decision_record(recovered, RunJournal("case-0", tmp_path), tmp_path)
+    assert not journal.path.exists()
+
+
+def test_journal_for_other_case_rejected(tmp_path):
+    RunJournal("case-1", tmp_path).append("a/x", 0, 1.0, _run("choice_1"))
+    (tmp_path / "case-1.journal.jsonl").rename(tmp_path / "case-0.journal.jsonl")
+    with pytest.raises(ValueError):
+        RunJournal("case-0", tmp_path).replay(_make_record())
@@ -18,6 +18,7 @@ import pandas as pd
 import pytest
 from scipy.spatial.distance import jensenshannon
 
+from src.analysis import value_profiles
 from src.analysis.result_types import BootstrapResult
 from src.analysis.value_profiles import (
     _mean_within_jsd,
@@ -47,6 +48,16 @@ def _peaked_profile(peak: str = "autonomy") -> dict[str, float]:
     return p
 
 
+def _loop_jsd_matrix(profiles: dict[str, dict[str, float]], ids: list[str]) -> np.ndarray:
+    """Reference: one scipy call per pair."""
+    vectors = [list(profiles[mid].values()) for mid in ids]
+    mat = np.zeros((len(ids), len(ids)))
+    for i in range(len(ids)):
+        for j in range(i + 1, len(ids)):
+            mat[i, j] = mat[j, i] = jensenshannon(vectors[i], vectors[j], base=2.0) ** 2
+    return mat
+
+
 def _make_profiles(n: int, seed: int = 0) -> dict[str, dict[str, float]]:
     """Generate *n* random Dirichlet(1) profiles."""
     rng = np.random.default_rng(seed)
@@ -194,6 +205,11 @@ class TestPairwiseJsdMatrix:
         assert math.isclose(mat.loc["p", "q"], expected, rel_tol=1e-12)
         assert math.isclose(mat.loc["q", "p"], expected, rel_tol=1e-12)
 
+    def test_matches_per_pair_scipy_exactly(self):
+        profiles = _make_profiles(30, seed=5)
+        mat = pairwise_jsd_matrix(profiles)
+        np.testing.assert_array_equal(mat.values, _loop_jsd_matrix(profiles, list(profiles)))
+
     def test_orthogonal_distributions_near_max(self):
         """Disjoint-support distributions should approach ln(2)."""
         p = {"a": 1.0, "b": 0.0}
@@ -387,6 +403,27 @@ class TestBootstrapMeanJsd:
 
     # -- Error handling --
 
+    @pytest.mark.parametrize("chunk_elements", [1, 50, 1 << 22])
+    def test_matches_per_iteration_loop(self, monkeypatch, chunk_elements):
+        """Blocked resampling reproduces the per-iteration draws exactly."""
+        monkeypatch.setattr(value_profiles, "_RESAMPLE_CHUNK_ELEMENTS", chunk_elements)
+        profiles = _make_profiles(12, seed=3)
+        ids = list(profiles)
+        a, b = ids[:4], ids[4:] + ids[:1]
+        result = bootstrap_mean_jsd(profiles, a, b, n_bootstrap=60, seed=11)
+
+        all_ids = list(dict.fromkeys(a + b))
+        mat = _loop_jsd_matrix(profiles, all_ids)
+        idx_a = np.array([all_ids.index(m) for m in a])
+        idx_b = np.array([all_ids.index(m) for m in b])
+        triu_a, triu_b = np.triu_indices(len(a), 1), np.triu_indices(len(b), 1)
+        rng = np.random.default_rng(11)
+        for k in range(60):
+            boot_a = idx_a[rng.integers(0, len(a), size=len(a))]
+            boot_b = idx_b[rng.integers(0, len(b), size=len(b))]
+            assert result["group_a_mean"].samples[k] == _mean_within_jsd(mat, boot_a, triu_a)
+            assert result["group_b_mean"].samples[k] == _mean_within_jsd(mat, boot_b, triu_b)
+
     def test_group_a_too_small(self):
         profiles = _make_profiles(4, seed=0)
         ids = list(profiles.keys())
@@ -543,6 +580,27 @@ class TestPermutationTestJsd:
         with pytest.raises(ValueError, match="group_b must have >= 2"):
             permutation_test_jsd(profiles, ids[:3], ids[3:4], n_permutations=10)
 
+    @pytest.mark.parametrize("chunk_elements", [1, 50, 1 << 22])
+    def test_matches_per_permutation_loop(self, monkeypatch, chunk_elements):
+        """Blocked permutations reproduce the successive in-place shuffles exactly."""
+        monkeypatch.setattr(value_profiles, "_RESAMPLE_CHUNK_ELEMENTS", chunk_elements)
+        profiles = _make_profiles(11, seed=4)
+        ids = list(profiles)
+        a, b = ids[:5], ids[5:]
+        result = permutation_test_jsd(profiles, a, b, n_permutations=60, seed=13)
+
+        mat = _loop_jsd_matrix(profiles, ids)
+        triu_a, triu_b = np.triu_indices(len(a), 1), np.triu_indices(len(b), 1)
+        pooled = np.arange(len(ids))
+        rng = np.random.default_rng(13)
+        for k in range(60):
+            rng.shuffle(pooled)
+            expected = abs(
+                _mean_within_jsd(mat, pooled[:len(a)], triu_a)
+                - _mean_within_jsd(mat, pooled[len(a):], triu_b)
+            )
+            assert result["null_distribution"][k] == expected
+
     def test_swapping_groups_same_observed_diff(self, diverse_profiles, group_ids):
         """observed_diff is |A-B|, so swapping groups should not change it."""
         a, b = group_ids
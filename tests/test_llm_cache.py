@@ -0,0 +1,72 @@
+"""Tests for the LLM response cache in src/llm_cache.py"""
+
+import pytest
+
+from src.llm_cache import CacheMissError, CachedLLM, ResponseCache
+from src.llm_decisions.models import ParsedDecision
+
+MESSAGES = [{"role": "user", "content": "Pick one."}]
+
+
+class CountingLLM:
+    model_name = "openai/test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def completion(self, messages, **kwargs):
+        self.calls += 1
+        return {"choices": [{"message": {"content": f"answer {self.calls}"}}]}
+
+    def structured_completion(self, messages, response_model, max_retries=3, **kwargs):
+        self.calls += 1
+        return response_model(selected_choice="choice_2")
+
+
+def _content(response):
+    return response["choices"][0]["message"]["content"]
+
+
+def test_repeated_requests_hit_cache(tmp_path):
+    llm = CountingLLM()
+    cached = CachedLLM(llm, ResponseCache(tmp_path))
+
+    first = cached.completion(MESSAGES, temperature=1.0, sample_index=0)
+    again = cached.completion(MESSAGES, temperature=1.0, sample_index=0)
+    other_sample = cached.completion(MESSAGES, temperature=1.0, sample_index=1)
+    other_temp = cached.completion(MESSAGES, temperature=0.0, sample_index=0)
+
+    assert _content(first) == _content(again) == "answer 1"
+    assert _content(other_sample) == "answer 2"
+    assert _content(other_temp) == "answer 3"
+    assert (llm.calls, cached.hits, cached.misses) == (3, 1, 3)
+
+
+def test_replay_reproduces_implicit_sample_order(tmp_path):
+    recorder = CachedLLM(CountingLLM(), ResponseCache(tmp_path))
+    recorded = [_content(recorder.completion(MESSAGES)) for _ in range(3)]
+    parsed = recorder.structured_completion(MESSAGES, ParsedDecision)
+
+    # A fresh process in replay mode needs no LLM and returns the same sequence
+    replay = CachedLLM(None, ResponseCache(tmp_path), model_name="openai/test-model", mode="replay")
+    assert [_content(replay.completion(MESSAGES)) for _ in range(3)] == recorded
+    assert replay.structured_completion(MESSAGES, ParsedDecision) == parsed
+    with pytest.raises(CacheMissError):
+        replay.completion(MESSAGES)
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=250)
+    for key in ["a" * 64, "b" * 64, "c" * 64]:
+        cache.put(key, {"data": "x" * 80})
+    # Three entries exceed the bound, so the least recently used one goes
+    assert cache.total_bytes <= 250
+    assert "c" * 64 in cache and "a" * 64 not in cache
+
+    cache.get("c" * 64)
+    cache.put("d" * 64, {"data": "x" * 80})
+    assert "c" * 64 in cache and "d" * 64 in cache and "b" * 64 not in cache
+    assert len(list(tmp_path.glob("*/*.json"))) == len(cache)
+
+    # LRU state is rebuilt from disk
+    assert set(ResponseCache(tmp_path, max_bytes=250)._entries) == set(cache._entries)
@@ -0,0 +1,189 @@
+"""Tests for the parallel record loader and the summary-only tensor loader in src/analysis/loader.py"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.analysis import summaries
+from src.analysis.loader import load_all_decisions, load_decision_tensor, load_llm_decisions
+from src.analysis.tensor import DecisionTensor
+from src.llm_decisions.journal import RunJournal
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+CASE = BenchmarkCandidate(
+    vignette="Test vignette",
+    choice_1=ChoiceWithValues(
+        choice="Choice one", autonomy="promotes", beneficence="violates",
+        nonmaleficence="neutral", justice="neutral",
+    ),
+    choice_2=ChoiceWithValues(
+        choice="Choice two", autonomy="violates", beneficence="promotes",
+        nonmaleficence="neutral", justice="neutral",
+    ),
+)
+
+
+def _write(directory, case_id, models):
+    directory.mkdir(exist_ok=True)
+    record = DecisionRecord(case_id=case_id, case=CASE)
+    for model, choices in models.items():
+        runs = [
+            RunResult(full_response={"choices": [{"message": {"content": "x" * 100}}]}, parsed_choice=c)
+            for c in choices
+        ]
+        record.models[model] = ModelDecisionData(temperature=1.0, runs=runs)
+    (directory / f"{case_id}.json").write_text(record.model_dump_json())
+
+
+def test_matches_record_loader(tmp_path):
+    llm_dir, human_dir = tmp_path / "llm", tmp_path / "human"
+    _write(llm_dir, "case-b", {"a/x": ["choice_1", "REFUSAL", "choice_1"], "b/y": []})
+    _write(llm_dir, "case-a", {"a/x": ["choice_2"]})
+    _write(human_dir, "case-a", {"human/p1": ["choice_1"]})
+    _write(human_dir, "case-c", {"human/p1": ["choice_2"], "human/p2": ["choice_1"]})
+
+    tensor = load_decision_tensor(llm_dir, human_dir)
+    expected = DecisionTensor.from_records(load_all_decisions(llm_dir, human_dir))
+
+    assert tensor.case_ids == expected.case_ids == ["case-a", "case-b", "case-c"]
+    assert tensor.decision_makers == expected.decision_makers
+    np.testing.assert_array_equal(tensor.counts, expected.counts)
+    np.testing.assert_array_equal(tensor.present, expected.present)
+    np.testing.assert_array_equal(tensor.alignment, expected.alignment)
+    assert tensor.fingerprint == expected.fingerprint
+
+
+def test_parallel_loading_matches_serial(tmp_path):
+    llm_dir, human_dir = tmp_path / "llm", tmp_path / "human"
+    for i in range(5):
+        _write(llm_dir, f"case-{i}", {"a/x": ["choice_1", "choice_2"][: i % 2 + 1]})
+    _write(human_dir, "case-0", {"human/p1": ["choice_2"]})
+    (human_dir / "participant_registry.json").write_text("{}")
+
+    serial = load_all_decisions(llm_dir, human_dir)
+    parallel = load_all_decisions(llm_dir, human_dir, n_workers=2)
+    assert [r.model_dump() for r in parallel] == [r.model_dump() for r in serial]
+
+
+def test_parallel_loading_reports_bad_file(tmp_path):
+    for i in range(3):
+        _write(tmp_path, f"case-{i}", {"a/x": ["choice_1"]})
+    (tmp_path / "case-1.json").write_text('{"case_id": "case-1"}')
+    with pytest.raises(ValueError, match="case-1.json"):
+        load_llm_decisions(tmp_path, n_workers=2)
+
+
+def test_rejects_overlapping_models(tmp_path):
+    _write(tmp_path / "llm", "case-a", {"human/p1": ["choice_1"]})
+    _write(tmp_path / "human", "case-a", {"human/p1": ["choice_2"]})
+    with pytest.raises(ValueError, match="overlapping model keys"):
+        load_decision_tensor(tmp_path / "llm", tmp_path / "human")
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record the filename of every summary that is actually parsed."""
+    calls = []
+    original = summaries._parse_summary
+
+    def counting(json_path, *args):
+        calls.append(json_path.name)
+        return original(json_path, *args)
+
+    monkeypatch.setattr(summaries, "_parse_summary", counting)
+    return calls
+
+
+def test_cache_only_reparses_changed_files(tmp_path, parse_calls):
+    llm_dir, human_dir = tmp_path / "llm", tmp_path / "human"
+    _write(llm_dir, "case-a", {"a/x": ["choice_1"]})
+    _write(llm_dir, "case-b", {"a/x": ["choice_2"]})
+
+    first = load_decision_tensor(llm_dir, human_dir)
+    assert sorted(parse_calls) == ["case-a.json", "case-b.json"]
+    assert (llm_dir / summaries.CACHE_FILENAME).exists()
+
+    parse_calls.clear()
+    second = load_decision_tensor(llm_dir, human_dir)
+    assert parse_calls == []
+    np.testing.assert_array_equal(second.counts, first.counts)
+    assert second.case_ids == first.case_ids
+
+    # Touched but unchanged files are hashed, not parsed
+    path = llm_dir / "case-a.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load_decision_tensor(llm_dir, human_dir)
+    assert parse_calls == []
+
+    _write(llm_dir, "case-b", {"a/x": ["choice_2", "REFUSAL"]})
+    _write(llm_dir, "case-c", {"b/y": ["choice_1"]})
+    tensor = load_decision_tensor(llm_dir, human_dir)
+    assert sorted(parse_calls) == ["case-b.json", "case-c.json"]
+    expected = load_decision_tensor(llm_dir, human_dir, use_cache=False)
+    np.testing.assert_array_equal(tensor.counts, expected.counts)
+    assert tensor.decision_makers == expected.decision_makers == ["a/x", "b/y"]
+
+    (llm_dir / "case-c.json").unlink()
+    assert load_decision_tensor(llm_dir, human_dir).case_ids == ["case-a", "case-b"]
+
+
+def test_uncompacted_journal_runs_are_loaded(tmp_path, parse_calls):
+    llm_dir, human_dir = tmp_path / "llm", tmp_path / "human"
+    _write(llm_dir, "case-a", {"a/x": ["choice_1"]})
+    load_decision_tensor(llm_dir, human_dir)
+
+    # An evaluation stopped after journaling runs but before compacting them
+    journal = RunJournal("case-a", llm_dir)
+    journal.append("a/x", 0, 1.0, RunResult(full_response={}, parsed_choice="choice_1"))  # already compacted
+    journal.append("a/x", 1, 1.0, RunResult(full_response={}, parsed_choice="choice_2"))
+    journal.append("b/y", 0, 1.0, RunResult(full_response={}, parsed_choice="REFUSAL"))
+
+    [record] = load_llm_decisions(llm_dir)
+    assert [r.parsed_choice for r in record.models["a/x"].runs] == ["choice_1", "choice_2"]
+    assert [r.parsed_choice for r in record.models["b/y"].runs] == ["REFUSAL"]
+
+    # The record file is unchanged, but the journal invalidates its cached summary
+    parse_calls.clear()
+    tensor = load_decision_tensor(llm_dir, human_dir)
+    assert parse_calls == ["case-a.json"]
+    assert tensor.decision_makers == ["a/x", "b/y"]
+    assert tensor.counts.tolist() == [[[1, 1, 0], [0, 0, 1]]]
+    expected = DecisionTensor.from_records(load_all_decisions(llm_dir, human_dir))
+    np.testing.assert_array_equal(tensor.counts, expected.counts)
+
+    parse_calls.clear()
+    load_decision_tensor(llm_dir, human_dir)
+    assert parse_calls == []
+
+
+def test_rebuild_cache_reparses_everything(tmp_path, parse_calls):
+    _write(tmp_path, "case-a", {"a/x": ["choice_1"]})
+    load_decision_tensor(tmp_path, tmp_path / "missing")
+    parse_calls.clear()
+    load_decision_tensor(tmp_path, tmp_path / "missing", rebuild_cache=True)
+    assert parse_calls == ["case-a.json"]
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    _write(tmp_path, "case-a", {"a/x": ["choice_1", "choice_1"]})
+    (tmp_path / summaries.CACHE_FILENAME).write_bytes(b"not a cache")
+    tensor = load_decision_tensor(tmp_path, tmp_path / "missing")
+    assert tensor.counts.tolist() == [[[2, 0, 0]]]
+
+
+@pytest.mark.parametrize("damage", ["truncated", "missing_arrays"])
+def test_damaged_cache_is_ignored(tmp_path, damage):
+    _write(tmp_path, "case-a", {"a/x": ["choice_1", "choice_1"]})
+    load_decision_tensor(tmp_path, tmp_path / "missing")
+    cache_path = tmp_path / summaries.CACHE_FILENAME
+    if damage == "truncated":
+        cache_path.write_bytes(cache_path.read_bytes()[:100])
+    else:
+        with open(cache_path, "wb") as f:
+            np.savez(f, version=np.array(summaries.CACHE_VERSION))
+    assert summaries.SummaryCache(tmp_path).load() == {}
+    tensor = load_decision_tensor(tmp_path, tmp_path / "missing")
+    assert tensor.counts.tolist() == [[[2, 0, 0]]]
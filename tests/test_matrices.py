@@ -0,0 +1,72 @@
+"""Tests for the all-models metric matrices in src/analysis/matrices.py"""
+
+import numpy as np
+import pytest
+
+from src.analysis.bootstrap import bootstrap_indices
+from src.analysis.matrices import agreement_matrix, preference_matrix, refusal_matrix
+from src.analysis.metrics import agreement_rate, refusal_rate, value_preference
+from src.analysis.tensor import HUMAN_CONSENSUS
+from src.response_models.case import VALUE_NAMES
+
+from random_tensors import random_tensor
+
+
+@pytest.fixture
+def tensor():
+    tensor = random_tensor(
+        decision_makers=("a/x", "b/y", "human/p1", "human/p2", "human/p3"), random_alignment=True
+    )
+    # b/y never answers on the first case
+    tensor.counts[0, 1] = 0
+    return tensor
+
+
+def test_preference_matrix_matches_per_model_calls(tensor):
+    indices = bootstrap_indices(tensor.n_cases, 50, seed=1)
+    prefs = preference_matrix(tensor, indices=indices)
+
+    assert prefs.labels["model"] == ["a/x", "b/y", HUMAN_CONSENSUS]
+    assert prefs.samples.shape == (3, len(VALUE_NAMES), 50)
+    assert len(prefs.table) == 3 * len(VALUE_NAMES)
+    for model in prefs.labels["model"]:
+        for value in VALUE_NAMES:
+            cell = prefs.cell(model, value)
+            assert prefs.estimates[cell] == pytest.approx(value_preference(tensor, model, value))
+            np.testing.assert_allclose(
+                prefs.samples[cell], value_preference(tensor, model, value, indices=indices).samples, atol=1e-12
+            )
+    row = prefs.table.query("model == 'a/x' and value == 'justice'").iloc[0]
+    assert (row.ci_lower, row.ci_upper) == pytest.approx(prefs.get_bootstrap_result("a/x", "justice").ci(95))
+
+
+def test_refusal_and_agreement_matrices(tensor):
+    indices = bootstrap_indices(tensor.n_cases, 50, seed=2)
+
+    refusals = refusal_matrix(tensor, indices=indices)
+    assert refusals.labels == {"model": ["a/x", "b/y"]}
+    for model in refusals.labels["model"]:
+        np.testing.assert_allclose(
+            refusals.samples[refusals.cell(model)], refusal_rate(tensor, model, indices=indices).samples, atol=1e-12
+        )
+
+    agreement = agreement_matrix(tensor, indices=indices)
+    np.testing.assert_array_equal(agreement.estimates, agreement.estimates.T)
+    for model_a in agreement.labels["model_a"]:
+        for model_b in agreement.labels["model_b"]:
+            cell = agreement.cell(model_a, model_b)
+            assert agreement.estimates[cell] == pytest.approx(agreement_rate(tensor, model_a, model_b))
+            np.testing.assert_allclose(
+                agreement.samples[cell],
+                agreement_rate(tensor, model_a, model_b, indices=indices).samples,
+                atol=1e-12,
+                equal_nan=True,
+            )
+
+
+def test_cells_without_data_are_nan(tensor):
+    prefs = preference_matrix(tensor, models=["a/x", "unknown/model"], values=["autonomy"])
+    assert prefs.samples is None and "ci_lower" not in prefs.table
+    assert np.isnan(prefs.estimates[prefs.cell("unknown/model", "autonomy")])
+    with pytest.raises(ValueError, match="Invalid values"):
+        preference_matrix(tensor, values=["honesty"])
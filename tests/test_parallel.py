@@ -0,0 +1,55 @@
+"""Tests for the process-pool bootstrap executor in src/analysis/parallel.py"""
+
+import numpy as np
+import pytest
+
+from src.analysis.bootstrap import BootstrapIndices, bootstrap_indices
+from src.analysis.metrics import agreement_rate, value_preference
+from src.analysis.parallel import parallel_bootstrap
+from src.analysis.tensor import HUMAN_CONSENSUS
+from src.analysis.tradeoffs import value_weights
+from src.response_models.case import VALUE_NAMES
+
+from random_tensors import random_tensor
+
+
+def _random_tensor(n_cases=25, seed=0):
+    return random_tensor(
+        n_cases, seed, decision_makers=("a/x", "b/y", "human/p1", "human/p2"), random_alignment=True
+    )
+
+
+@pytest.mark.parametrize("shard", ["tasks", "rows"])
+def test_results_identical_to_serial(shard):
+    tensor = _random_tensor()
+    indices = bootstrap_indices(tensor.n_cases, 60, seed=1)
+
+    tasks = [{"model": m, "value": v} for m in ["a/x", HUMAN_CONSENSUS] for v in VALUE_NAMES[:2]]
+    results = parallel_bootstrap(value_preference, tensor, indices, tasks, shard=shard, n_workers=2)
+    for task, result in zip(tasks, results):
+        np.testing.assert_array_equal(result.samples, value_preference(tensor, indices=indices, **task).samples)
+
+    tasks = [{"model_a": "a/x", "model_b": "b/y"}]
+    [result] = parallel_bootstrap(agreement_rate, tensor, indices, tasks, shard=shard, n_workers=2)
+    np.testing.assert_array_equal(result.samples, agreement_rate(tensor, indices=indices, **tasks[0]).samples)
+
+    [result] = parallel_bootstrap(value_weights, tensor, indices, [{"model": "b/y"}], shard=shard, n_workers=3)
+    expected = value_weights(tensor, "b/y", indices=indices)
+    assert result.coefficients == expected.coefficients
+    for v in VALUE_NAMES:
+        np.testing.assert_array_equal(result.bootstrap_samples[v], expected.bootstrap_samples[v])
+
+
+def test_lazy_indices_are_regenerated_in_workers():
+    tensor = _random_tensor()
+    indices = BootstrapIndices(tensor.n_cases, 50, seed=2, chunk_size=16)
+    tasks = [{"model": "a/x", "value": v} for v in VALUE_NAMES[:2]]
+    results = parallel_bootstrap(value_preference, tensor, indices, tasks, shard="rows", n_workers=3)
+    for task, result in zip(tasks, results):
+        expected = value_preference(tensor, indices=indices.to_array(), **task)
+        np.testing.assert_array_equal(result.samples, expected.samples)
+
+
+def test_invalid_shard():
+    with pytest.raises(ValueError, match="Invalid shard"):
+        parallel_bootstrap(value_preference, _random_tensor(), bootstrap_indices(25, 5, seed=0), [], shard="cases")
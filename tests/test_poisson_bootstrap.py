@@ -0,0 +1,88 @@
+"""Tests for the streaming Poisson bootstrap in src/analysis/poisson_bootstrap.py"""
+
+import numpy as np
+import pytest
+
+from src.analysis.metrics import agreement_rate, refusal_rate, value_preference
+from src.analysis.poisson_bootstrap import PoissonBootstrap, poisson_weights
+from src.analysis.tensor import DecisionTensor
+
+from random_tensors import random_tensor
+
+
+def _tensor(seed=0, n_cases=40):
+    return random_tensor(n_cases, seed)
+
+
+def _batch(tensor, rows):
+    return DecisionTensor(
+        counts=tensor.counts[rows],
+        present=tensor.present[rows],
+        alignment=tensor.alignment[rows],
+        case_ids=[tensor.case_ids[i] for i in rows],
+        decision_makers=tensor.decision_makers,
+    )
+
+
+def test_weights_depend_only_on_case_and_seed():
+    weights = poisson_weights("case-1", 500, seed=3)
+    assert weights.shape == (500,) and weights.min() >= 0
+    np.testing.assert_array_equal(weights, poisson_weights("case-1", 500, seed=3))
+    np.testing.assert_array_equal(weights[:100], poisson_weights("case-1", 100, seed=3))
+    assert not np.array_equal(weights, poisson_weights("case-2", 500, seed=3))
+    assert not np.array_equal(weights, poisson_weights("case-1", 500, seed=4))
+
+
+def test_streamed_and_merged_shards_match_one_pass():
+    tensor = _tensor()
+    kwargs = dict(model="a/x", value="autonomy")
+
+    whole = PoissonBootstrap(n_samples=300, seed=7)
+    whole.add_decisions(value_preference, tensor, **kwargs)
+    assert whole.estimate == pytest.approx(value_preference(tensor, **kwargs))
+
+    # Cases arriving one at a time, in another order, split over two shards
+    order = np.random.default_rng(1).permutation(tensor.n_cases)
+    shards = [PoissonBootstrap(n_samples=300, seed=7) for _ in range(2)]
+    for k, i in enumerate(order):
+        shards[k % 2].add_decisions(value_preference, _batch(tensor, [i]), **kwargs)
+    merged = shards[0].merge(shards[1])
+    assert merged.n_cases == whole.n_cases
+    np.testing.assert_allclose(merged.result().samples, whole.result().samples)
+
+    # Weighted means with Poisson(1) weights: centred on the estimate
+    assert np.all(np.isfinite(whole.result().samples))
+    assert whole.result().mean == pytest.approx(whole.estimate, abs=0.05)
+
+
+def test_manual_weighted_mean_and_other_metrics():
+    tensor = _tensor(n_cases=10)
+    stream = PoissonBootstrap(n_samples=50, seed=0)
+    stream.add_decisions(refusal_rate, tensor, model="b/y")
+
+    rates = refusal_rate(tensor, "b/y", return_all_cases=True)
+    weights = np.stack([poisson_weights(tensor.case_ids[i], 50, 0) for i in rates])
+    values = np.array(list(rates.values()))
+    with np.errstate(invalid="ignore"):
+        expected = values @ weights / weights.sum(axis=0)
+    np.testing.assert_allclose(stream.result().samples, expected)
+
+    agreement = PoissonBootstrap(n_samples=50, seed=0)
+    agreement.add_decisions(agreement_rate, tensor, model_a="a/x", model_b="b/y")
+    assert agreement.estimate == pytest.approx(agreement_rate(tensor, "a/x", "b/y"))
+
+
+def test_invalid_use_is_rejected():
+    stream = PoissonBootstrap(n_samples=10, seed=0)
+    with pytest.raises(ValueError, match="No cases"):
+        stream.result()
+    # A batch without data for the metric adds nothing
+    empty = _tensor(n_cases=1)
+    empty.counts[:] = 0
+    stream.add_decisions(refusal_rate, empty, model="a/x")
+    assert stream.n_cases == 0
+
+    with pytest.raises(ValueError, match="Cannot merge"):
+        stream.merge(PoissonBootstrap(n_samples=10, seed=1))
+    with pytest.raises(ValueError, match="seed is required"):
+        PoissonBootstrap(n_samples=10, seed=None)
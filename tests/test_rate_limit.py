@@ -0,0 +1,155 @@
+"""Tests for the per-provider rate limiter in src/llm_decisions/rate_limit.py"""
+
+import pytest
+from omegaconf import OmegaConf
+
+from src.llm_decisions.models import ParsedDecision
+from src.llm_decisions.rate_limit import (
+    ProviderLimits,
+    RateLimiter,
+    TokenBucket,
+    is_throttle_error,
+)
+from src.llm_decisions.runner import _parse_with_retry, call_target_llm
+from src.prompt_manager import PromptManager
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class RateLimitError(Exception):
+    """Mimics litellm's exception class, which is matched by name."""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_throttle_detection():
+    assert is_throttle_error(FakeAPIError(429))
+    assert is_throttle_error(FakeAPIError(503))
+    assert not is_throttle_error(FakeAPIError(400))
+    assert is_throttle_error(RateLimitError("slow down"))
+    assert not is_throttle_error(ValueError("bad output"))
+
+    try:
+        try:
+            raise FakeAPIError(429)
+        except FakeAPIError as e:
+            raise RuntimeError("wrapped by instructor") from e
+    except RuntimeError as wrapped:
+        assert is_throttle_error(wrapped)
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)  # one per second, burst of 60
+    bucket.consume(60)
+    assert bucket.time_until(1) == pytest.approx(1.0)
+    clock.now = 2.5
+    assert bucket.time_until(2) == 0.0
+    assert bucket.time_until(3) == pytest.approx(0.5)
+
+
+def test_providers_share_limiters_across_models():
+    limiter = RateLimiter.from_config(OmegaConf.create({
+        "rate_limits": {
+            "default": {"max_concurrency": 8},
+            "providers": {"openai": {"requests_per_minute": 500}},
+        }
+    }))
+    assert limiter.for_model("openai/gpt-4o") is limiter.for_model("openai/gpt-4o-mini")
+    assert limiter.for_model("openai/gpt-4o").limits == ProviderLimits(requests_per_minute=500, max_concurrency=8)
+    assert limiter.for_model("anthropic/claude").limits.requests_per_minute is None
+
+
+def test_throttling_halves_concurrency_and_retries():
+    delays = []
+    limiter = RateLimiter(
+        default=ProviderLimits(max_concurrency=8, cooldown=0.01),
+        sleep=delays.append,
+    )
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise FakeAPIError(429)
+        return "ok"
+
+    assert limiter.call("openai/gpt-4o", flaky, max_retries=3, backoff_base=2.0, verbose=False) == "ok"
+    provider = limiter.for_model("openai/gpt-4o")
+    # Each 429 halves the limit (8 -> 4 -> 2), then the success adds 1/limit
+    assert provider.concurrency_limit == pytest.approx(2.5)
+    assert provider.in_flight == 0
+    # Equal jitter keeps each delay between half and all of backoff_base ** attempt
+    assert 0.5 <= delays[0] <= 1.0 and 1.0 <= delays[1] <= 2.0
+
+
+def test_non_throttle_errors_do_not_back_off():
+    limiter = RateLimiter(sleep=lambda _: None)
+
+    def broken():
+        raise ValueError("unparseable")
+
+    with pytest.raises(ValueError):
+        limiter.call("openai/gpt-4o", broken, max_retries=2, verbose=False)
+    provider = limiter.for_model("openai/gpt-4o")
+    assert provider.concurrency_limit == provider.limits.max_concurrency
+    assert provider.cooldown_remaining() == 0.0
+
+
+class RecordingLimiter(RateLimiter):
+    """Records the model id each call is limited under."""
+
+    def __init__(self):
+        super().__init__()
+        self.model_names = []
+
+    def call(self, model_name, fn, **kwargs):
+        self.model_names.append(model_name)
+        return fn()
+
+
+class RoutedLLM:
+    """Like all_the_llms.LLM, whose model_name is the router-resolved id."""
+
+    model_name = "azure/gpt-4o-2024-08-06"
+
+    def completion(self, messages, **kwargs):
+        return {"choices": [{"message": {"content": "Choice 1"}}]}
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        return ParsedDecision(selected_choice="choice_1")
+
+
+def test_calls_are_limited_under_the_configured_model_id():
+    case = BenchmarkCandidate(
+        vignette="Test vignette",
+        choice_1=ChoiceWithValues(
+            choice="Choice one", autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice="Choice two", autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+    limiter = RecordingLimiter()
+    call_target_llm(
+        RoutedLLM(), case, 1.0, "workflows/physician_recommendation",
+        rate_limiter=limiter, model_id="openai/gpt-4o",
+    )
+    _parse_with_retry(
+        case, "Choice 1", RoutedLLM(), PromptManager(), 1, 0.0, limiter, parser_model="openai/gpt-4o-mini",
+    )
+    call_target_llm(RoutedLLM(), case, 1.0, "workflows/physician_recommendation", rate_limiter=limiter)
+    assert limiter.model_names == ["openai/gpt-4o", "openai/gpt-4o-mini", "azure/gpt-4o-2024-08-06"]
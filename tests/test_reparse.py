@@ -0,0 +1,70 @@
+"""Tests for the offline re-parse pipeline in src/llm_decisions/reparse.py"""
+
+import json
+
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, ParsedDecision, RunResult
+from src.llm_decisions.reparse import reparse_directory
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+
+class AlwaysChoice2Parser:
+    model_name = "openai/new-parser"
+
+    def __init__(self):
+        self.calls = 0
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        self.calls += 1
+        return ParsedDecision(selected_choice="choice_2")
+
+
+def _seed(tmp_path, n_cases=3):
+    case = BenchmarkCandidate(
+        vignette="Test vignette",
+        choice_1=ChoiceWithValues(
+            choice="Choice one", autonomy="promotes", beneficence="violates",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+        choice_2=ChoiceWithValues(
+            choice="Choice two", autonomy="violates", beneficence="promotes",
+            nonmaleficence="neutral", justice="neutral",
+        ),
+    )
+    for i in range(n_cases):
+        record = DecisionRecord(case_id=f"case-{i}", case=case)
+        record.models["a/x"] = ModelDecisionData(temperature=1.0, runs=[
+            RunResult(full_response={"choices": [{"message": {"content": "Hmm, hard to say."}}]},
+                      parsed_choice=choice)
+            for choice in ["choice_1", "choice_2"]
+        ])
+        (tmp_path / f"case-{i}.json").write_text(record.model_dump_json())
+
+
+def _choices(tmp_path, case_id="case-0"):
+    record = DecisionRecord(**json.loads((tmp_path / f"{case_id}.json").read_text()))
+    return record.models["a/x"].runs
+
+
+def test_shadow_column_keeps_parsed_choice(tmp_path):
+    _seed(tmp_path)
+    parser = AlwaysChoice2Parser()
+    report = reparse_directory(tmp_path, parser, column="v2", workers=4, backoff_base=0.0, verbose=False)
+
+    assert parser.calls == 6
+    assert (report.records, report.runs, len(report.flips)) == (3, 6, 3)
+    assert report.transitions == {("choice_1", "choice_2"): 3}
+    runs = _choices(tmp_path)
+    assert [r.parsed_choice for r in runs] == ["choice_1", "choice_2"]
+    assert [r.alternate_parses["v2"] for r in runs] == ["choice_2", "choice_2"]
+
+
+def test_replace_and_dry_run(tmp_path):
+    _seed(tmp_path, n_cases=1)
+    before = (tmp_path / "case-0.json").read_text()
+    reparse_directory(tmp_path, AlwaysChoice2Parser(), dry_run=True, backoff_base=0.0, verbose=False)
+    assert (tmp_path / "case-0.json").read_text() == before
+
+    reparse_directory(tmp_path, AlwaysChoice2Parser(), backoff_base=0.0, verbose=False)
+    runs = _choices(tmp_path)
+    assert [(r.parsed_choice, r.parse_method) for r in runs] == [("choice_2", "llm")] * 2
+    assert not list(tmp_path.glob("*.tmp"))
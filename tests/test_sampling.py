@@ -0,0 +1,53 @@
+"""Tests for adaptive sampling in src/llm_decisions/sampling.py"""
+
+import pytest
+from omegaconf import OmegaConf
+
+from src.llm_decisions.models import RunResult
+from src.llm_decisions.sampling import StoppingRule, runs_to_request
+
+
+def _runs(*choices):
+    return [RunResult(full_response={}, parsed_choice=c) for c in choices]
+
+
+@pytest.mark.parametrize("rule", ["interval", "sprt"])
+def test_unanimous_pairs_stop_early_and_split_pairs_run_to_budget(rule):
+    stopping = StoppingRule(min_runs=3, max_runs=10, rule=rule)
+    assert stopping.runs_to_request(_runs()) == 3
+    assert stopping.runs_to_request(_runs("choice_1")) == 2
+
+    unanimous = _runs(*["choice_1"] * 7)
+    assert stopping.stop_reason(unanimous) == rule
+    assert stopping.runs_to_request(unanimous) == 0
+    assert not stopping.should_stop(unanimous[:5])
+
+    split = _runs(*["choice_1", "choice_2"] * 4)
+    assert stopping.runs_to_request(split) == 1
+    assert stopping.stop_reason(split + _runs("choice_1", "choice_2")) == "max_runs"
+
+
+def test_refusals_use_budget_without_narrowing_the_interval():
+    stopping = StoppingRule(min_runs=1, max_runs=4)
+    assert stopping.runs_to_request(_runs("choice_1", "REFUSAL", "REFUSAL")) == 1
+    assert stopping.should_stop(_runs("choice_1", *["REFUSAL"] * 3))
+
+
+@pytest.mark.parametrize("rule", ["interval", "sprt"])
+def test_refusal_only_pairs_stop_after_min_runs(rule):
+    stopping = StoppingRule(min_runs=3, max_runs=10, rule=rule)
+    assert stopping.runs_to_request(_runs("REFUSAL", "REFUSAL")) == 1
+    assert stopping.stop_reason(_runs(*["REFUSAL"] * 3)) == "refused"
+    assert stopping.runs_to_request(_runs(*["REFUSAL"] * 3)) == 0
+
+
+def test_from_config_and_fixed_budget():
+    cfg = OmegaConf.create({"execution": {"runs_per_model": 5, "adaptive_sampling": {"enabled": False}}})
+    assert StoppingRule.from_config(cfg) is None
+    assert runs_to_request(_runs("choice_1"), 5) == 4
+
+    cfg.execution.adaptive_sampling = {"enabled": True, "rule": "sprt", "min_runs": 2, "max_runs": 6}
+    stopping = StoppingRule.from_config(cfg)
+    assert (stopping.rule, stopping.min_runs, stopping.max_runs) == ("sprt", 2, 6)
+    with pytest.raises(ValueError):
+        StoppingRule(min_runs=5, max_runs=3)
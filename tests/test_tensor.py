@@ -0,0 +1,157 @@
+"""Tests for the columnar decision tensor in src/analysis/tensor.py.
+
+Every metric must give the same result on a list of records and on the
+DecisionTensor compiled from it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.bootstrap import bootstrap_indices
+from src.analysis.metrics import (
+    agreement_rate,
+    aggregate_entropy_per_case,
+    entropy_correlation_matrix,
+    entropy_per_case,
+    human_consensus,
+    refusal_rate,
+    value_preference,
+)
+from src.analysis.pluralism import build_kappa_input_table
+from src.analysis.tensor import HUMAN_CONSENSUS, DecisionTensor, as_tensor
+from src.analysis.tradeoffs import _build_regression_data
+from src.analysis.value_profiles import consensus_profile_from_subset
+from src.llm_decisions.models import DecisionRecord, ModelDecisionData, RunResult
+from src.response_models.case import BenchmarkCandidate, ChoiceWithValues
+
+VALUES = ["autonomy", "beneficence", "nonmaleficence", "justice"]
+CHOICES = ["choice_1", "choice_2", "REFUSAL"]
+
+
+def _make_records(n_cases: int = 12, seed: int = 0) -> list[DecisionRecord]:
+    """Random records with two models (one missing on some cases) and three humans."""
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n_cases):
+        # Choice 1 promotes one value and violates another; choice 2 the reverse
+        up, down = rng.choice(VALUES, size=2, replace=False)
+        tags_1 = {v: "promotes" if v == up else "violates" if v == down else "neutral" for v in VALUES}
+        tags_2 = {v: "violates" if v == up else "promotes" if v == down else "neutral" for v in VALUES}
+        case = BenchmarkCandidate(
+            vignette=f"Vignette {i}",
+            choice_1=ChoiceWithValues(choice="One", **tags_1),
+            choice_2=ChoiceWithValues(choice="Two", **tags_2),
+        )
+        record = DecisionRecord(case_id=f"case-{i}", case=case)
+        for model, n_runs in [("a/x", 5), ("b/y", 4), ("human/p1", 1), ("human/p2", 1), ("human/p3", 1)]:
+            if model == "b/y" and i % 4 == 0:
+                continue
+            runs = [
+                RunResult(full_response={}, parsed_choice=c)
+                for c in rng.choice(CHOICES, size=n_runs, p=[0.5, 0.4, 0.1])
+            ]
+            record.models[model] = ModelDecisionData(temperature=1.0, runs=runs)
+        records.append(record)
+    return records
+
+
+@pytest.fixture
+def records():
+    return _make_records()
+
+
+@pytest.fixture
+def tensor(records):
+    return DecisionTensor.from_records(records)
+
+
+def test_compiled_counts(records, tensor):
+    assert tensor.counts.shape == (12, 5, 3)
+    assert tensor.decision_makers == ["a/x", "b/y", "human/p1", "human/p2", "human/p3"]
+    j = tensor.decision_maker_index["a/x"]
+    summary = records[3].models["a/x"].summary
+    assert list(tensor.counts[3, j]) == [summary.choice_1_count, summary.choice_2_count, summary.refusal_count]
+    assert not tensor.present_for("b/y")[0] and tensor.present_for("b/y")[1]
+    assert tensor.counts_for("unknown/model").sum() == 0
+
+
+def test_shape_is_validated(tensor):
+    with pytest.raises(ValueError, match="counts has shape"):
+        DecisionTensor(
+            counts=tensor.counts[:, :2],
+            present=tensor.present,
+            alignment=tensor.alignment,
+            case_ids=tensor.case_ids,
+            decision_makers=tensor.decision_makers,
+        )
+
+
+@pytest.mark.parametrize("model", ["a/x", "b/y", HUMAN_CONSENSUS])
+def test_metrics_match_record_input(records, tensor, model):
+    idx = bootstrap_indices(len(records), 20, seed=3)
+
+    for value in ["autonomy", "justice"]:
+        assert value_preference(tensor, model, value) == pytest.approx(value_preference(records, model, value))
+        np.testing.assert_allclose(
+            value_preference(tensor, model, value, indices=idx).samples,
+            value_preference(records, model, value, indices=idx).samples,
+        )
+    assert agreement_rate(tensor, model, "a/x") == agreement_rate(records, model, "a/x")
+    assert entropy_per_case(tensor, model) == entropy_per_case(records, model)
+
+    for a, b in zip(_build_regression_data(tensor, model, idx[0]), _build_regression_data(records, model, idx[0])):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_collection_metrics_match_record_input(records, tensor):
+    assert refusal_rate(tensor, "b/y") == refusal_rate(records, "b/y")
+    assert human_consensus(tensor) == human_consensus(records)
+    assert aggregate_entropy_per_case(tensor, ["a/x", "b/y"]) == pytest.approx(
+        aggregate_entropy_per_case(records, ["a/x", "b/y"])
+    )
+    pd.testing.assert_frame_equal(entropy_correlation_matrix(tensor), entropy_correlation_matrix(records))
+
+    table, case_ids = build_kappa_input_table(tensor, ["a/x", "b/y"])
+    expected_table, expected_ids = build_kappa_input_table(records, ["a/x", "b/y"])
+    np.testing.assert_array_equal(table, expected_table)
+    assert case_ids == expected_ids
+
+    humans = ["human/p1", "human/p3"]
+    assert consensus_profile_from_subset(tensor, humans) == consensus_profile_from_subset(records, humans)
+
+
+def test_majority_ties_match_run_summary():
+    """A tied model counts as choice_1 for agreement, as RunSummary.majority_choice does."""
+    records = _make_records(n_cases=1)
+    records[0].models["a/x"].runs = [
+        RunResult(full_response={}, parsed_choice=c) for c in ["choice_1", "choice_2"]
+    ]
+    records[0].models["b/y"] = ModelDecisionData(
+        temperature=1.0, runs=[RunResult(full_response={}, parsed_choice="choice_1")]
+    )
+    assert agreement_rate(DecisionTensor.from_records(records), "a/x", "b/y") == 1.0
+
+
+def test_consensus_is_materialized_once(tensor):
+    assert as_tensor(tensor) is tensor
+    assert tensor.counts_for(HUMAN_CONSENSUS) is tensor.counts_for(HUMAN_CONSENSUS)
+    np.testing.assert_array_equal(
+        tensor.consensus_counts, tensor.pooled_counts(["human/p1", "human/p2", "human/p3"])
+    )
+    np.testing.assert_array_equal(
+        tensor.pooled_counts(["human/p2", "human/p2", "unknown"]),
+        tensor.counts[:, tensor.decision_maker_index["human/p2"]],
+    )
+
+
+def test_record_lists_are_compiled_on_every_call(records):
+    """Records edited in place are reflected by the next metric call."""
+    before = refusal_rate(records, "a/x")
+    for record in records:
+        record.models["a/x"].runs.extend(
+            RunResult(full_response={}, parsed_choice="REFUSAL") for _ in range(10)
+        )
+    assert refusal_rate(records, "a/x") > before
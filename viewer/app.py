@@ -10,6 +10,7 @@ from flask import Flask, render_template, jsonify, request
 from typing import Dict, List, Optional
 import re
 from dotenv import load_dotenv
+from src.case_index import get_case_index
 from src.embeddings import CaseEmbeddingStore
 
 # Load environment variables
@@ -25,6 +26,7 @@ case_embedding_store = CaseEmbeddingStore()
 
 # Paths (relative to project root)
 CASES_DIR = PROJECT_ROOT / "data/cases"
+case_index = get_case_index(CASES_DIR)
 
 # UUID v4 pattern for case ID validation
 UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$', re.IGNORECASE)
@@ -130,7 +132,7 @@ def get_all_cases() -> List[Dict]:
     """Get all cases with their metadata."""
     cases = []
     
-    for case_file in sorted(CASES_DIR.glob("case_*.json")):
+    for case_file in case_index.paths():
         case_id = get_case_id_from_filename(case_file.name)
         case = load_case(case_file)
         
@@ -229,7 +231,7 @@ def feedback_view():
     all_comments = []
     
     # Collect all human evaluation comments from case files
-    for case_file in sorted(CASES_DIR.glob("case_*.json")):
+    for case_file in case_index.paths():
         case_id = get_case_id_from_filename(case_file.name)
         case = load_case(case_file)
         
@@ -290,11 +292,11 @@ def view_case(case_id: str):
         return "Invalid case ID format", 400
     
     # Find the case file
-    case_files = list(CASES_DIR.glob(f"case_{case_id}_*.json"))
-    if not case_files:
+    case_file = case_index.path_for(case_id)
+    if case_file is None:
         return "Case not found", 404
     
-    case = load_case(case_files[0])
+    case = load_case(case_file)
     if case is None:
         return "Error loading case", 500
     
@@ -315,10 +317,10 @@ def view_case(case_id: str):
         
         for item in similar_raw:
             similar_case_id = item['case_id']
-            similar_case_files = list(CASES_DIR.glob(f"case_{similar_case_id}_*.json"))
+            similar_case_file = case_index.path_for(similar_case_id)
             
-            if similar_case_files:
-                similar_case = load_case(similar_case_files[0])
+            if similar_case_file:
+                similar_case = load_case(similar_case_file)
                 if similar_case:
                     similar_final = get_final_version(similar_case)
                     similar_seed = similar_case.get("seed", {})
@@ -362,11 +364,11 @@ def api_case(case_id: str):
     if not is_valid_case_id(case_id):
         return jsonify({"error": "Invalid case ID format"}), 400
     
-    case_files = list(CASES_DIR.glob(f"case_{case_id}_*.json"))
-    if not case_files:
+    case_file = case_index.path_for(case_id)
+    if case_file is None:
         return jsonify({"error": "Case not found"}), 404
     
-    case = load_case(case_files[0])
+    case = load_case(case_file)
     if case is None:
         return jsonify({"error": "Error loading case"}), 500
     
@@ -425,10 +427,10 @@ def api_similar_cases(case_id: str):
         results = []
         for item in similar:
             similar_case_id = item['case_id']
-            similar_case_files = list(CASES_DIR.glob(f"case_{similar_case_id}_*.json"))
+            similar_case_file = case_index.path_for(similar_case_id)
             
-            if similar_case_files:
-                similar_case = load_case(similar_case_files[0])
+            if similar_case_file:
+                similar_case = load_case(similar_case_file)
                 if similar_case:
                     final = get_final_version(similar_case)
                     seed_info = similar_case.get("seed", {})
@@ -519,7 +521,7 @@ def api_case_embeddings_2d():
         # Build results with case metadata
         points = []
         for i, case_id in enumerate(keys):
-            case_files = list(CASES_DIR.glob(f"case_{case_id}_*.json"))
+            case_file = case_index.path_for(case_id)
             
             metadata = {
                 "case_id": case_id,
@@ -535,8 +537,8 @@ def api_case_embeddings_2d():
                 "num_evaluations": 0
             }
             
-            if case_files:
-                case = load_case(case_files[0])
+            if case_file:
+                case = load_case(case_file)
                 if case:
                     final = get_final_version(case)
                     seed_info = case.get("seed", {})